@@ -2,23 +2,22 @@
 """Daily processing runner using shared Python processor architecture."""
 
 import asyncio
+import importlib.util
 import logging
+import os
 import subprocess
 import sys
+import tempfile
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
+from types import ModuleType
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from aiogram import Bot
-from aiogram.client.default import DefaultBotProperties
-from aiogram.enums import ParseMode
-
-from d_brain.bot.formatters import format_process_report
 from d_brain.config import get_settings
-from d_brain.services.git import VaultGit
-from d_brain.services.processor import LLMProcessor
+from d_brain.eventloop import run
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +25,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+GRAPH_STDERR_TAIL_BYTES = 4096
+
+
+@lru_cache(maxsize=1)
+def _load_graph_analyzer(script_path: Path) -> ModuleType:
+    """Import graph-builder analyze.py as a module (cached per process)."""
+    spec = importlib.util.spec_from_file_location("graph_builder_analyze", script_path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load graph builder from {script_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _rebuild_vault_graph_subprocess(vault_path: Path, script_path: Path) -> None:
+    """Rebuild graph through uv when the script cannot be imported in-process."""
+    # The analyzer's stdout report is never read; stderr goes to a temp file so
+    # only its tail is loaded, however much the analyzer writes.
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            result = subprocess.run(
+                ["uv", "run", str(script_path)],
+                cwd=vault_path,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr_file,
+                check=False,
+            )
+        except FileNotFoundError:
+            logger.warning("uv binary not found, skipping graph rebuild")
+            return
+
+        if result.returncode == 0:
+            logger.info("Vault graph rebuilt")
+            return
+
+        size = stderr_file.seek(0, os.SEEK_END)
+        stderr_file.seek(max(0, size - GRAPH_STDERR_TAIL_BYTES))
+        stderr_tail = stderr_file.read().decode("utf-8", errors="replace").strip()
+        logger.warning("Graph rebuild failed: %s", stderr_tail or "unknown error")
+
 
 def rebuild_vault_graph(vault_path: Path) -> None:
     """Rebuild optional vault graph index if graph-builder skill exists."""
@@ -35,24 +74,31 @@ def rebuild_vault_graph(vault_path: Path) -> None:
         return
 
     try:
-        result = subprocess.run(
-            ["uv", "run", str(script_path)],
-            cwd=vault_path,
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode != 0:
-            logger.warning("Graph rebuild failed: %s", result.stderr.strip() or "unknown error")
-        else:
-            logger.info("Vault graph rebuilt")
-    except FileNotFoundError:
-        logger.warning("uv binary not found, skipping graph rebuild")
+        analyzer = _load_graph_analyzer(script_path.resolve())
+    except ImportError as exc:
+        logger.info("Graph builder import failed (%s), falling back to uv", exc)
+        _rebuild_vault_graph_subprocess(vault_path, script_path)
+        return
+
+    try:
+        stats = analyzer.analyze_vault(vault_path)
+    except Exception as exc:
+        logger.warning("Graph rebuild failed: %s", exc)
+        return
+    logger.info("Vault graph rebuilt: %s notes", stats.get("total_notes", 0))
 
 
 async def main() -> None:
     """Run daily processing and send report to Telegram."""
     settings = get_settings()
+
+    # Heavy imports (aiogram, LLM stack) are deferred so settings errors fail fast
+    from d_brain.bot.delivery import send_report, warm_up
+    from d_brain.bot.formatters import format_process_report
+    from d_brain.bot.main import create_bot
+    from d_brain.services.git import VaultGit
+    from d_brain.services.processor import LLMProcessor
+
     processor = LLMProcessor(
         settings.vault_path,
         settings.todoist_api_key,
@@ -72,26 +118,33 @@ async def main() -> None:
 
     has_error = result_envelope.error is not None
 
-    if not has_error:
-        rebuild_vault_graph(settings.vault_path)
-        if not git.commit_and_push(f"chore: process daily {today.isoformat()}"):
-            logger.warning("Git commit/push failed for daily processing")
-
-    report = format_process_report(result)
-    user_id = settings.allowed_user_ids[0] if settings.allowed_user_ids else None
-    if not user_id:
-        logger.error("No allowed user IDs configured, cannot send report")
-        sys.exit(1 if has_error else 0)
-
-    bot = Bot(
-        token=settings.telegram_bot_token,
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
+    bot = create_bot(settings)
     try:
-        try:
-            await bot.send_message(chat_id=user_id, text=report)
-        except Exception:
-            await bot.send_message(chat_id=user_id, text=report, parse_mode=None)
+        # Formatting is CPU-bound and opening the Telegram connection is a network
+        # round-trip, so both overlap with each other and with the vault work.
+        format_job = asyncio.to_thread(format_process_report, result, max_length=None)
+        if has_error:
+            report, _ = await asyncio.gather(format_job, warm_up(bot))
+        else:
+            # analyze.py only reports to stdout and never writes into the vault,
+            # so the graph rebuild and the git commit can run side by side.
+            report, _, _, pushed = await asyncio.gather(
+                format_job,
+                warm_up(bot),
+                asyncio.to_thread(rebuild_vault_graph, settings.vault_path),
+                asyncio.to_thread(
+                    git.commit_and_push, f"chore: process daily {today.isoformat()}"
+                ),
+            )
+            if not pushed:
+                logger.warning("Git commit/push failed for daily processing")
+
+        user_id = settings.allowed_user_ids[0] if settings.allowed_user_ids else None
+        if not user_id:
+            logger.error("No allowed user IDs configured, cannot send report")
+            sys.exit(1 if has_error else 0)
+
+        await send_report(bot, user_id, report)
     finally:
         await bot.session.close()
 
@@ -103,8 +156,17 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    exit_code = 0
     try:
-        asyncio.run(main())
+        run(main())
+    except SystemExit as exc:
+        exit_code = int(exc.code or 0)
     except Exception:
         logging.exception("Daily processing script failed")
-        sys.exit(1)
+        exit_code = 1
+
+    # Skip interpreter teardown of aiogram/pydantic/LLM objects: the bot session
+    # is already closed in main(). os._exit bypasses atexit, so flush logs first.
+    logging.shutdown()
+    sys.stdout.flush()
+    os._exit(exit_code)
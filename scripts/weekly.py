@@ -3,20 +3,15 @@
 
 import asyncio
 import logging
+import os
 import sys
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from aiogram import Bot
-from aiogram.client.default import DefaultBotProperties
-from aiogram.enums import ParseMode
-
-from d_brain.bot.formatters import format_process_report
 from d_brain.config import get_settings
-from d_brain.services.git import VaultGit
-from d_brain.services.processor import LLMProcessor
+from d_brain.eventloop import run
 
 logging.basicConfig(
     level=logging.INFO,
@@ -28,6 +23,14 @@ logger = logging.getLogger(__name__)
 async def main() -> None:
     """Generate weekly digest and send to Telegram."""
     settings = get_settings()
+
+    # Heavy imports (aiogram, LLM stack) are deferred so settings errors fail fast
+    from d_brain.bot.delivery import send_report, warm_up
+    from d_brain.bot.formatters import format_process_report
+    from d_brain.bot.main import create_bot
+    from d_brain.services.git import VaultGit
+    from d_brain.services.processor import LLMProcessor
+
     processor = LLMProcessor(
         settings.vault_path,
         settings.todoist_api_key,
@@ -44,33 +47,34 @@ async def main() -> None:
 
     result_envelope = processor.generate_weekly_result()
     legacy_result = result_envelope.to_legacy_dict()
-    report = format_process_report(legacy_result)
 
     has_error = result_envelope.error is not None
 
-    if has_error:
-        logger.error("Weekly digest failed: %s", result_envelope.error)
-    else:
-        logger.info("Weekly digest generated successfully")
-        if not git.commit_and_push("chore: weekly digest"):
-            logger.warning("Git commit/push failed for weekly digest")
-
-    # Send to Telegram
-    bot = Bot(
-        token=settings.telegram_bot_token,
-        default=DefaultBotProperties(parse_mode=ParseMode.HTML),
-    )
+    bot = create_bot(settings)
     try:
+        # Format off-loop while the Telegram connection opens and git pushes
+        format_job = asyncio.to_thread(
+            format_process_report, legacy_result, max_length=None
+        )
+        if has_error:
+            logger.error("Weekly digest failed: %s", result_envelope.error)
+            report, _ = await asyncio.gather(format_job, warm_up(bot))
+        else:
+            logger.info("Weekly digest generated successfully")
+            report, _, pushed = await asyncio.gather(
+                format_job,
+                warm_up(bot),
+                asyncio.to_thread(git.commit_and_push, "chore: weekly digest"),
+            )
+            if not pushed:
+                logger.warning("Git commit/push failed for weekly digest")
+
         user_id = settings.allowed_user_ids[0] if settings.allowed_user_ids else None
         if not user_id:
             logger.error("No allowed user IDs configured")
             sys.exit(1 if has_error else 0)
 
-        try:
-            await bot.send_message(chat_id=user_id, text=report)
-        except Exception:
-            # Fallback: send without HTML parsing
-            await bot.send_message(chat_id=user_id, text=report, parse_mode=None)
+        await send_report(bot, user_id, report)
 
         if has_error:
             logger.error("Weekly digest completed with errors")
@@ -82,8 +86,17 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
+    exit_code = 0
     try:
-        asyncio.run(main())
+        run(main())
+    except SystemExit as exc:
+        exit_code = int(exc.code or 0)
     except Exception:
         logging.exception("Weekly digest script failed")
-        sys.exit(1)
+        exit_code = 1
+
+    # Skip interpreter teardown of aiogram/pydantic/LLM objects: the bot session
+    # is already closed in main(). os._exit bypasses atexit, so flush logs first.
+    logging.shutdown()
+    sys.stdout.flush()
+    os._exit(exit_code)
@@ -1,8 +1,9 @@
 """Entry point for running d-brain as a module."""
 
-import asyncio
 import logging
 
+from d_brain.eventloop import run
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -25,4 +26,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
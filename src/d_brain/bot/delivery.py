@@ -0,0 +1,62 @@
+"""Delivery of formatted reports to Telegram, split to fit the message limit."""
+
+import logging
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import LinkPreviewOptions, Message
+
+from d_brain.bot.formatters import split_html
+
+logger = logging.getLogger(__name__)
+
+# Reports are full of vault links; previews would make Telegram fetch each one
+_NO_PREVIEW = LinkPreviewOptions(is_disabled=True)
+
+
+async def warm_up(bot: Bot) -> None:
+    """Open the bot's connection ahead of the first send (best effort)."""
+    try:
+        await bot.get_me()
+    except Exception as exc:
+        logger.debug("Telegram warm-up failed: %s", exc)
+
+
+async def safe_send(bot: Bot, chat_id: int, text: str) -> None:
+    """Send an HTML message, resending as plain text if Telegram rejects its markup."""
+    try:
+        await bot.send_message(
+            chat_id=chat_id, text=text, link_preview_options=_NO_PREVIEW
+        )
+    except TelegramBadRequest:
+        await bot.send_message(
+            chat_id=chat_id,
+            text=text,
+            parse_mode=None,
+            link_preview_options=_NO_PREVIEW,
+        )
+
+
+async def send_report(bot: Bot, chat_id: int, text: str) -> None:
+    """Send a report of any length as consecutive messages."""
+    for part in split_html(text):
+        await safe_send(bot, chat_id, part)
+
+
+async def deliver_report(status_msg: Message, text: str) -> None:
+    """Replace *status_msg* with the report, continuing in follow-up messages."""
+    first, *rest = split_html(text)
+    try:
+        await status_msg.edit_text(first, link_preview_options=_NO_PREVIEW)
+    except TelegramBadRequest:
+        await status_msg.edit_text(
+            first, parse_mode=None, link_preview_options=_NO_PREVIEW
+        )
+
+    for part in rest:
+        try:
+            await status_msg.answer(part, link_preview_options=_NO_PREVIEW)
+        except TelegramBadRequest:
+            await status_msg.answer(
+                part, parse_mode=None, link_preview_options=_NO_PREVIEW
+            )
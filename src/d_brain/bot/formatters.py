@@ -8,6 +8,11 @@ from typing import Any
 # Allowed HTML tags in Telegram
 ALLOWED_TAGS = {"b", "i", "code", "pre", "a", "s", "u"}
 
+# Compiled once; matched in place with pattern.match(text, pos)
+_TAG_RE = re.compile(r"<(/?)([a-zA-Z]+)(?:\s[^>]*)?>")
+_ENTITY_RE = re.compile(r"&(amp|lt|gt|quot|#\d+|#x[0-9a-fA-F]+);")
+_SPECIAL_CHAR_RE = re.compile(r"[<>&]")
+
 
 def sanitize_telegram_html(text: str) -> str:
     """Sanitize HTML for Telegram, keeping only allowed tags.
@@ -23,47 +28,37 @@ def sanitize_telegram_html(text: str) -> str:
     if not text:
         return ""
 
-    # First, escape any raw < > that are not part of tags
-    # This regex matches < or > not followed/preceded by tag patterns
+    # Copy plain runs in one slice and only inspect <, > and & characters
     result = []
     i = 0
-    while i < len(text):
-        if text[i] == "<":
-            # Check if this looks like a valid tag
-            tag_match = re.match(r"</?([a-zA-Z]+)(?:\s[^>]*)?>", text[i:])
-            if tag_match:
-                tag_name = tag_match.group(1).lower()
-                if tag_name in ALLOWED_TAGS:
-                    # Keep the allowed tag
-                    result.append(tag_match.group(0))
-                    i += len(tag_match.group(0))
-                    continue
-                else:
-                    # Escape disallowed tag
-                    result.append("&lt;")
-                    i += 1
-                    continue
-            else:
-                # Not a valid tag pattern, escape
-                result.append("&lt;")
-                i += 1
+    while True:
+        special = _SPECIAL_CHAR_RE.search(text, i)
+        if special is None:
+            result.append(text[i:])
+            break
+        j = special.start()
+        result.append(text[i:j])
+        char = text[j]
+        if char == "<":
+            # Keep allowed tags, escape anything else that starts with <
+            tag_match = _TAG_RE.match(text, j)
+            if tag_match and tag_match.group(2).lower() in ALLOWED_TAGS:
+                result.append(tag_match.group(0))
+                i = tag_match.end()
                 continue
-        elif text[i] == ">":
+            result.append("&lt;")
+        elif char == ">":
             # Standalone > should be escaped
             result.append("&gt;")
-            i += 1
-        elif text[i] == "&":
+        else:
             # Check if already escaped
-            entity_match = re.match(r"&(amp|lt|gt|quot|#\d+|#x[0-9a-fA-F]+);", text[i:])
+            entity_match = _ENTITY_RE.match(text, j)
             if entity_match:
                 result.append(entity_match.group(0))
-                i += len(entity_match.group(0))
-            else:
-                result.append("&amp;")
-                i += 1
-        else:
-            result.append(text[i])
-            i += 1
+                i = entity_match.end()
+                continue
+            result.append("&amp;")
+        i = j + 1
 
     return "".join(result)
 
@@ -78,9 +73,8 @@ def validate_telegram_html(text: str) -> bool:
         True if valid, False otherwise
     """
     tag_stack = []
-    tag_pattern = re.compile(r"<(/?)([a-zA-Z]+)(?:\s[^>]*)?>")
 
-    for match in tag_pattern.finditer(text):
+    for match in _TAG_RE.finditer(text):
         is_closing = match.group(1) == "/"
         tag_name = match.group(2).lower()
 
@@ -124,10 +118,9 @@ def truncate_html(text: str, max_length: int = 4096) -> str:
     truncated = text[:cut_point]
 
     # Close any open tags
-    tag_pattern = re.compile(r"<(/?)([a-zA-Z]+)(?:\s[^>]*)?>")
     open_tags = []
 
-    for match in tag_pattern.finditer(truncated):
+    for match in _TAG_RE.finditer(truncated):
         is_closing = match.group(1) == "/"
         tag_name = match.group(2).lower()
 
@@ -145,7 +138,79 @@ def truncate_html(text: str, max_length: int = 4096) -> str:
     return truncated + "..." + closing_tags
 
 
-def format_process_report(report: dict[str, Any]) -> str:
+def _unclosed_tags(text: str) -> list[tuple[str, str]]:
+    """Return (name, opening tag) pairs still open at the end of *text*."""
+    open_tags: list[tuple[str, str]] = []
+
+    for match in _TAG_RE.finditer(text):
+        is_closing = match.group(1) == "/"
+        tag_name = match.group(2).lower()
+
+        if tag_name not in ALLOWED_TAGS:
+            continue
+
+        if is_closing and open_tags and open_tags[-1][0] == tag_name:
+            open_tags.pop()
+        elif not is_closing:
+            open_tags.append((tag_name, match.group(0)))
+
+    return open_tags
+
+
+def split_html(text: str, limit: int = 4000) -> list[str]:
+    """Split HTML into Telegram-sized messages on paragraph boundaries.
+
+    Tags left open at a cut are closed at the end of that part and reopened
+    (with their attributes) at the start of the next one.
+
+    Args:
+        text: Sanitized HTML text
+        limit: Maximum length of each part (Telegram limit is 4096)
+
+    Returns:
+        Non-empty list of HTML parts with balanced tags
+    """
+    parts: list[str] = []
+    prefix = ""
+    rest = text
+
+    while len(prefix) + len(rest) > limit:
+        # Leave room for the closing tags appended to this part
+        budget = max(1, limit - len(prefix) - 50)
+        cut = rest.rfind("\n\n", 0, budget)
+        if cut <= 0:
+            cut = rest.rfind("\n", 0, budget)
+        if cut <= 0:
+            cut = budget
+            # Don't cut in the middle of a tag or an entity
+            last_open = rest.rfind("<", 0, cut)
+            if last_open > rest.rfind(">", 0, cut):
+                cut = last_open
+            last_amp = rest.rfind("&", 0, cut)
+            if last_amp > rest.rfind(";", 0, cut):
+                cut = last_amp
+            if cut <= 0:
+                # A tag longer than the budget starts the text: keep it whole
+                # rather than splitting it, even if this part runs long
+                if rest.startswith("<"):
+                    cut = rest.find(">") + 1 or len(rest)
+                else:
+                    cut = budget
+
+        chunk = prefix + rest[:cut]
+        open_tags = _unclosed_tags(chunk)
+        closing = "".join(f"</{name}>" for name, _ in reversed(open_tags))
+        parts.append(chunk.rstrip() + closing)
+
+        prefix = "".join(opening for _, opening in open_tags)
+        rest = rest[cut:].lstrip("\n")
+
+    if rest or not parts:
+        parts.append(prefix + rest)
+    return parts
+
+
+def format_process_report(report: dict[str, Any], max_length: int | None = 4096) -> str:
     """Format processing report for Telegram HTML.
 
     The report from Claude is expected to be in HTML format.
@@ -153,6 +218,8 @@ def format_process_report(report: dict[str, Any]) -> str:
 
     Args:
         report: Processing report from ClaudeProcessor
+        max_length: Truncate to this length; None keeps the full report
+            for callers that send it with split_html
 
     Returns:
         Formatted HTML message for Telegram
@@ -172,8 +239,11 @@ def format_process_report(report: dict[str, Any]) -> str:
             # Fall back to plain text if tags are broken
             return html.escape(raw_report)
 
+        if max_length is None:
+            return sanitized
+
         # Truncate if too long
-        return truncate_html(sanitized, max_length=4096)
+        return truncate_html(sanitized, max_length=max_length)
 
     return "✅ <b>Обработка завершена</b>"
 
@@ -1,9 +1,14 @@
 """Button handlers for reply keyboard."""
 
+from collections.abc import Awaitable, Callable
+
 from aiogram import F, Router
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 
+from d_brain.bot.handlers.commands import cmd_help, cmd_status
+from d_brain.bot.handlers.process import cmd_process
+from d_brain.bot.handlers.weekly import cmd_weekly
 from d_brain.bot.states import DoCommandState
 from d_brain.config import get_settings
 from d_brain.services.model_provider import (
@@ -13,32 +18,27 @@ from d_brain.services.model_provider import (
 
 router = Router(name="buttons")
 
+ButtonHandler = Callable[[Message, FSMContext], Awaitable[None]]
 
-@router.message(F.text == "📊 Статус")
-async def btn_status(message: Message) -> None:
-    """Handle Status button."""
-    from d_brain.bot.handlers.commands import cmd_status
 
+async def btn_status(message: Message, state: FSMContext) -> None:
+    """Handle Status button."""
+    del state
     await cmd_status(message)
 
 
-@router.message(F.text == "⚙️ Обработать")
-async def btn_process(message: Message) -> None:
+async def btn_process(message: Message, state: FSMContext) -> None:
     """Handle Process button."""
-    from d_brain.bot.handlers.process import cmd_process
-
+    del state
     await cmd_process(message)
 
 
-@router.message(F.text == "📅 Неделя")
-async def btn_weekly(message: Message) -> None:
+async def btn_weekly(message: Message, state: FSMContext) -> None:
     """Handle Weekly button."""
-    from d_brain.bot.handlers.weekly import cmd_weekly
-
+    del state
     await cmd_weekly(message)
 
 
-@router.message(F.text == "✨ Запрос")
 async def btn_do(message: Message, state: FSMContext) -> None:
     """Handle Do button - set state and wait for input."""
     await state.set_state(DoCommandState.waiting_for_input)
@@ -48,17 +48,15 @@ async def btn_do(message: Message, state: FSMContext) -> None:
     )
 
 
-@router.message(F.text == "❓ Помощь")
-async def btn_help(message: Message) -> None:
+async def btn_help(message: Message, state: FSMContext) -> None:
     """Handle Help button."""
-    from d_brain.bot.handlers.commands import cmd_help
-
+    del state
     await cmd_help(message)
 
 
-@router.message(F.text == "🤖 GPT")
-async def btn_select_gpt(message: Message) -> None:
+async def btn_select_gpt(message: Message, state: FSMContext) -> None:
     """Switch active model to GPT CLI."""
+    del state
     settings = get_settings()
     set_active_provider("openai-cli")
     await message.answer(
@@ -67,12 +65,30 @@ async def btn_select_gpt(message: Message) -> None:
     )
 
 
-@router.message(F.text == "🧠 Claude")
-async def btn_select_claude(message: Message) -> None:
+async def btn_select_claude(message: Message, state: FSMContext) -> None:
     """Switch active model to Claude CLI."""
+    del state
     settings = get_settings()
     set_active_provider("claude-cli")
     await message.answer(
         f"✅ Активная модель: <b>{get_provider_label('claude-cli')}</b>\n"
         f"Базовая из .env: <i>{get_provider_label(settings.llm_provider)}</i>"
     )
+
+
+# Button text -> handler; one registered filter does an O(1) lookup per update
+BUTTON_HANDLERS: dict[str, ButtonHandler] = {
+    "📊 Статус": btn_status,
+    "⚙️ Обработать": btn_process,
+    "📅 Неделя": btn_weekly,
+    "✨ Запрос": btn_do,
+    "❓ Помощь": btn_help,
+    "🤖 GPT": btn_select_gpt,
+    "🧠 Claude": btn_select_claude,
+}
+
+
+@router.message(F.text.in_(BUTTON_HANDLERS))
+async def handle_button(message: Message, state: FSMContext) -> None:
+    """Dispatch reply keyboard button press to its handler."""
+    await BUTTON_HANDLERS[message.text or ""](message, state)
@@ -8,11 +8,13 @@ from aiogram.filters import Command, CommandObject
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 
+from d_brain.bot.delivery import deliver_report
 from d_brain.bot.formatters import format_process_report
+from d_brain.bot.progress import wait_with_progress
 from d_brain.bot.states import DoCommandState
 from d_brain.config import get_settings
 from d_brain.services.model_provider import get_active_provider
-from d_brain.services.processor import ClaudeProcessor
+from d_brain.services.processor import get_processor
 from d_brain.services.transcription import DeepgramTranscriber
 
 router = Router(name="do")
@@ -96,48 +98,30 @@ async def process_request(message: Message, prompt: str, user_id: int = 0) -> No
     try:
         settings = get_settings()
         active_provider = get_active_provider(settings.llm_provider)
-        processor = ClaudeProcessor(
+        processor = get_processor(
             settings.vault_path,
-            settings.todoist_api_key,
+            active_provider,
+            todoist_api_key=settings.todoist_api_key,
             singularity_api_key=settings.singularity_api_key,
             task_backend=settings.task_backend,
-            provider_name=active_provider,
             openai_api_key=settings.openai_api_key,
             openai_model=settings.openai_model,
             openai_base_url=settings.openai_base_url,
+            response_cache_ttl=settings.llm_response_cache_ttl,
+            openai_stream=settings.openai_stream,
         )
 
-        async def run_with_progress() -> dict:
-            task = asyncio.create_task(
-                asyncio.to_thread(processor.execute_prompt, prompt, user_id)
-            )
-
-            elapsed = 0
-            while not task.done() and elapsed < MAX_WAIT_SECONDS:
-                await asyncio.sleep(30)
-                elapsed += 30
-                if not task.done():
-                    try:
-                        await status_msg.edit_text(
-                            f"⏳ Выполняю... ({elapsed // 60}m {elapsed % 60}s)"
-                        )
-                    except Exception:
-                        pass
-
-            if not task.done():
-                task.cancel()
-                return {"error": "Processing timed out"}
-
-            return await task
-
-        report = await run_with_progress()
+        report = await wait_with_progress(
+            asyncio.to_thread(processor.execute_prompt, prompt, user_id),
+            status_msg,
+            "⏳ Выполняю...",
+            timeout=MAX_WAIT_SECONDS,
+        )
+        if report is None:
+            report = {"error": "Processing timed out"}
 
-        formatted = format_process_report(report)
-        try:
-            await status_msg.edit_text(formatted)
-        except Exception:
-            # Fallback: send without HTML parsing
-            await status_msg.edit_text(formatted, parse_mode=None)
+        formatted = format_process_report(report, max_length=None)
+        await deliver_report(status_msg, formatted)
     except Exception:
         logger.exception("Unhandled error in /do handler")
         try:
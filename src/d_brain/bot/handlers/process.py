@@ -3,16 +3,20 @@
 import asyncio
 import logging
 from datetime import date
+from functools import partial
 
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message
 
+from d_brain.bot.delivery import deliver_report
 from d_brain.bot.formatters import format_process_report
+from d_brain.bot.jobqueue import job_queue
+from d_brain.bot.progress import wait_with_progress
 from d_brain.config import get_settings
-from d_brain.services.git import VaultGit
+from d_brain.services.git import get_vault_git
 from d_brain.services.model_provider import get_active_provider
-from d_brain.services.processor import ClaudeProcessor
+from d_brain.services.processor import get_processor
 
 router = Router(name="process")
 logger = logging.getLogger(__name__)
@@ -22,67 +26,59 @@ MAX_WAIT_SECONDS = 1500  # slightly above provider timeout (1200s)
 
 @router.message(Command("process"))
 async def cmd_process(message: Message) -> None:
-    """Handle /process command - trigger Claude processing."""
+    """Handle /process command - queue Claude processing."""
     user_id = message.from_user.id if message.from_user else 0
     logger.info("Process command triggered by user %s", user_id)
 
-    status_msg = await message.answer("⏳ Processing... (may take up to 10 min)")
+    position = job_queue.pending + 1
+    if position > 1:
+        status_msg = await message.answer(f"⏳ Queued (position {position})")
+    else:
+        status_msg = await message.answer("⏳ Processing... (may take up to 10 min)")
+    job_queue.submit(partial(run_process, status_msg))
 
+
+async def run_process(status_msg: Message) -> None:
+    """Run daily processing job and report the result into *status_msg*."""
     try:
+        today = date.today()
         settings = get_settings()
         active_provider = get_active_provider(settings.llm_provider)
-        processor = ClaudeProcessor(
+        processor = get_processor(
             settings.vault_path,
-            settings.todoist_api_key,
+            active_provider,
+            todoist_api_key=settings.todoist_api_key,
             singularity_api_key=settings.singularity_api_key,
             task_backend=settings.task_backend,
-            provider_name=active_provider,
             openai_api_key=settings.openai_api_key,
             openai_model=settings.openai_model,
             openai_base_url=settings.openai_base_url,
+            response_cache_ttl=settings.llm_response_cache_ttl,
+            openai_stream=settings.openai_stream,
         )
-        git = VaultGit(settings.vault_path)
-
-        # Run subprocess in thread to avoid blocking event loop
-        async def process_with_progress() -> dict:
-            task = asyncio.create_task(
-                asyncio.to_thread(processor.process_daily, date.today())
-            )
-
-            elapsed = 0
-            while not task.done() and elapsed < MAX_WAIT_SECONDS:
-                await asyncio.sleep(30)
-                elapsed += 30
-                if not task.done():
-                    try:
-                        await status_msg.edit_text(
-                            f"⏳ Processing... ({elapsed // 60}m {elapsed % 60}s)"
-                        )
-                    except Exception:
-                        pass  # Ignore edit errors
-
-            if not task.done():
-                task.cancel()
-                return {"error": "Processing timed out"}
 
-            return await task
+        # First repository detection forks git; resolve it off-loop while the LLM runs
+        git_task = asyncio.create_task(
+            asyncio.to_thread(get_vault_git, settings.vault_path)
+        )
 
-        report = await process_with_progress()
+        processing = wait_with_progress(
+            processor.aprocess_daily(today),
+            status_msg,
+            "⏳ Processing...",
+            timeout=MAX_WAIT_SECONDS,
+        )
+        report, git = await asyncio.gather(processing, git_task)
+        if report is None:
+            report = {"error": "Processing timed out"}
 
-        # Commit and push changes
+        # Commit and push changes, batched with other vault updates
         if "error" not in report:
-            today = date.today().isoformat()
-            pushed = await asyncio.to_thread(git.commit_and_push, f"chore: process daily {today}")
-            if not pushed:
-                logger.warning("Git push failed for daily processing")
+            git.request_commit_and_push(f"chore: process daily {today.isoformat()}")
 
         # Format and send report
-        formatted = format_process_report(report)
-        try:
-            await status_msg.edit_text(formatted)
-        except Exception:
-            # Fallback: send without HTML parsing
-            await status_msg.edit_text(formatted, parse_mode=None)
+        formatted = format_process_report(report, max_length=None)
+        await deliver_report(status_msg, formatted)
     except Exception:
         logger.exception("Unhandled error in /process handler")
         try:
@@ -2,16 +2,20 @@
 
 import asyncio
 import logging
+from functools import partial
 
 from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message
 
+from d_brain.bot.delivery import deliver_report
 from d_brain.bot.formatters import format_process_report
+from d_brain.bot.jobqueue import job_queue
+from d_brain.bot.progress import wait_with_progress
 from d_brain.config import get_settings
-from d_brain.services.git import VaultGit
+from d_brain.services.git import get_vault_git
 from d_brain.services.model_provider import get_active_provider
-from d_brain.services.processor import ClaudeProcessor
+from d_brain.services.processor import get_processor
 
 router = Router(name="weekly")
 logger = logging.getLogger(__name__)
@@ -21,63 +25,56 @@ MAX_WAIT_SECONDS = 1500  # slightly above provider timeout (1200s)
 
 @router.message(Command("weekly"))
 async def cmd_weekly(message: Message) -> None:
-    """Handle /weekly command - generate weekly digest."""
+    """Handle /weekly command - queue weekly digest generation."""
     user_id = message.from_user.id if message.from_user else 0
     logger.info("Weekly digest triggered by user %s", user_id)
 
-    status_msg = await message.answer("⏳ Генерирую недельный дайджест...")
+    position = job_queue.pending + 1
+    if position > 1:
+        status_msg = await message.answer(f"⏳ В очереди (позиция {position})")
+    else:
+        status_msg = await message.answer("⏳ Генерирую недельный дайджест...")
+    job_queue.submit(partial(run_weekly, status_msg))
 
+
+async def run_weekly(status_msg: Message) -> None:
+    """Run weekly digest job and report the result into *status_msg*."""
     try:
         settings = get_settings()
         active_provider = get_active_provider(settings.llm_provider)
-        processor = ClaudeProcessor(
+        processor = get_processor(
             settings.vault_path,
-            settings.todoist_api_key,
+            active_provider,
+            todoist_api_key=settings.todoist_api_key,
             singularity_api_key=settings.singularity_api_key,
             task_backend=settings.task_backend,
-            provider_name=active_provider,
             openai_api_key=settings.openai_api_key,
             openai_model=settings.openai_model,
             openai_base_url=settings.openai_base_url,
+            response_cache_ttl=settings.llm_response_cache_ttl,
+            openai_stream=settings.openai_stream,
         )
-        git = VaultGit(settings.vault_path)
-
-        async def run_with_progress() -> dict:
-            task = asyncio.create_task(
-                asyncio.to_thread(processor.generate_weekly)
-            )
-
-            elapsed = 0
-            while not task.done() and elapsed < MAX_WAIT_SECONDS:
-                await asyncio.sleep(30)
-                elapsed += 30
-                if not task.done():
-                    try:
-                        await status_msg.edit_text(
-                            f"⏳ Генерирую дайджест... ({elapsed // 60}m {elapsed % 60}s)"
-                        )
-                    except Exception:
-                        pass
-
-            if not task.done():
-                task.cancel()
-                return {"error": "Weekly digest timed out"}
-
-            return await task
 
-        report = await run_with_progress()
+        # First repository detection forks git; resolve it off-loop while the LLM runs
+        git_task = asyncio.create_task(
+            asyncio.to_thread(get_vault_git, settings.vault_path)
+        )
+        digest = wait_with_progress(
+            processor.agenerate_weekly(),
+            status_msg,
+            "⏳ Генерирую дайджест...",
+            timeout=MAX_WAIT_SECONDS,
+        )
+        report, git = await asyncio.gather(digest, git_task)
+        if report is None:
+            report = {"error": "Weekly digest timed out"}
 
         # Commit any changes (weekly goal updates, etc)
         if "error" not in report:
-            pushed = await asyncio.to_thread(git.commit_and_push, "chore: weekly digest")
-            if not pushed:
-                logger.warning("Git push failed for weekly digest")
+            git.request_commit_and_push("chore: weekly digest")
 
-        formatted = format_process_report(report)
-        try:
-            await status_msg.edit_text(formatted)
-        except Exception:
-            await status_msg.edit_text(formatted, parse_mode=None)
+        formatted = format_process_report(report, max_length=None)
+        await deliver_report(status_msg, formatted)
     except Exception:
         logger.exception("Unhandled error in /weekly handler")
         try:
@@ -0,0 +1,65 @@
+"""Single-worker queue serializing long-running LLM jobs."""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+class JobQueue:
+    """Runs submitted jobs one at a time in submission order.
+
+    Prevents parallel LLM subprocesses (and concurrent vault writes) when
+    /process and /weekly are triggered several times in a row.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._worker: asyncio.Task[None] | None = None
+        self._busy = False
+
+    @property
+    def pending(self) -> int:
+        """Number of jobs waiting for or currently in execution."""
+        return self._queue.qsize() + int(self._busy)
+
+    def start(self) -> None:
+        """Start the worker task if it is not running."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="job-queue-worker")
+
+    async def stop(self) -> None:
+        """Cancel the worker task."""
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+    def submit(self, job: Job) -> int:
+        """Enqueue *job* and return its 1-based position in the queue."""
+        self.start()
+        position = self.pending + 1
+        self._queue.put_nowait(job)
+        return position
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            self._busy = True
+            try:
+                await job()
+            except Exception:
+                logger.exception("Queued job failed")
+            finally:
+                self._busy = False
+                self._queue.task_done()
+
+
+job_queue = JobQueue()
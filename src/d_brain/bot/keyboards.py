@@ -4,8 +4,7 @@ from aiogram.types import ReplyKeyboardMarkup
 from aiogram.utils.keyboard import ReplyKeyboardBuilder
 
 
-def get_main_keyboard() -> ReplyKeyboardMarkup:
-    """Main reply keyboard with common commands."""
+def _build_main_keyboard() -> ReplyKeyboardMarkup:
     builder = ReplyKeyboardBuilder()
     # First row: main commands
     builder.button(text="📊 Статус")
@@ -19,3 +18,12 @@ def get_main_keyboard() -> ReplyKeyboardMarkup:
     builder.button(text="🧠 Claude")
     builder.adjust(3, 2, 2)
     return builder.as_markup(resize_keyboard=True, is_persistent=True)
+
+
+# Markup is never mutated by aiogram, so one instance is shared by all replies
+_MAIN_KEYBOARD = _build_main_keyboard()
+
+
+def get_main_keyboard() -> ReplyKeyboardMarkup:
+    """Main reply keyboard with common commands."""
+    return _MAIN_KEYBOARD
@@ -1,24 +1,48 @@
 """Telegram bot initialization and polling."""
 
+import asyncio
 import logging
 from collections.abc import Awaitable, Callable
 from typing import Any
 
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 from aiogram.types import Update
 
+from d_brain.bot.jobqueue import job_queue
+from d_brain.bot.ratelimit import RateLimitMiddleware
 from d_brain.config import Settings
+from d_brain.services.git import get_vault_git
+from d_brain.services.model_provider import get_active_provider
+from d_brain.services.processor import warmup
 
 logger = logging.getLogger(__name__)
 
+SESSION_CONNECTION_LIMIT = 20
+SESSION_TIMEOUT_SECONDS = 60
 
-def create_bot(settings: Settings) -> Bot:
-    """Create and configure the Telegram bot."""
+
+def create_session() -> AiohttpSession:
+    """Create rate-limited HTTP session with a bounded, reusable connection pool."""
+    session = AiohttpSession(
+        limit=SESSION_CONNECTION_LIMIT, timeout=SESSION_TIMEOUT_SECONDS
+    )
+    session.middleware(RateLimitMiddleware())
+    return session
+
+
+def create_bot(settings: Settings, session: AiohttpSession | None = None) -> Bot:
+    """Create and configure the Telegram bot.
+
+    All API calls made through the returned bot (including fallback retries)
+    share one session, so the TLS connection is opened once and reused.
+    """
     return Bot(
         token=settings.telegram_bot_token,
+        session=session or create_session(),
         default=DefaultBotProperties(parse_mode=ParseMode.HTML),
     )
 
@@ -47,6 +71,38 @@ MiddlewareHandler = Callable[[Update, dict[str, Any]], Awaitable[Any]]
 MiddlewareType = Callable[[MiddlewareHandler, Update, dict[str, Any]], Awaitable[Any]]
 
 
+def create_warmup_hook(settings: Settings) -> Callable[[], Awaitable[None]]:
+    """Create a startup hook that builds the processor before the first command."""
+
+    async def warm_processor() -> None:
+        await asyncio.to_thread(
+            warmup,
+            settings.vault_path,
+            get_active_provider(settings.llm_provider),
+            todoist_api_key=settings.todoist_api_key,
+            singularity_api_key=settings.singularity_api_key,
+            task_backend=settings.task_backend,
+            openai_api_key=settings.openai_api_key,
+            openai_model=settings.openai_model,
+            openai_base_url=settings.openai_base_url,
+            response_cache_ttl=settings.llm_response_cache_ttl,
+            openai_stream=settings.openai_stream,
+        )
+
+    return warm_processor
+
+
+def create_git_flush_hook(settings: Settings) -> Callable[[], Awaitable[None]]:
+    """Create a shutdown hook that commits and pushes still-queued vault changes."""
+
+    async def flush_git() -> None:
+        git = get_vault_git(settings.vault_path)
+        if not await asyncio.to_thread(git.flush_pending):
+            logger.warning("Queued vault commit was not pushed before shutdown")
+
+    return flush_git
+
+
 def create_auth_middleware(settings: Settings) -> MiddlewareType:
     """Create middleware to check user authorization."""
 
@@ -97,6 +153,13 @@ async def run_bot(settings: Settings) -> None:
     # Always add auth middleware for security (it handles allow_all_users internally)
     dp.update.middleware(create_auth_middleware(settings))
 
+    # Single worker for long-running /process and /weekly jobs
+    dp.startup.register(job_queue.start)
+    dp.shutdown.register(job_queue.stop)
+    # After the job queue drains, so commits queued by its last job are included
+    dp.shutdown.register(create_git_flush_hook(settings))
+    dp.startup.register(create_warmup_hook(settings))
+
     logger.info("Starting bot polling...")
     try:
         await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
@@ -0,0 +1,51 @@
+"""Progress reporting for long-running handler jobs."""
+
+import asyncio
+from collections.abc import Awaitable
+
+from aiogram.types import Message
+
+HEARTBEAT_INTERVAL_SECONDS = 30
+
+
+async def _heartbeat(status_msg: Message, label: str, interval: int) -> None:
+    """Edit *status_msg* with elapsed time until cancelled."""
+    elapsed = 0
+    while True:
+        await asyncio.sleep(interval)
+        elapsed += interval
+        try:
+            await status_msg.edit_text(f"{label} ({elapsed // 60}m {elapsed % 60}s)")
+        except Exception:
+            pass  # Ignore edit errors
+
+
+async def wait_with_progress[T](
+    job: Awaitable[T],
+    status_msg: Message,
+    label: str,
+    *,
+    timeout: float,
+    interval: int = HEARTBEAT_INTERVAL_SECONDS,
+) -> T | None:
+    """Await *job* while a heartbeat keeps *status_msg* updated.
+
+    Returns as soon as the job finishes instead of on the next heartbeat tick.
+
+    Returns:
+        Job result, or None if it did not finish within *timeout* seconds
+    """
+    task = asyncio.ensure_future(job)
+    heartbeat = asyncio.create_task(_heartbeat(status_msg, label, interval))
+    try:
+        done, _ = await asyncio.wait({task}, timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    finally:
+        heartbeat.cancel()
+
+    if task not in done:
+        task.cancel()
+        return None
+    return task.result()
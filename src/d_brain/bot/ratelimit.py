@@ -0,0 +1,137 @@
+"""Outgoing Telegram API rate limiting and retries.
+
+Telegram allows roughly one message per second per chat and about thirty
+per second overall. Every request made through a bot session passes through
+a global throttle and, when the method targets a chat, a per-chat throttle.
+Flood-control and transient transport failures are retried; request errors
+such as HTML parse failures are raised immediately for the caller to handle.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING
+
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import (
+    TelegramEntityTooLarge,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+from aiogram.methods.base import TelegramType
+
+if TYPE_CHECKING:
+    from aiogram import Bot
+    from aiogram.methods import Response, TelegramMethod
+
+logger = logging.getLogger(__name__)
+
+PER_CHAT_RATE = 1
+GLOBAL_RATE = 30
+RATE_PERIOD_SECONDS = 1.0
+MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 1.0
+
+
+class _Throttle:
+    """Spaces acquisitions evenly so at most *rate* happen per *period*."""
+
+    def __init__(self, rate: int, period: float) -> None:
+        self._interval = period / rate
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            loop = asyncio.get_running_loop()
+            delay = self._next_slot - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self._next_slot = max(loop.time(), self._next_slot) + self._interval
+
+
+class ChatLimiter:
+    """Global throttle feeding per-chat throttles."""
+
+    def __init__(
+        self,
+        *,
+        per_chat_rate: int = PER_CHAT_RATE,
+        global_rate: int = GLOBAL_RATE,
+        period: float = RATE_PERIOD_SECONDS,
+    ) -> None:
+        self._per_chat_rate = per_chat_rate
+        self._period = period
+        self._global = _Throttle(global_rate, period)
+        self._chats: dict[int | str, _Throttle] = {}
+
+    @asynccontextmanager
+    async def __call__(self, chat_id: int | str | None = None) -> AsyncIterator[None]:
+        """Wait for a free slot for *chat_id* (global slot only if None)."""
+        if chat_id is not None:
+            throttle = self._chats.get(chat_id)
+            if throttle is None:
+                throttle = self._chats[chat_id] = _Throttle(
+                    self._per_chat_rate, self._period
+                )
+            await throttle.wait()
+        await self._global.wait()
+        yield
+
+
+chat_limiter = ChatLimiter()
+
+
+class RateLimitMiddleware(BaseRequestMiddleware):
+    """Session middleware throttling requests and retrying transient failures."""
+
+    def __init__(
+        self,
+        limiter: ChatLimiter = chat_limiter,
+        *,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff_seconds: float = RETRY_BACKOFF_SECONDS,
+    ) -> None:
+        self.limiter = limiter
+        self.max_attempts = max_attempts
+        self.backoff_seconds = backoff_seconds
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        chat_id = getattr(method, "chat_id", None)
+        attempt = 1
+        while True:
+            try:
+                async with self.limiter(chat_id):
+                    return await make_request(bot, method)
+            except TelegramEntityTooLarge:
+                raise
+            except TelegramRetryAfter as exc:
+                if attempt >= self.max_attempts:
+                    raise
+                delay = float(exc.retry_after)
+            except (TelegramNetworkError, TelegramServerError):
+                if attempt >= self.max_attempts:
+                    raise
+                delay = self.backoff_seconds * 2 ** (attempt - 1)
+
+            logger.warning(
+                "Telegram %s failed (attempt %d/%d), retrying in %.1fs",
+                type(method).__name__,
+                attempt,
+                self.max_attempts,
+                delay,
+            )
+            attempt += 1
+            await asyncio.sleep(delay)
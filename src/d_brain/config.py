@@ -15,6 +15,7 @@ class Settings(BaseSettings):
         env_file=".env",
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     telegram_bot_token: str = Field(description="Telegram Bot API token")
@@ -35,6 +36,15 @@ class Settings(BaseSettings):
         default="https://api.openai.com/v1",
         description="OpenAI-compatible API base URL",
     )
+    llm_response_cache_ttl: int = Field(
+        default=0,
+        ge=0,
+        description="Seconds to reuse identical tool-free openai-api answers (0 = off)",
+    )
+    openai_stream: bool = Field(
+        default=False,
+        description="Stream openai-api turns and start tool calls as they arrive",
+    )
     vault_path: Path = Field(
         default=Path("./vault"),
         description="Path to Obsidian vault directory",
@@ -87,5 +97,5 @@ class Settings(BaseSettings):
 
 @lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get cached application settings instance."""
+    """Get cached application settings instance (validated once, immutable)."""
     return Settings()
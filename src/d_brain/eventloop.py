@@ -0,0 +1,20 @@
+"""asyncio entrypoint helper with optional uvloop acceleration."""
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional dependency
+    uvloop = None  # type: ignore[assignment, unused-ignore]
+
+
+def _loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """uvloop's loop factory when installed, otherwise asyncio's default."""
+    return uvloop.new_event_loop if uvloop is not None else None
+
+
+def run[T](main: Coroutine[Any, Any, T]) -> T:
+    """Run *main* to completion, on uvloop if it is installed."""
+    return asyncio.run(main, loop_factory=_loop_factory())
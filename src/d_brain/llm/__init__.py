@@ -6,11 +6,13 @@ from d_brain.llm.base import (
     LLMProviderError,
     LLMResponseEnvelope,
 )
+from d_brain.llm.cache import CachingLLMProvider
 from d_brain.llm.claude_cli import ClaudeCLIProvider
+from d_brain.llm.cli import CLIProvider
 from d_brain.llm.codex_cli import CodexCLIProvider
 from d_brain.llm.openai_api import OpenAIProvider
 from d_brain.llm.runtime import DefaultToolRuntime
-from d_brain.llm.router import create_default_provider, create_provider
+from d_brain.llm.router import create_default_provider, create_provider, get_provider
 from d_brain.llm.use_cases import (
     DailyProcessingUseCase,
     ExecutePromptUseCase,
@@ -26,6 +28,8 @@ from d_brain.llm.tools import (
 )
 
 __all__ = [
+    "CachingLLMProvider",
+    "CLIProvider",
     "ClaudeCLIProvider",
     "CodexCLIProvider",
     "DailyProcessingUseCase",
@@ -45,4 +49,5 @@ __all__ = [
     "WeeklyDigestUseCase",
     "build_capability_registry",
     "create_default_provider",
+    "get_provider",
 ]
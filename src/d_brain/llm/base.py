@@ -1,8 +1,9 @@
 """Core LLM abstractions and shared data models."""
 
+import asyncio
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Self
 
 
 class LLMProviderError(Exception):
@@ -34,14 +35,16 @@ class LLMResponseEnvelope:
 
     def to_legacy_dict(self) -> dict[str, Any]:
         """Compatibility payload for existing handlers and formatters."""
-        payload: dict[str, Any] = {"processed_entries": self.processed_entries}
+        # Built as single literals: the payload has at most three keys
         if self.error is not None:
-            payload["error"] = self.error
-            return payload
-        payload["report"] = self.report
+            return {"processed_entries": self.processed_entries, "error": self.error}
         if self.tool_failures:
-            payload["tool_failures"] = self.tool_failures
-        return payload
+            return {
+                "processed_entries": self.processed_entries,
+                "report": self.report,
+                "tool_failures": self.tool_failures,
+            }
+        return {"processed_entries": self.processed_entries, "report": self.report}
 
 
 class LLMProvider(ABC):
@@ -55,3 +58,24 @@ class LLMProvider(ABC):
     @abstractmethod
     def execute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
         """Execute a prompt and return raw provider result."""
+
+    async def aexecute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
+        """Execute a prompt without blocking the event loop.
+
+        Providers with native async transports override this; the default
+        runs :meth:`execute` in a worker thread.
+        """
+        return await asyncio.to_thread(self.execute, prompt, timeout=timeout)
+
+    def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """Release pooled transport resources (no-op by default)."""
+
+    async def aclose(self) -> None:
+        """Release pooled sync and async resources (defaults to :meth:`close`)."""
+        self.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,97 @@
+"""In-process response cache for side-effect-free provider calls."""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+
+from d_brain.llm.base import LLMExecutionResult, LLMProvider
+
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_TTL_SECONDS = 3600.0
+
+
+class CachingLLMProvider(LLMProvider):
+    """Exact-match response cache in front of another provider.
+
+    Only successful results that used no tools are stored: a tool-using run
+    reads or changes the vault and Todoist, so replaying it would be wrong.
+    Cached results are returned with ``meta["cached"] = True``.
+    """
+
+    def __init__(
+        self,
+        inner: LLMProvider,
+        *,
+        namespace: str = "",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self.inner = inner
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries = OrderedDict[str, tuple[float, LLMExecutionResult]]()
+        # execute() is reached from worker threads (asyncio.to_thread)
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    def execute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
+        key = self._key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        result = self.inner.execute(prompt, timeout=timeout)
+        self._put(key, result)
+        return result
+
+    async def aexecute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
+        key = self._key(prompt)
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        result = await self.inner.aexecute(prompt, timeout=timeout)
+        self._put(key, result)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        self.inner.close()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    def _key(self, prompt: str) -> str:
+        return hashlib.sha256(f"{self.namespace}\0{prompt}".encode()).hexdigest()
+
+    def _get(self, key: str) -> LLMExecutionResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, result = entry
+            if time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return replace(result, meta={**result.meta, "cached": True})
+
+    def _put(self, key: str, result: LLMExecutionResult) -> None:
+        if (
+            result.returncode != 0
+            or result.meta.get("tool_calls", 0)
+            or self.max_entries <= 0
+        ):
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
@@ -1,15 +1,16 @@
 """Claude CLI adapter for LLMProvider interface."""
 
-import os
-import subprocess
 from pathlib import Path
 
-from d_brain.llm.base import LLMExecutionResult, LLMProvider, LLMProviderError
+from d_brain.llm.base import LLMProviderError
+from d_brain.llm.cli import CLIProvider
 
 
-class ClaudeCLIProvider(LLMProvider):
+class ClaudeCLIProvider(CLIProvider):
     """Provider that executes prompts via claude CLI."""
 
+    not_installed_message = "Claude CLI not installed"
+
     def __init__(
         self,
         *,
@@ -18,53 +19,28 @@ class ClaudeCLIProvider(LLMProvider):
         todoist_api_key: str = "",
         singularity_api_key: str = "",
     ) -> None:
-        self.workdir = Path(workdir)
+        super().__init__(
+            workdir=workdir,
+            todoist_api_key=todoist_api_key,
+            singularity_api_key=singularity_api_key,
+        )
         self.mcp_config_path = Path(mcp_config_path)
-        self.todoist_api_key = todoist_api_key
-        self.singularity_api_key = singularity_api_key
 
     @property
     def name(self) -> str:
         return "claude-cli"
 
-    def execute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
-        """Run a prompt through Claude CLI and return raw output."""
+    def check_ready(self) -> None:
         if not self.mcp_config_path.exists():
             raise LLMProviderError(f"MCP config not found: {self.mcp_config_path}")
 
-        env = os.environ.copy()
-        if self.todoist_api_key:
-            env["TODOIST_API_KEY"] = self.todoist_api_key
-        if self.singularity_api_key:
-            env["SINGULARITY_API_KEY"] = self.singularity_api_key
-
-        try:
-            result = subprocess.run(
-                [
-                    "claude",
-                    "--print",
-                    "--dangerously-skip-permissions",
-                    "--mcp-config",
-                    str(self.mcp_config_path),
-                    "-p",
-                    prompt,
-                ],
-                cwd=self.workdir,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                check=False,
-                env=env,
-            )
-            return LLMExecutionResult(
-                stdout=result.stdout,
-                stderr=result.stderr,
-                returncode=result.returncode,
-                provider=self.name,
-            )
-        except subprocess.TimeoutExpired as exc:
-            raise LLMProviderError("Execution timed out") from exc
-        except FileNotFoundError as exc:
-            raise LLMProviderError("Claude CLI not installed") from exc
-        except Exception as exc:  # pragma: no cover - defensive wrapper
-            raise LLMProviderError(str(exc)) from exc
+    def build_command(self, prompt: str) -> list[str]:
+        return [
+            "claude",
+            "--print",
+            "--dangerously-skip-permissions",
+            "--mcp-config",
+            str(self.mcp_config_path),
+            "-p",
+            prompt,
+        ]
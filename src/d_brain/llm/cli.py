@@ -0,0 +1,238 @@
+"""Shared subprocess transport for CLI-based providers."""
+
+import asyncio
+import codecs
+import os
+import shutil
+import subprocess
+import threading
+from abc import abstractmethod
+from collections.abc import Callable
+from pathlib import Path
+
+from d_brain.llm.base import LLMExecutionResult, LLMProvider, LLMProviderError
+
+ChunkCallback = Callable[[str], None]
+
+STREAM_READ_BYTES = 64 * 1024
+
+# CLI processes run at the same time by one aexecute_batch call
+MAX_PARALLEL_CLI_PROCESSES = 4
+
+
+class CLIProvider(LLMProvider):
+    """Base for providers that run one CLI process per prompt."""
+
+    #: Error message raised when the CLI binary cannot be found.
+    not_installed_message = "CLI not installed"
+
+    def __init__(
+        self,
+        *,
+        workdir: Path,
+        todoist_api_key: str = "",
+        singularity_api_key: str = "",
+    ) -> None:
+        self.workdir = Path(workdir)
+        self.todoist_api_key = todoist_api_key
+        self.singularity_api_key = singularity_api_key
+        # Resolved once per provider: each prompt still spawns a process, but
+        # without a PATH search and environment copy per spawn
+        self._executable: str | None = None
+        self._env: dict[str, str] | None = None
+
+    @abstractmethod
+    def build_command(self, prompt: str) -> list[str]:
+        """Return argv for executing *prompt*."""
+
+    def check_ready(self) -> None:
+        """Raise LLMProviderError if the provider cannot run."""
+
+    def _argv(self, prompt: str) -> list[str]:
+        argv = self.build_command(prompt)
+        if self._executable is None:
+            self._executable = shutil.which(argv[0]) or argv[0]
+        return [self._executable, *argv[1:]]
+
+    def _spawn_env(self) -> dict[str, str]:
+        if self._env is None:
+            self._env = self.build_env()
+        return self._env
+
+    def build_env(self) -> dict[str, str]:
+        """Environment for the CLI process with integration credentials."""
+        overlay = {
+            "TODOIST_API_KEY": self.todoist_api_key,
+            "SINGULARITY_API_KEY": self.singularity_api_key,
+        }
+        return {**os.environ, **{key: value for key, value in overlay.items() if value}}
+
+    def execute(
+        self,
+        prompt: str,
+        *,
+        timeout: int,
+        on_chunk: ChunkCallback | None = None,
+    ) -> LLMExecutionResult:
+        """Run a prompt through the CLI, streaming stdout line by line.
+
+        *on_chunk*, if given, receives each stdout line as soon as the CLI
+        writes it; the full output is still returned in the result.
+        """
+        self.check_ready()
+        try:
+            process = subprocess.Popen(
+                self._argv(prompt),
+                cwd=self.workdir,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+                bufsize=1,
+                env=self._spawn_env(),
+            )
+        except FileNotFoundError as exc:
+            raise LLMProviderError(self.not_installed_message) from exc
+        except Exception as exc:  # pragma: no cover - defensive wrapper
+            raise LLMProviderError(str(exc)) from exc
+
+        timed_out = threading.Event()
+
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            process.kill()
+
+        stderr_chunks: list[str] = []
+        assert process.stdout is not None and process.stderr is not None
+        stderr_reader = threading.Thread(
+            target=stderr_chunks.extend, args=(process.stderr,), daemon=True
+        )
+        stderr_reader.start()
+        timer = threading.Timer(timeout, kill_on_timeout)
+        timer.start()
+
+        stdout_chunks: list[str] = []
+        try:
+            for line in process.stdout:
+                stdout_chunks.append(line)
+                if on_chunk is not None:
+                    on_chunk(line)
+            returncode = process.wait()
+        except Exception as exc:  # pragma: no cover - defensive wrapper
+            raise LLMProviderError(str(exc)) from exc
+        finally:
+            timer.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+            stderr_reader.join()
+            process.stdout.close()
+            process.stderr.close()
+
+        if timed_out.is_set():
+            raise LLMProviderError("Execution timed out")
+
+        return LLMExecutionResult(
+            stdout="".join(stdout_chunks),
+            stderr="".join(stderr_chunks),
+            returncode=returncode,
+            provider=self.name,
+        )
+
+    async def aexecute(
+        self,
+        prompt: str,
+        *,
+        timeout: int,
+        on_chunk: ChunkCallback | None = None,
+    ) -> LLMExecutionResult:
+        """Run a prompt through the CLI as a native asyncio subprocess.
+
+        stdout is read incrementally and handed to *on_chunk* as it arrives.
+        """
+        self.check_ready()
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *self._argv(prompt),
+                cwd=self.workdir,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._spawn_env(),
+            )
+        except FileNotFoundError as exc:
+            raise LLMProviderError(self.not_installed_message) from exc
+        except Exception as exc:  # pragma: no cover - defensive wrapper
+            raise LLMProviderError(str(exc)) from exc
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                _collect_output(process, on_chunk), timeout
+            )
+        except TimeoutError as exc:
+            process.kill()
+            await process.wait()
+            raise LLMProviderError("Execution timed out") from exc
+        except asyncio.CancelledError:
+            process.kill()
+            # Reap the child even though this task is being cancelled
+            await asyncio.shield(process.wait())
+            raise
+
+        return LLMExecutionResult(
+            stdout=stdout,
+            stderr=stderr,
+            returncode=process.returncode if process.returncode is not None else -1,
+            provider=self.name,
+        )
+
+    async def aexecute_batch(
+        self, prompts: list[str], *, timeout: int
+    ) -> list[LLMExecutionResult]:
+        """Run up to ``MAX_PARALLEL_CLI_PROCESSES`` prompts at once.
+
+        Results keep prompt order. If one prompt fails the error propagates
+        and the remaining processes are killed on cancellation.
+        """
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_CLI_PROCESSES)
+
+        async def run_one(prompt: str) -> LLMExecutionResult:
+            async with semaphore:
+                return await self.aexecute(prompt, timeout=timeout)
+
+        tasks = [asyncio.create_task(run_one(prompt)) for prompt in prompts]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+async def _collect_output(
+    process: asyncio.subprocess.Process,
+    on_chunk: ChunkCallback | None,
+) -> tuple[str, str]:
+    """Read a CLI process to completion, forwarding decoded stdout chunks."""
+    assert process.stdout is not None and process.stderr is not None
+    stderr_task = asyncio.create_task(process.stderr.read())
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    chunks: list[str] = []
+    try:
+        while raw := await process.stdout.read(STREAM_READ_BYTES):
+            text = decoder.decode(raw)
+            if text:
+                chunks.append(text)
+                if on_chunk is not None:
+                    on_chunk(text)
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            chunks.append(tail)
+            if on_chunk is not None:
+                on_chunk(tail)
+        stderr = await stderr_task
+        await process.wait()
+    finally:
+        stderr_task.cancel()
+    return "".join(chunks), stderr.decode("utf-8", errors="replace")
@@ -0,0 +1,31 @@
+"""Shared httpx connection-pool settings for API-backed providers and tools."""
+
+import importlib.util
+from functools import lru_cache
+from typing import Any
+
+MAX_KEEPALIVE_CONNECTIONS = 20
+MAX_CONNECTIONS = 100
+# Longer than httpx's 5s default so a tool loop's back-to-back requests reuse
+# one connection, short enough that idle sockets are not kept for minutes
+KEEPALIVE_EXPIRY_SECONDS = 15.0
+
+
+@lru_cache(maxsize=1)
+def http2_available() -> bool:
+    """Whether the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def pool_options() -> dict[str, Any]:
+    """Keyword arguments for ``httpx.Client``/``AsyncClient`` connection pooling."""
+    import httpx
+
+    return {
+        "http2": http2_available(),
+        "limits": httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            max_connections=MAX_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    }
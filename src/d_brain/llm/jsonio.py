@@ -0,0 +1,39 @@
+"""JSON encoding for the LLM and tool-runtime hot paths.
+
+Uses orjson when it is installed and falls back to the standard library.
+Both backends emit compact UTF-8 JSON, and orjson's decode error subclasses
+json.JSONDecodeError, so callers can catch the stdlib exception either way.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+_encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps(obj: Any) -> str:
+    """Serialize *obj* to a JSON string."""
+    if orjson is not None:
+        text: str = orjson.dumps(obj).decode("utf-8")
+        return text
+    return _encoder.encode(obj)
+
+
+def dumpb(obj: Any) -> bytes:
+    """Serialize *obj* to UTF-8 encoded JSON bytes."""
+    if orjson is not None:
+        data: bytes = orjson.dumps(obj)
+        return data
+    return _encoder.encode(obj).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from text or bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
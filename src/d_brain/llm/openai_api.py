@@ -1,10 +1,197 @@
 """OpenAI-compatible provider adapter."""
 
+import asyncio
 import json
+from collections.abc import Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Any
 
+import httpx
+
 from d_brain.llm.base import LLMExecutionResult, LLMProvider, LLMProviderError
-from d_brain.llm.tools import CapabilitySpec, ToolRuntime
+from d_brain.llm.http_pool import pool_options
+from d_brain.llm.jsonio import dumpb, dumps, loads
+from d_brain.llm.tools import CapabilitySpec, ToolExecutionResult, ToolRuntime
+
+# Model turns allowed before the tool loop is abandoned
+MAX_TOOL_ITERATIONS = 8
+
+# Upper bound on tool calls from one model turn executed at the same time
+MAX_PARALLEL_TOOL_CALLS = 8
+
+
+def _transport_error(exc: Exception) -> LLMProviderError:
+    if isinstance(exc, httpx.TimeoutException):
+        return LLMProviderError("OpenAI request timed out")
+    return LLMProviderError(f"OpenAI transport error: {exc}")
+
+
+def _parse_response(response: httpx.Response) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return (body, first choice message) or raise LLMProviderError."""
+    if response.status_code >= 400:
+        body = response.text[:500]
+        raise LLMProviderError(f"OpenAI API error {response.status_code}: {body}")
+
+    try:
+        data = loads(response.content)
+    except json.JSONDecodeError as exc:
+        raise LLMProviderError("OpenAI response is not valid JSON") from exc
+
+    try:
+        message = data["choices"][0]["message"]
+    except (KeyError, IndexError, TypeError) as exc:
+        raise LLMProviderError("OpenAI response missing message payload") from exc
+    return data, message
+
+
+# Shared stand-in for a tool call without a "function" object
+_NO_FUNCTION: Mapping[str, Any] = MappingProxyType({})
+
+
+def _sse_chunk(line: str) -> dict[str, Any] | None:
+    """JSON payload of one event-stream line (None for other lines and ``[DONE]``)."""
+    if not line.startswith("data:"):
+        return None
+    payload = line[5:].strip()
+    if payload == "[DONE]":
+        return None
+    try:
+        chunk = loads(payload)
+    except json.JSONDecodeError as exc:
+        raise LLMProviderError("OpenAI stream chunk is not valid JSON") from exc
+    return chunk if isinstance(chunk, dict) else None
+
+
+class _StreamedMessage:
+    """Assistant message reassembled from streamed chat-completion chunks."""
+
+    __slots__ = ("id", "usage", "content", "tool_calls", "finished")
+
+    def __init__(self) -> None:
+        self.id = ""
+        self.usage: dict[str, Any] = {}
+        self.content: list[str] = []
+        self.tool_calls: list[dict[str, Any]] = []
+        self.finished = False
+
+    def feed(self, chunk: dict[str, Any]) -> int:
+        """Merge one chunk and return how many leading tool calls are complete.
+
+        Tool calls stream in index order, so a call is complete once a later
+        index appears or the choice reports a finish reason.
+        """
+        self.id = chunk.get("id") or self.id
+        self.usage = chunk.get("usage") or self.usage
+        for choice in (chunk.get("choices") or ())[:1]:
+            delta = choice.get("delta") or _NO_FUNCTION
+            if delta.get("content"):
+                self.content.append(delta["content"])
+            for fragment in delta.get("tool_calls") or ():
+                self._merge_tool_call(fragment)
+            if choice.get("finish_reason"):
+                self.finished = True
+        if self.finished:
+            return len(self.tool_calls)
+        return max(len(self.tool_calls) - 1, 0)
+
+    def _merge_tool_call(self, fragment: dict[str, Any]) -> None:
+        index = fragment.get("index", len(self.tool_calls))
+        while len(self.tool_calls) <= index:
+            self.tool_calls.append(
+                {
+                    "id": "",
+                    "type": "function",
+                    "function": {"name": "", "arguments": ""},
+                }
+            )
+        tool_call = self.tool_calls[index]
+        if fragment.get("id"):
+            tool_call["id"] = fragment["id"]
+        function = fragment.get("function") or _NO_FUNCTION
+        tool_call["function"]["name"] += function.get("name") or ""
+        tool_call["function"]["arguments"] += function.get("arguments") or ""
+
+    def result(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Return (body, message) shaped like a non-streamed response."""
+        message: dict[str, Any] = {
+            "role": "assistant",
+            "content": "".join(self.content),
+        }
+        if self.tool_calls:
+            message["tool_calls"] = self.tool_calls
+        return {"id": self.id, "usage": self.usage}, message
+
+
+def _assistant_tool_message(message: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "role": "assistant",
+        "content": message.get("content"),
+        "tool_calls": message["tool_calls"],
+    }
+
+
+class _ToolTurn:
+    """Outputs of one model turn's tool calls, kept in call order."""
+
+    __slots__ = ("tool_calls", "names", "outputs", "failures", "pending")
+
+    def __init__(self, tool_calls: list[dict[str, Any]]) -> None:
+        self.tool_calls = tool_calls
+        # Function names, resolved once while the calls are validated
+        self.names: list[str] = []
+        self.outputs: list[dict[str, Any]] = []
+        self.failures: list[dict[str, Any] | None] = []
+        # (slot, capability, arguments) for calls the runtime still has to execute
+        self.pending: list[tuple[int, str, dict[str, Any]]] = []
+
+    def reject(self, capability: str, error: dict[str, Any]) -> None:
+        self.outputs.append({"ok": False, "error": error})
+        self.failures.append({"capability": capability, "error": error})
+
+    def defer(self, capability: str, call_args: dict[str, Any]) -> None:
+        self.pending.append((len(self.outputs), capability, call_args))
+        self.outputs.append({})
+        self.failures.append(None)
+
+    def complete(
+        self,
+        results: list[ToolExecutionResult],
+        tool_failures: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Fill in runtime results and return the turn's tool messages."""
+        for (slot, capability, _), tool_result in zip(
+            self.pending, results, strict=True
+        ):
+            error = (
+                None
+                if tool_result.error is None
+                else {
+                    "code": tool_result.error.code,
+                    "message": tool_result.error.message,
+                    "retryable": tool_result.error.retryable,
+                    "details": tool_result.error.details or {},
+                }
+            )
+            if not tool_result.ok and error is not None:
+                self.failures[slot] = {"capability": capability, "error": error}
+            data = tool_result.data if tool_result.data is not None else {}
+            self.outputs[slot] = {"ok": tool_result.ok, "data": data, "error": error}
+
+        tool_failures.extend(
+            failure for failure in self.failures if failure is not None
+        )
+        return [
+            {
+                "role": "tool",
+                "tool_call_id": tool_call.get("id", ""),
+                "name": name,
+                "content": dumps(output),
+            }
+            for tool_call, name, output in zip(
+                self.tool_calls, self.names, self.outputs, strict=True
+            )
+        ]
 
 
 class OpenAIProvider(LLMProvider):
@@ -17,193 +204,420 @@ class OpenAIProvider(LLMProvider):
         model: str,
         base_url: str = "https://api.openai.com/v1",
         tool_runtime: ToolRuntime | None = None,
-        capability_registry: dict[str, CapabilitySpec] | None = None,
+        capability_registry: Mapping[str, CapabilitySpec] | None = None,
+        stream: bool = False,
     ) -> None:
         self.api_key = api_key
         self.model = model
         self.base_url = base_url.rstrip("/")
         self.tool_runtime = tool_runtime
         self.capability_registry = capability_registry or {}
+        self.capability_to_tool_name = {
+            name: self._capability_to_tool_name(name)
+            for name in self.capability_registry
+        }
         self.tool_name_to_capability = {
-            self._capability_to_tool_name(name): name for name in self.capability_registry
+            tool_name: name for name, tool_name in self.capability_to_tool_name.items()
         }
+        # Read each turn as server-sent events and start tool calls before it ends
+        self.stream = stream
+        # Tool definitions are static, so they are built and JSON-encoded once
+        # instead of on every iteration of every tool loop
+        self._tools = self._build_openai_tools()
+        self._tools_json = dumpb(self._tools) if self._tools else b""
+        self._client: httpx.Client | None = None
+        self._async_client: httpx.AsyncClient | None = None
 
     @property
     def name(self) -> str:
         return "openai"
 
     def execute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
-        """Execute prompt via OpenAI-compatible API."""
+        """Execute prompt via OpenAI-compatible API.
+
+        With ``stream`` enabled each turn is read as server-sent events and
+        tool calls start on a thread pool as soon as their arguments are
+        complete, overlapping with the rest of the model's output.
+        """
+        self._check_ready()
+        messages: list[dict[str, Any]] = [{"role": "user", "content": prompt}]
+        encoded: list[bytes] = []
+        tool_failures: list[dict[str, Any]] = []
+
+        client = self._get_client()
+        for _ in range(MAX_TOOL_ITERATIONS):
+            started: dict[int, Future[ToolExecutionResult]] = {}
+            try:
+                if self.stream:
+                    data, message = self._stream_turn(
+                        client, messages, encoded, timeout, started
+                    )
+                else:
+                    response = client.post(
+                        "/chat/completions",
+                        content=self._encode_payload(messages, encoded),
+                        timeout=timeout,
+                    )
+                    data, message = _parse_response(response)
+            except httpx.HTTPError as exc:
+                raise _transport_error(exc) from exc
+
+            if message.get("tool_calls"):
+                messages.append(_assistant_tool_message(message))
+                messages.extend(
+                    self._run_tool_calls(message["tool_calls"], tool_failures, started)
+                )
+                continue
+            return self._final_result(data, message, messages, tool_failures)
+
+        raise LLMProviderError("OpenAI tool loop exceeded maximum iterations")
+
+    async def aexecute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
+        """Execute prompt via OpenAI-compatible API without blocking the loop.
+
+        Same tool loop as :meth:`execute`, on a pooled ``httpx.AsyncClient``,
+        with one turn's tool calls awaited concurrently. With ``stream``
+        enabled, tool calls start as tasks while the turn is still streaming.
+        """
+        self._check_ready()
+        messages: list[dict[str, Any]] = [{"role": "user", "content": prompt}]
+        encoded: list[bytes] = []
+        tool_failures: list[dict[str, Any]] = []
+
+        client = self._get_async_client()
+        for _ in range(MAX_TOOL_ITERATIONS):
+            started: dict[int, asyncio.Task[ToolExecutionResult]] = {}
+            try:
+                if self.stream:
+                    data, message = await self._astream_turn(
+                        client, messages, encoded, timeout, started
+                    )
+                else:
+                    response = await client.post(
+                        "/chat/completions",
+                        content=self._encode_payload(messages, encoded),
+                        timeout=timeout,
+                    )
+                    data, message = _parse_response(response)
+            except httpx.HTTPError as exc:
+                raise _transport_error(exc) from exc
+
+            if message.get("tool_calls"):
+                messages.append(_assistant_tool_message(message))
+                messages.extend(
+                    await self._arun_tool_calls(
+                        message["tool_calls"], tool_failures, started
+                    )
+                )
+                continue
+            return self._final_result(data, message, messages, tool_failures)
+
+        raise LLMProviderError("OpenAI tool loop exceeded maximum iterations")
+
+    def _check_ready(self) -> None:
+        """Validate configuration before the first request."""
         if not self.api_key:
             raise LLMProviderError("OpenAI API key is required")
         if not self.model:
             raise LLMProviderError("OpenAI model is required")
 
-        endpoint = f"{self.base_url}/chat/completions"
-        messages: list[dict[str, Any]] = [{"role": "user", "content": prompt}]
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
+    def _early_tool_call(
+        self, tool_call: dict[str, Any]
+    ) -> tuple[str, dict[str, Any]] | None:
+        """(capability, arguments) of a streamed call that can start now, else None.
 
+        Invalid calls are left for the end of the turn, which reports them.
+        """
+        pending = self._prepare_tool_calls([tool_call]).pending
+        if not pending or self.tool_runtime is None:
+            return None
+        _, capability, call_args = pending[0]
+        return capability, call_args
+
+    def _stream_turn(
+        self,
+        client: httpx.Client,
+        messages: list[dict[str, Any]],
+        encoded: list[bytes],
+        timeout: int,
+        started: dict[int, Future[ToolExecutionResult]],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Read one streamed turn, recording tool calls started early in *started*."""
+        streamed = _StreamedMessage()
+        pool: ThreadPoolExecutor | None = None
+        launched = 0
         try:
-            import httpx
-        except ModuleNotFoundError as exc:  # pragma: no cover - env-dependent
-            raise LLMProviderError("httpx is required for OpenAI provider execution") from exc
+            with client.stream(
+                "POST",
+                "/chat/completions",
+                content=self._encode_payload(messages, encoded, stream=True),
+                timeout=timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    response.read()
+                    _parse_response(response)
+                for line in response.iter_lines():
+                    chunk = _sse_chunk(line)
+                    if chunk is None:
+                        continue
+                    complete = streamed.feed(chunk)
+                    for index in range(launched, complete):
+                        call = self._early_tool_call(streamed.tool_calls[index])
+                        if call is None or self.tool_runtime is None:
+                            continue
+                        if pool is None:
+                            pool = ThreadPoolExecutor(
+                                max_workers=MAX_PARALLEL_TOOL_CALLS
+                            )
+                        started[index] = pool.submit(self.tool_runtime.execute, *call)
+                    launched = max(launched, complete)
+        finally:
+            # Already submitted calls keep running; their futures stay valid
+            if pool is not None:
+                pool.shutdown(wait=False)
+        return streamed.result()
 
-        tools = self._build_openai_tools()
-        tool_failures: list[dict[str, Any]] = []
+    async def _astream_turn(
+        self,
+        client: httpx.AsyncClient,
+        messages: list[dict[str, Any]],
+        encoded: list[bytes],
+        timeout: int,
+        started: dict[int, asyncio.Task[ToolExecutionResult]],
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Async variant of :meth:`_stream_turn` starting calls as tasks."""
+        streamed = _StreamedMessage()
+        launched = 0
+        try:
+            async with client.stream(
+                "POST",
+                "/chat/completions",
+                content=self._encode_payload(messages, encoded, stream=True),
+                timeout=timeout,
+            ) as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    _parse_response(response)
+                async for line in response.aiter_lines():
+                    chunk = _sse_chunk(line)
+                    if chunk is None:
+                        continue
+                    complete = streamed.feed(chunk)
+                    for index in range(launched, complete):
+                        call = self._early_tool_call(streamed.tool_calls[index])
+                        if call is not None and self.tool_runtime is not None:
+                            started[index] = asyncio.create_task(
+                                self.tool_runtime.aexecute(*call)
+                            )
+                    launched = max(launched, complete)
+        except BaseException:
+            for task in started.values():
+                task.cancel()
+            raise
+        return streamed.result()
 
-        with httpx.Client(timeout=timeout) as client:
-            for _ in range(8):
-                payload = {
-                    "model": self.model,
-                    "messages": messages,
-                    "temperature": 0,
-                }
-                if tools:
-                    payload["tools"] = tools
-                    payload["tool_choice"] = "auto"
+    def _encode_payload(
+        self,
+        messages: list[dict[str, Any]],
+        encoded: list[bytes],
+        *,
+        stream: bool = False,
+    ) -> bytes:
+        """Serialize a request body from pre-encoded parts.
 
-                try:
-                    response = client.post(endpoint, headers=headers, json=payload)
-                except httpx.TimeoutException as exc:
-                    raise LLMProviderError("OpenAI request timed out") from exc
-                except httpx.HTTPError as exc:
-                    raise LLMProviderError(f"OpenAI transport error: {exc}") from exc
+        The tool loop only appends to *messages*, so *encoded* keeps each
+        message's JSON from earlier turns and only new messages are encoded.
+        The prompt, usually the largest message, is encoded once per run.
+        """
+        encoded.extend(dumpb(message) for message in messages[len(encoded) :])
+        parts = [
+            b'{"model":',
+            dumpb(self.model),
+            b',"messages":[',
+            b",".join(encoded),
+            b'],"temperature":0',
+        ]
+        if stream:
+            parts.append(b',"stream":true,"stream_options":{"include_usage":true}')
+        if self._tools_json:
+            parts += (b',"tools":', self._tools_json, b',"tool_choice":"auto"')
+        parts.append(b"}")
+        return b"".join(parts)
 
-                if response.status_code >= 400:
-                    body = response.text[:500]
-                    raise LLMProviderError(f"OpenAI API error {response.status_code}: {body}")
-
-                try:
-                    data = response.json()
-                except json.JSONDecodeError as exc:
-                    raise LLMProviderError("OpenAI response is not valid JSON") from exc
-
-                try:
-                    message = data["choices"][0]["message"]
-                except (KeyError, IndexError, TypeError) as exc:
-                    raise LLMProviderError("OpenAI response missing message payload") from exc
-
-                if message.get("tool_calls"):
-                    messages.append(
-                        {
-                            "role": "assistant",
-                            "content": message.get("content"),
-                            "tool_calls": message["tool_calls"],
-                        }
-                    )
+    def _final_result(
+        self,
+        data: dict[str, Any],
+        message: dict[str, Any],
+        messages: list[dict[str, Any]],
+        tool_failures: list[dict[str, Any]],
+    ) -> LLMExecutionResult:
+        content = message.get("content", "")
+        if not isinstance(content, str):
+            content = str(content)
 
-                    for tool_call in message["tool_calls"]:
-                        call_name = tool_call.get("function", {}).get("name", "")
-                        call_args_raw = tool_call.get("function", {}).get("arguments", "{}")
-                        capability = self.tool_name_to_capability.get(call_name, "")
-
-                        try:
-                            call_args = json.loads(call_args_raw) if call_args_raw else {}
-                            if not isinstance(call_args, dict):
-                                raise ValueError("tool arguments must be JSON object")
-                        except Exception as exc:
-                            tool_output = {
-                                "ok": False,
-                                "error": {
-                                    "code": "invalid_tool_arguments",
-                                    "message": str(exc),
-                                    "retryable": False,
-                                },
-                            }
-                            tool_failures.append(
-                                {"capability": capability or call_name, "error": tool_output["error"]}
-                            )
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.get("id", ""),
-                                    "name": call_name,
-                                    "content": json.dumps(tool_output, ensure_ascii=False),
-                                }
-                            )
-                            continue
+        return LLMExecutionResult(
+            stdout=content,
+            stderr="",
+            returncode=0,
+            provider=self.name,
+            meta={
+                "model": self.model,
+                "id": data.get("id", ""),
+                "usage": data.get("usage", {}),
+                "tool_calls": sum(1 for item in messages if item["role"] == "tool"),
+                "tool_failures": tool_failures,
+            },
+        )
 
-                        if not capability or self.tool_runtime is None:
-                            tool_output = {
-                                "ok": False,
-                                "error": {
-                                    "code": "unsupported_capability",
-                                    "message": f"Unsupported tool: {call_name}",
-                                    "retryable": False,
-                                },
-                            }
-                            tool_failures.append(
-                                {"capability": capability or call_name, "error": tool_output["error"]}
-                            )
-                            messages.append(
-                                {
-                                    "role": "tool",
-                                    "tool_call_id": tool_call.get("id", ""),
-                                    "name": call_name,
-                                    "content": json.dumps(tool_output, ensure_ascii=False),
-                                }
-                            )
-                            continue
+    def _prepare_tool_calls(self, tool_calls: list[dict[str, Any]]) -> _ToolTurn:
+        """Validate a turn's tool calls; invalid ones get error output up front."""
+        turn = _ToolTurn(tool_calls)
+        name_to_capability = self.tool_name_to_capability
+        registry = self.capability_registry
+        for tool_call in tool_calls:
+            function = tool_call.get("function") or _NO_FUNCTION
+            call_name = function.get("name", "")
+            call_args_raw = function.get("arguments", "{}")
+            capability = name_to_capability.get(call_name, "")
+            turn.names.append(call_name)
 
-                        tool_result = self.tool_runtime.execute(capability, call_args)
-                        if not tool_result.ok and tool_result.error is not None:
-                            tool_failures.append(
-                                {
-                                    "capability": capability,
-                                    "error": {
-                                        "code": tool_result.error.code,
-                                        "message": tool_result.error.message,
-                                        "retryable": tool_result.error.retryable,
-                                        "details": tool_result.error.details,
-                                    },
-                                }
-                            )
+            try:
+                call_args = loads(call_args_raw) if call_args_raw else {}
+                if not isinstance(call_args, dict):
+                    raise ValueError("tool arguments must be JSON object")
+                spec = registry.get(capability)
+                if (
+                    spec is not None
+                    and spec.input_validator is not None
+                    and (call_args or not spec.input_trivially_empty)
+                ):
+                    spec.input_validator(call_args)
+            except Exception as exc:
+                turn.reject(
+                    capability or call_name,
+                    {
+                        "code": "invalid_tool_arguments",
+                        "message": str(exc),
+                        "retryable": False,
+                    },
+                )
+                continue
 
-                        messages.append(
-                            {
-                                "role": "tool",
-                                "tool_call_id": tool_call.get("id", ""),
-                                "name": call_name,
-                                "content": json.dumps(
-                                    {
-                                        "ok": tool_result.ok,
-                                        "data": tool_result.data,
-                                        "error": None
-                                        if tool_result.error is None
-                                        else {
-                                            "code": tool_result.error.code,
-                                            "message": tool_result.error.message,
-                                            "retryable": tool_result.error.retryable,
-                                            "details": tool_result.error.details,
-                                        },
-                                    },
-                                    ensure_ascii=False,
-                                ),
-                            }
-                        )
-                    continue
-
-                content = message.get("content", "")
-                if not isinstance(content, str):
-                    content = str(content)
-
-                return LLMExecutionResult(
-                    stdout=content,
-                    stderr="",
-                    returncode=0,
-                    provider=self.name,
-                    meta={
-                        "model": self.model,
-                        "id": data.get("id", ""),
-                        "usage": data.get("usage", {}),
-                        "tool_failures": tool_failures,
+            if not capability or self.tool_runtime is None:
+                turn.reject(
+                    capability or call_name,
+                    {
+                        "code": "unsupported_capability",
+                        "message": f"Unsupported tool: {call_name}",
+                        "retryable": False,
                     },
                 )
+                continue
 
-        raise LLMProviderError("OpenAI tool loop exceeded maximum iterations")
+            turn.defer(capability, call_args)
+        return turn
+
+    def _run_tool_calls(
+        self,
+        tool_calls: list[dict[str, Any]],
+        tool_failures: list[dict[str, Any]],
+        started: dict[int, Future[ToolExecutionResult]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Execute one turn's tool calls and return tool messages in call order.
+
+        Calls within a turn are independent, so when there are several they
+        run on a thread pool; failures are appended to *tool_failures*.
+        *started* maps call positions to executions already in flight.
+        """
+        turn = self._prepare_tool_calls(tool_calls)
+        started = started or {}
+        remaining = [call for call in turn.pending if call[0] not in started]
+        runtime = self.tool_runtime
+        if runtime is not None and len(remaining) > 1:
+            workers = min(MAX_PARALLEL_TOOL_CALLS, len(remaining))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                fresh = list(
+                    pool.map(lambda call: runtime.execute(call[1], call[2]), remaining)
+                )
+        elif runtime is not None:
+            fresh = [runtime.execute(cap, args) for _, cap, args in remaining]
+        else:
+            fresh = []
+        fresh_results = iter(fresh)
+        results = [
+            started[slot].result() if slot in started else next(fresh_results)
+            for slot, _, _ in turn.pending
+        ]
+        return turn.complete(results, tool_failures)
+
+    async def _arun_tool_calls(
+        self,
+        tool_calls: list[dict[str, Any]],
+        tool_failures: list[dict[str, Any]],
+        started: dict[int, asyncio.Task[ToolExecutionResult]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Async variant of :meth:`_run_tool_calls` gathering ``runtime.aexecute``."""
+        turn = self._prepare_tool_calls(tool_calls)
+        started = started or {}
+        runtime = self.tool_runtime
+        results: list[ToolExecutionResult] = []
+        if runtime is not None:
+            results = list(
+                await asyncio.gather(
+                    *(
+                        started.get(slot) or runtime.aexecute(capability, args)
+                        for slot, capability, args in turn.pending
+                    )
+                )
+            )
+        return turn.complete(results, tool_failures)
+
+    def close(self) -> None:
+        """Close the pooled HTTP client and the tool runtime."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+        if self.tool_runtime is not None:
+            self.tool_runtime.close()
+
+    async def aclose(self) -> None:
+        """Close both pooled HTTP clients and the tool runtime."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+        if self.tool_runtime is not None:
+            await self.tool_runtime.aclose()
+        self.close()
+
+    def _client_options(self) -> dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "headers": {
+                "Authorization": f"Bearer {self.api_key}",
+                "Content-Type": "application/json",
+            },
+            **pool_options(),
+        }
+
+    def _get_client(self) -> httpx.Client:
+        """Return the shared HTTP client, creating it on first use.
+
+        The client keeps the TLS connection to the API alive across calls and
+        across iterations of the tool loop.
+        """
+        if self._client is None:
+            self._client = httpx.Client(**self._client_options())
+        return self._client
+
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """Return the shared async HTTP client, creating it on first use.
+
+        The client's connections belong to the event loop that first used it;
+        the bot runs a single loop for its lifetime.
+        """
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(**self._client_options())
+        return self._async_client
 
     def _build_openai_tools(self) -> list[dict[str, Any]]:
         """Build OpenAI function-tool definitions from capability registry."""
@@ -213,7 +627,7 @@ class OpenAIProvider(LLMProvider):
                 {
                     "type": "function",
                     "function": {
-                        "name": self._capability_to_tool_name(capability),
+                        "name": self.capability_to_tool_name[capability],
                         "description": spec.description,
                         "parameters": spec.input_schema,
                     },
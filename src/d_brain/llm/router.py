@@ -1,10 +1,14 @@
 """Provider factory functions."""
 
 import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from shutil import which
 
 from d_brain.llm.base import LLMProvider
+from d_brain.llm.cache import CachingLLMProvider
 from d_brain.llm.claude_cli import ClaudeCLIProvider
 from d_brain.llm.codex_cli import CodexCLIProvider
 from d_brain.llm.openai_api import OpenAIProvider
@@ -12,6 +16,94 @@ from d_brain.llm.runtime import DefaultToolRuntime
 from d_brain.llm.tools import build_capability_registry
 
 
+@dataclass(frozen=True, slots=True)
+class _ProviderSettings:
+    todoist_api_key: str
+    singularity_api_key: str
+    openai_api_key: str
+    openai_model: str
+    openai_base_url: str
+    response_cache_ttl: int
+    openai_stream: bool
+
+
+# Resolved CLI binaries; misses are not cached so a later install is picked up
+_binary_paths: dict[str, str] = {}
+
+
+def _require_binary(provider_name: str, binary: str) -> None:
+    if binary in _binary_paths:
+        return
+    path = which(binary)
+    if path is None:
+        raise ValueError(
+            f"LLM provider '{provider_name}' selected but '{binary}' binary "
+            "is not in PATH"
+        )
+    _binary_paths[binary] = path
+
+
+@lru_cache(maxsize=16)
+def _mcp_config_path(workdir: Path, mcp_config_rel: str) -> Path:
+    return (workdir / mcp_config_rel).resolve()
+
+
+def _build_codex(vault: Path, settings: _ProviderSettings) -> LLMProvider:
+    _require_binary("openai-cli", "codex")
+    return CodexCLIProvider(
+        workdir=vault.parent,
+        todoist_api_key=settings.todoist_api_key,
+        singularity_api_key=settings.singularity_api_key,
+    )
+
+
+def _build_claude(vault: Path, settings: _ProviderSettings) -> LLMProvider:
+    _require_binary("claude-cli", "claude")
+    mcp_config_rel = os.environ.get("MCP_CONFIG_PATH", "mcp-config.json")
+    return ClaudeCLIProvider(
+        workdir=vault.parent,
+        mcp_config_path=_mcp_config_path(vault.parent, mcp_config_rel),
+        todoist_api_key=settings.todoist_api_key,
+        singularity_api_key=settings.singularity_api_key,
+    )
+
+
+def _build_openai(vault: Path, settings: _ProviderSettings) -> LLMProvider:
+    if not settings.openai_api_key:
+        raise ValueError("LLM provider 'openai-api' requires OPENAI_API_KEY")
+    if not settings.openai_model:
+        raise ValueError("LLM provider 'openai-api' requires OPENAI_MODEL")
+
+    tool_runtime = DefaultToolRuntime(
+        vault_path=vault,
+        todoist_api_key=settings.todoist_api_key,
+    )
+    provider = OpenAIProvider(
+        api_key=settings.openai_api_key,
+        model=settings.openai_model,
+        base_url=settings.openai_base_url,
+        tool_runtime=tool_runtime,
+        capability_registry=build_capability_registry(),
+        stream=settings.openai_stream,
+    )
+    if settings.response_cache_ttl <= 0:
+        return provider
+    # CLI providers always run with MCP tools, so only the API provider,
+    # whose tool use is visible in the result, can be cached safely
+    return CachingLLMProvider(
+        provider,
+        namespace=f"{settings.openai_base_url}\0{settings.openai_model}",
+        ttl_seconds=settings.response_cache_ttl,
+    )
+
+
+_PROVIDER_BUILDERS: dict[str, Callable[[Path, _ProviderSettings], LLMProvider]] = {
+    "openai-cli": _build_codex,
+    "claude-cli": _build_claude,
+    "openai-api": _build_openai,
+}
+
+
 def create_provider(
     vault_path: Path,
     *,
@@ -21,54 +113,63 @@ def create_provider(
     openai_api_key: str = "",
     openai_model: str = "",
     openai_base_url: str = "https://api.openai.com/v1",
+    response_cache_ttl: int = 0,
+    openai_stream: bool = False,
 ) -> LLMProvider:
     """Create provider instance from configuration.
 
+    A positive ``response_cache_ttl`` puts the ``openai-api`` provider behind
+    a :class:`CachingLLMProvider`; the default 0 leaves caching off.
+    ``openai_stream`` makes the ``openai-api`` provider stream its turns.
+
     Raises:
         ValueError: if provider config is invalid.
     """
-    resolved_vault = Path(vault_path)
-
-    if provider_name == "openai-cli":
-        if which("codex") is None:
-            raise ValueError("LLM provider 'openai-cli' selected but 'codex' binary is not in PATH")
-        return CodexCLIProvider(
-            workdir=resolved_vault.parent,
-            todoist_api_key=todoist_api_key,
-            singularity_api_key=singularity_api_key,
-        )
-
-    if provider_name == "claude-cli":
-        if which("claude") is None:
-            raise ValueError("LLM provider 'claude-cli' selected but 'claude' binary is not in PATH")
-        mcp_config_rel = os.environ.get("MCP_CONFIG_PATH", "mcp-config.json")
-        return ClaudeCLIProvider(
-            workdir=resolved_vault.parent,
-            mcp_config_path=(resolved_vault.parent / mcp_config_rel).resolve(),
-            todoist_api_key=todoist_api_key,
-            singularity_api_key=singularity_api_key,
-        )
+    builder = _PROVIDER_BUILDERS.get(provider_name)
+    if builder is None:
+        raise ValueError(f"Unsupported LLM provider: {provider_name}")
+    settings = _ProviderSettings(
+        todoist_api_key=todoist_api_key,
+        singularity_api_key=singularity_api_key,
+        openai_api_key=openai_api_key,
+        openai_model=openai_model,
+        openai_base_url=openai_base_url,
+        response_cache_ttl=response_cache_ttl,
+        openai_stream=openai_stream,
+    )
+    return builder(Path(vault_path), settings)
 
-    if provider_name == "openai-api":
-        if not openai_api_key:
-            raise ValueError("LLM provider 'openai-api' requires OPENAI_API_KEY")
-        if not openai_model:
-            raise ValueError("LLM provider 'openai-api' requires OPENAI_MODEL")
 
-        capability_registry = build_capability_registry()
-        tool_runtime = DefaultToolRuntime(
-            vault_path=resolved_vault,
-            todoist_api_key=todoist_api_key,
-        )
-        return OpenAIProvider(
-            api_key=openai_api_key,
-            model=openai_model,
-            base_url=openai_base_url,
-            tool_runtime=tool_runtime,
-            capability_registry=capability_registry,
-        )
+@lru_cache(maxsize=16)
+def get_provider(
+    vault_path: Path,
+    *,
+    provider_name: str = "openai-cli",
+    todoist_api_key: str = "",
+    singularity_api_key: str = "",
+    openai_api_key: str = "",
+    openai_model: str = "",
+    openai_base_url: str = "https://api.openai.com/v1",
+    response_cache_ttl: int = 0,
+    openai_stream: bool = False,
+) -> LLMProvider:
+    """Shared provider instance for a configuration (see :func:`create_provider`).
 
-    raise ValueError(f"Unsupported LLM provider: {provider_name}")
+    Repeated calls with the same arguments return the same provider, so its
+    pooled HTTP clients (and response cache, if enabled) outlive any one processor.
+    Failed builds are not cached.
+    """
+    return create_provider(
+        vault_path,
+        provider_name=provider_name,
+        todoist_api_key=todoist_api_key,
+        singularity_api_key=singularity_api_key,
+        openai_api_key=openai_api_key,
+        openai_model=openai_model,
+        openai_base_url=openai_base_url,
+        response_cache_ttl=response_cache_ttl,
+        openai_stream=openai_stream,
+    )
 
 
 def create_default_provider(vault_path: Path, todoist_api_key: str = "") -> LLMProvider:
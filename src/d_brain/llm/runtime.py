@@ -2,70 +2,130 @@
 
 from __future__ import annotations
 
+import asyncio
+import fnmatch
+import heapq
 import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import httpx
+
+from d_brain.llm.http_pool import pool_options
+from d_brain.llm.jsonio import dumpb, dumps, loads
 from d_brain.llm.tools import ToolExecutionError, ToolExecutionResult, ToolRuntime
 
+TODOIST_TIMEOUT_SECONDS = 30
+# Concurrent task-creation requests per todoist.add_tasks call
+MAX_PARALLEL_TODOIST_REQUESTS = 8
+# Append-mode file descriptors kept open for repeated vault.write_file appends
+MAX_APPEND_HANDLES = 32
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+TODOIST_SYNC_URL = "https://api.todoist.com/sync/v9/sync"
+TODOIST_TASKS_URL = "https://api.todoist.com/rest/v2/tasks"
+TODOIST_COMPLETED_URL = "https://api.todoist.com/sync/v9/completed/get_all"
+_USER_INFO_QUERY = {"sync_token": "*", "resource_types": dumps(["user"])}
+
 
 class DefaultToolRuntime(ToolRuntime):
     """Default runtime for todoist.* and vault.* capabilities."""
 
-    def __init__(self, *, vault_path: Path, todoist_api_key: str = "") -> None:
+    def __init__(
+        self,
+        *,
+        vault_path: Path,
+        todoist_api_key: str = "",
+        strict_symlinks: bool = True,
+    ) -> None:
         self.vault_path = Path(vault_path).resolve()
         self.todoist_api_key = todoist_api_key
+        # When False, vault paths are checked lexically and symlinks are trusted
+        self.strict_symlinks = strict_symlinks
+        self._vault_prefix = os.path.join(str(self.vault_path), "")
+        self._append_fds: OrderedDict[Path, int] = OrderedDict()
+        self._append_lock = threading.Lock()
+        self._todoist_client: httpx.Client | None = None
+        self._todoist_async_client: httpx.AsyncClient | None = None
+        # Tool calls from one model turn may run on several threads
+        self._client_lock = threading.Lock()
+        self._handlers = {
+            "vault.read_file": self._vault_read_file,
+            "vault.write_file": self._vault_write_file,
+            "vault.list_files": self._vault_list_files,
+            "todoist.user_info": self._todoist_user_info,
+            "todoist.add_tasks": self._todoist_add_tasks,
+            "todoist.find_completed_tasks": self._todoist_find_completed_tasks,
+        }
+        self._async_handlers = {
+            "todoist.user_info": self._atodoist_user_info,
+            "todoist.add_tasks": self._atodoist_add_tasks,
+            "todoist.find_completed_tasks": self._atodoist_find_completed_tasks,
+        }
 
     def execute(self, capability: str, payload: dict[str, Any]) -> ToolExecutionResult:
         """Execute capability and return structured result."""
         try:
             handler = self._resolve_handler(capability)
             data = handler(payload)
-            return ToolExecutionResult(capability=capability, ok=True, data=data)
-        except CapabilityError as exc:
-            return ToolExecutionResult(
-                capability=capability,
-                ok=False,
-                error=ToolExecutionError(
-                    code=exc.code,
-                    message=str(exc),
-                    retryable=exc.retryable,
-                    details=exc.details,
-                ),
-            )
-        except Exception as exc:  # pragma: no cover - defensive safety
-            return ToolExecutionResult(
-                capability=capability,
-                ok=False,
-                error=ToolExecutionError(
-                    code="runtime_error",
-                    message=str(exc),
-                    retryable=False,
-                ),
-            )
+        except Exception as exc:
+            return _failed_result(capability, exc)
+        return ToolExecutionResult(capability=capability, ok=True, data=data)
+
+    async def aexecute(
+        self, capability: str, payload: dict[str, Any]
+    ) -> ToolExecutionResult:
+        """Execute capability without blocking the loop.
+
+        Todoist capabilities use a pooled ``httpx.AsyncClient``; vault file
+        access runs in a worker thread.
+        """
+        try:
+            async_handler = self._async_handlers.get(capability)
+            if async_handler is not None:
+                data = await async_handler(payload)
+            else:
+                handler = self._resolve_handler(capability)
+                data = await asyncio.to_thread(handler, payload)
+        except Exception as exc:
+            return _failed_result(capability, exc)
+        return ToolExecutionResult(capability=capability, ok=True, data=data)
+
+    def close(self) -> None:
+        """Close the pooled Todoist HTTP client and cached append handles."""
+        if self._todoist_client is not None:
+            self._todoist_client.close()
+            self._todoist_client = None
+        with self._append_lock:
+            while self._append_fds:
+                os.close(self._append_fds.popitem()[1])
+
+    async def aclose(self) -> None:
+        """Close both pooled Todoist HTTP clients."""
+        if self._todoist_async_client is not None:
+            await self._todoist_async_client.aclose()
+            self._todoist_async_client = None
+        self.close()
 
     def _resolve_handler(self, capability: str):
-        handlers = {
-            "vault.read_file": self._vault_read_file,
-            "vault.write_file": self._vault_write_file,
-            "vault.list_files": self._vault_list_files,
-            "todoist.user_info": self._todoist_user_info,
-            "todoist.add_tasks": self._todoist_add_tasks,
-            "todoist.find_completed_tasks": self._todoist_find_completed_tasks,
-        }
-        if capability not in handlers:
+        handler = self._handlers.get(capability)
+        if handler is None:
             raise CapabilityError("unsupported_capability", f"Unsupported capability: {capability}")
-        return handlers[capability]
+        return handler
 
     def _resolve_vault_path(self, relative_path: str) -> Path:
-        path = (self.vault_path / relative_path).resolve()
-        if not path.is_relative_to(self.vault_path):
-            raise CapabilityError(
-                "path_outside_vault",
-                f"Path escapes vault: {relative_path}",
-                details={"path": relative_path},
-            )
-        return path
+        # Lexical check first: ".." escapes are rejected without touching the filesystem
+        candidate = os.path.normpath(os.path.join(self._vault_prefix, relative_path))
+        if not os.path.join(candidate, "").startswith(self._vault_prefix):
+            raise _outside_vault_error(relative_path)
+        if self.strict_symlinks:
+            return _resolve_in_vault(self.vault_path, relative_path)
+        return Path(candidate)
 
     def _vault_read_file(self, payload: dict[str, Any]) -> dict[str, Any]:
         path = str(payload.get("path", ""))
@@ -90,14 +150,41 @@ class DefaultToolRuntime(ToolRuntime):
             raise CapabilityError("invalid_input", "mode must be overwrite or append")
 
         resolved = self._resolve_vault_path(path)
-        resolved.parent.mkdir(parents=True, exist_ok=True)
+        data = content.encode("utf-8")
         if mode == "append":
-            with resolved.open("a", encoding="utf-8") as file_obj:
-                file_obj.write(content)
+            self._append_bytes(resolved, data)
         else:
-            resolved.write_text(content, encoding="utf-8")
-
-        return {"path": path, "writtenBytes": len(content.encode("utf-8"))}
+            try:
+                file_obj = resolved.open("wb")
+            except FileNotFoundError:
+                resolved.parent.mkdir(parents=True, exist_ok=True)
+                file_obj = resolved.open("wb")
+            with file_obj:
+                file_obj.write(data)
+
+        return {"path": path, "writtenBytes": len(data)}
+
+    def _append_bytes(self, path: Path, data: bytes) -> None:
+        """Append through a cached O_APPEND descriptor.
+
+        A cached descriptor is dropped when the path no longer names the same
+        file (e.g. an editor saved it by rename), so writes never land in an
+        unlinked inode.
+        """
+        with self._append_lock:
+            fd = self._append_fds.pop(path, None)
+            if fd is not None and not _is_same_file(fd, path):
+                os.close(fd)
+                fd = None
+            if fd is None:
+                fd = _open_append(path)
+            self._append_fds[path] = fd
+            while len(self._append_fds) > MAX_APPEND_HANDLES:
+                os.close(self._append_fds.popitem(last=False)[1])
+
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
 
     def _vault_list_files(self, payload: dict[str, Any]) -> dict[str, Any]:
         directory = str(payload.get("dir", "."))
@@ -109,85 +196,87 @@ class DefaultToolRuntime(ToolRuntime):
         if not resolved.is_dir():
             raise CapabilityError("invalid_input", "dir must point to directory")
 
-        files: list[str] = []
-        for file_path in sorted(resolved.rglob(pattern)):
-            if file_path.is_file():
-                files.append(str(file_path.relative_to(self.vault_path)))
-                if len(files) >= limit:
-                    break
-        return {"files": files}
+        # Keep only the first `limit` paths in sorted order instead of sorting
+        # every match in the vault
+        matches = heapq.nsmallest(limit, _iter_matching_files(resolved, pattern))
+        base = resolved.relative_to(self.vault_path)
+        return {"files": [str(base.joinpath(*parts)) for parts in matches]}
 
     def _todoist_user_info(self, payload: dict[str, Any]) -> dict[str, Any]:
         del payload
-        data = self._todoist_request(
-            "https://api.todoist.com/sync/v9/sync",
-            {"sync_token": "*", "resource_types": json.dumps(["user"])},
+        return _user_info_result(
+            self._todoist_request(TODOIST_SYNC_URL, _USER_INFO_QUERY)
         )
-        user = data.get("user", {})
-        return {
-            "userId": str(user.get("id", "")),
-            "email": user.get("email", ""),
-            "name": user.get("full_name", "") or user.get("name", ""),
-        }
 
-    def _todoist_add_tasks(self, payload: dict[str, Any]) -> dict[str, Any]:
-        tasks = payload.get("tasks")
-        if not isinstance(tasks, list) or not tasks:
-            raise CapabilityError("invalid_input", "todoist.add_tasks requires non-empty tasks list")
-
-        created: list[dict[str, Any]] = []
-        for task in tasks:
-            if not isinstance(task, dict):
-                raise CapabilityError("invalid_input", "task item must be object")
-            content = str(task.get("content", "")).strip()
-            if not content:
-                raise CapabilityError("invalid_input", "task content is required")
-
-            body: dict[str, Any] = {"content": content}
-            if task.get("description"):
-                body["description"] = task["description"]
-            if task.get("priority"):
-                body["priority"] = int(task["priority"])
-            if task.get("projectId"):
-                body["project_id"] = task["projectId"]
-            if task.get("dueString"):
-                body["due_string"] = task["dueString"]
-
-            data = self._todoist_request(
-                "https://api.todoist.com/rest/v2/tasks",
-                body,
-                method="json_post",
-            )
-            created.append({"id": str(data.get("id", "")), "content": data.get("content", content)})
+    async def _atodoist_user_info(self, payload: dict[str, Any]) -> dict[str, Any]:
+        del payload
+        return _user_info_result(
+            await self._atodoist_request(TODOIST_SYNC_URL, _USER_INFO_QUERY)
+        )
 
-        return {"created": created}
+    def _todoist_add_tasks(self, payload: dict[str, Any]) -> dict[str, Any]:
+        bodies = _task_bodies(payload)
+
+        def create(body: dict[str, Any]) -> dict[str, Any] | CapabilityError:
+            try:
+                return self._todoist_request(
+                    TODOIST_TASKS_URL, body, method="json_post"
+                )
+            except CapabilityError as exc:
+                return exc
+
+        if len(bodies) == 1:
+            outcomes = [create(bodies[0])]
+        else:
+            # Tasks are independent, so create them concurrently on the pooled client
+            workers = min(MAX_PARALLEL_TODOIST_REQUESTS, len(bodies))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(create, bodies))
+        return _created_result(bodies, outcomes)
+
+    async def _atodoist_add_tasks(self, payload: dict[str, Any]) -> dict[str, Any]:
+        bodies = _task_bodies(payload)
+        # Same bound as the sync thread pool, so a long task list doesn't
+        # open one connection per task
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_TODOIST_REQUESTS)
+
+        async def create(body: dict[str, Any]) -> dict[str, Any] | CapabilityError:
+            async with semaphore:
+                try:
+                    return await self._atodoist_request(
+                        TODOIST_TASKS_URL, body, method="json_post"
+                    )
+                except CapabilityError as exc:
+                    return exc
+
+        outcomes = await asyncio.gather(*(create(body) for body in bodies))
+        return _created_result(bodies, outcomes)
 
     def _todoist_find_completed_tasks(self, payload: dict[str, Any]) -> dict[str, Any]:
-        query: dict[str, Any] = {}
-        if payload.get("since"):
-            query["since"] = str(payload["since"])
-        if payload.get("until"):
-            query["until"] = str(payload["until"])
-        if payload.get("limit"):
-            query["limit"] = int(payload["limit"])
-
-        data = self._todoist_request(
-            "https://api.todoist.com/sync/v9/completed/get_all",
-            query,
+        return _completed_result(
+            self._todoist_request(TODOIST_COMPLETED_URL, _completed_query(payload))
         )
-        items = data.get("items", []) or []
-        tasks: list[dict[str, Any]] = []
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-            tasks.append(
-                {
-                    "id": str(item.get("task_id", item.get("id", ""))),
-                    "content": item.get("content", ""),
-                    "completedAt": item.get("completed_at", ""),
-                }
+
+    async def _atodoist_find_completed_tasks(
+        self, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        return _completed_result(
+            await self._atodoist_request(
+                TODOIST_COMPLETED_URL, _completed_query(payload)
             )
-        return {"tasks": tasks}
+        )
+
+    def _check_todoist_ready(self) -> None:
+        """Check Todoist prerequisites before a request."""
+        if not self.todoist_api_key:
+            raise CapabilityError("missing_credentials", "TODOIST_API_KEY is not configured")
+
+    def _todoist_client_options(self) -> dict[str, Any]:
+        return {
+            "headers": {"Authorization": f"Bearer {self.todoist_api_key}"},
+            "timeout": TODOIST_TIMEOUT_SECONDS,
+            **pool_options(),
+        }
 
     def _todoist_request(
         self,
@@ -196,42 +285,37 @@ class DefaultToolRuntime(ToolRuntime):
         *,
         method: str = "post",
     ) -> dict[str, Any]:
-        if not self.todoist_api_key:
-            raise CapabilityError("missing_credentials", "TODOIST_API_KEY is not configured")
-
+        self._check_todoist_ready()
+        with self._client_lock:
+            if self._todoist_client is None:
+                # One pooled client keeps the Todoist connection alive across tool calls
+                self._todoist_client = httpx.Client(**self._todoist_client_options())
+            client = self._todoist_client
         try:
-            import httpx
-        except ModuleNotFoundError as exc:
-            raise CapabilityError("runtime_dependency_missing", "httpx is required for todoist capabilities") from exc
-
-        headers = {"Authorization": f"Bearer {self.todoist_api_key}"}
-        try:
-            with httpx.Client(timeout=30) as client:
-                if method == "json_post":
-                    response = client.post(url, json=payload, headers=headers)
-                else:
-                    response = client.post(url, data=payload, headers=headers)
-        except httpx.TimeoutException as exc:
-            raise CapabilityError("todoist_timeout", "Todoist request timed out", retryable=True) from exc
+            response = client.post(url, **_todoist_body(payload, method))
         except httpx.HTTPError as exc:
-            raise CapabilityError(
-                "todoist_transport_error",
-                f"Todoist transport error: {type(exc).__name__}",
-                retryable=True,
-            ) from exc
-
-        if response.status_code >= 400:
-            raise CapabilityError(
-                "todoist_api_error",
-                f"Todoist API error {response.status_code}",
-                details={"body": response.text[:500]},
-                retryable=response.status_code >= 500,
-            )
+            raise _todoist_transport_error(exc) from exc
+        return _todoist_json(response)
 
+    async def _atodoist_request(
+        self,
+        url: str,
+        payload: dict[str, Any],
+        *,
+        method: str = "post",
+    ) -> dict[str, Any]:
+        self._check_todoist_ready()
+        if self._todoist_async_client is None:
+            self._todoist_async_client = httpx.AsyncClient(
+                **self._todoist_client_options()
+            )
         try:
-            return response.json()
-        except json.JSONDecodeError as exc:
-            raise CapabilityError("todoist_invalid_json", "Todoist response is not valid JSON") from exc
+            response = await self._todoist_async_client.post(
+                url, **_todoist_body(payload, method)
+            )
+        except httpx.HTTPError as exc:
+            raise _todoist_transport_error(exc) from exc
+        return _todoist_json(response)
 
 
 class CapabilityError(Exception):
@@ -248,4 +332,242 @@ class CapabilityError(Exception):
         super().__init__(message)
         self.code = code
         self.retryable = retryable
-        self.details = details or {}
+        self.details = details
+
+
+def _iter_matching_files(root: Path, pattern: str) -> Iterator[tuple[str, ...]]:
+    """Yield path parts (relative to *root*) of files matching *pattern*.
+
+    Walks with ``os.scandir`` so entry types come from the directory listing
+    without extra ``stat`` calls. Hidden directories below *root* (``.git``,
+    ``.sessions``, ...) and symlinked directories are not descended into;
+    symlinked files are listed. Matching follows ``Path.rglob``: see
+    :func:`_matches`.
+    """
+    segments = ("**", *(segment for segment in pattern.split("/") if segment))
+    stack: list[tuple[str, tuple[str, ...]]] = [(str(root), ())]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    parts = (*prefix, entry.name)
+                    if entry.is_dir(follow_symlinks=False):
+                        if not entry.name.startswith("."):
+                            stack.append((entry.path, parts))
+                    elif entry.is_file() and _matches(parts, segments):
+                        yield parts
+        except OSError:
+            continue
+
+
+def _matches(parts: tuple[str, ...], segments: tuple[str, ...]) -> bool:
+    """Match path parts against glob segments, one segment per path part.
+
+    ``**`` spans zero or more directories and ``*`` never crosses ``/``, so
+    ``daily/*.md`` skips ``daily/sub/x.md`` and ``**/*.md`` includes
+    top-level files. Like ``rglob``, a trailing ``**`` matches no files.
+    """
+    if not segments:
+        return not parts
+    head, rest = segments[0], segments[1:]
+    if head == "**":
+        return bool(rest) and any(
+            _matches(parts[index:], rest) for index in range(len(parts))
+        )
+    return (
+        bool(parts)
+        and fnmatch.fnmatchcase(parts[0], head)
+        and _matches(parts[1:], rest)
+    )
+
+
+def _failed_result(capability: str, exc: Exception) -> ToolExecutionResult:
+    if isinstance(exc, CapabilityError):
+        error = ToolExecutionError(
+            code=exc.code,
+            message=str(exc),
+            retryable=exc.retryable,
+            details=exc.details,
+        )
+    else:  # pragma: no cover - defensive safety
+        error = ToolExecutionError(
+            code="runtime_error", message=str(exc), retryable=False
+        )
+    return ToolExecutionResult(capability=capability, ok=False, error=error)
+
+
+def _user_info_result(data: dict[str, Any]) -> dict[str, Any]:
+    user = data.get("user", {})
+    return {
+        "userId": str(user.get("id", "")),
+        "email": user.get("email", ""),
+        "name": user.get("full_name", "") or user.get("name", ""),
+    }
+
+
+def _task_bodies(payload: dict[str, Any]) -> list[dict[str, Any]]:
+    """Validate todoist.add_tasks input and build one REST body per task."""
+    tasks = payload.get("tasks")
+    if not isinstance(tasks, list) or not tasks:
+        raise CapabilityError(
+            "invalid_input", "todoist.add_tasks requires non-empty tasks list"
+        )
+
+    bodies: list[dict[str, Any]] = []
+    for task in tasks:
+        if not isinstance(task, dict):
+            raise CapabilityError("invalid_input", "task item must be object")
+        content = str(task.get("content", "")).strip()
+        if not content:
+            raise CapabilityError("invalid_input", "task content is required")
+
+        body: dict[str, Any] = {"content": content}
+        if task.get("description"):
+            body["description"] = task["description"]
+        if task.get("priority"):
+            body["priority"] = int(task["priority"])
+        if task.get("projectId"):
+            body["project_id"] = task["projectId"]
+        if task.get("dueString"):
+            body["due_string"] = task["dueString"]
+        bodies.append(body)
+    return bodies
+
+
+def _created_result(
+    bodies: list[dict[str, Any]], outcomes: list[dict[str, Any] | CapabilityError]
+) -> dict[str, Any]:
+    """Report created and failed tasks; raise only if no task was created."""
+    failures = [outcome for outcome in outcomes if isinstance(outcome, CapabilityError)]
+    if len(failures) == len(outcomes):
+        raise failures[0]
+
+    created: list[dict[str, Any]] = []
+    failed: list[dict[str, Any]] = []
+    for body, outcome in zip(bodies, outcomes, strict=True):
+        if isinstance(outcome, CapabilityError):
+            failed.append(
+                {
+                    "content": body["content"],
+                    "error": {
+                        "code": outcome.code,
+                        "message": str(outcome),
+                        "retryable": outcome.retryable,
+                    },
+                }
+            )
+        else:
+            created.append(
+                {
+                    "id": str(outcome.get("id", "")),
+                    "content": outcome.get("content", body["content"]),
+                }
+            )
+    result: dict[str, Any] = {"created": created}
+    if failed:
+        result["failed"] = failed
+    return result
+
+
+def _completed_query(payload: dict[str, Any]) -> dict[str, Any]:
+    query: dict[str, Any] = {}
+    if payload.get("since"):
+        query["since"] = str(payload["since"])
+    if payload.get("until"):
+        query["until"] = str(payload["until"])
+    if payload.get("limit"):
+        query["limit"] = int(payload["limit"])
+    return query
+
+
+def _completed_result(data: dict[str, Any]) -> dict[str, Any]:
+    items = data.get("items", []) or []
+    tasks: list[dict[str, Any]] = []
+    for item in items:
+        if not isinstance(item, dict):
+            continue
+        tasks.append(
+            {
+                "id": str(item.get("task_id", item.get("id", ""))),
+                "content": item.get("content", ""),
+                "completedAt": item.get("completed_at", ""),
+            }
+        )
+    return {"tasks": tasks}
+
+
+def _resolve_in_vault(vault_path: Path, relative_path: str) -> Path:
+    """Resolve *relative_path* inside *vault_path*, following symlinks.
+
+    Resolved on every call: a directory swapped for a symlink after an
+    earlier check must not keep passing it.
+    """
+    path = (vault_path / relative_path).resolve()
+    if not path.is_relative_to(vault_path):
+        raise _outside_vault_error(relative_path)
+    return path
+
+
+def _open_append(path: Path) -> int:
+    try:
+        return os.open(path, _APPEND_FLAGS, 0o644)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return os.open(path, _APPEND_FLAGS, 0o644)
+
+
+def _is_same_file(fd: int, path: Path) -> bool:
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _outside_vault_error(relative_path: str) -> CapabilityError:
+    return CapabilityError(
+        "path_outside_vault",
+        f"Path escapes vault: {relative_path}",
+        details={"path": relative_path},
+    )
+
+
+def _todoist_body(payload: dict[str, Any], method: str) -> dict[str, Any]:
+    """httpx keyword arguments carrying *payload* as JSON or form data."""
+    if method == "json_post":
+        return {
+            "content": dumpb(payload),
+            "headers": {"Content-Type": "application/json"},
+        }
+    return {"data": payload}
+
+
+def _todoist_transport_error(exc: Exception) -> CapabilityError:
+    if isinstance(exc, httpx.TimeoutException):
+        return CapabilityError(
+            "todoist_timeout", "Todoist request timed out", retryable=True
+        )
+    return CapabilityError(
+        "todoist_transport_error",
+        f"Todoist transport error: {type(exc).__name__}",
+        retryable=True,
+    )
+
+
+def _todoist_json(response: httpx.Response) -> dict[str, Any]:
+    if response.status_code >= 400:
+        raise CapabilityError(
+            "todoist_api_error",
+            f"Todoist API error {response.status_code}",
+            details={"body": response.text[:500]},
+            retryable=response.status_code >= 500,
+        )
+
+    try:
+        return loads(response.content)
+    except json.JSONDecodeError as exc:
+        raise CapabilityError(
+            "todoist_invalid_json", "Todoist response is not valid JSON"
+        ) from exc
@@ -1,38 +1,77 @@
 """Canonical tool capability contract for provider parity."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
+from types import MappingProxyType
 from typing import Any
 
+try:
+    import fastjsonschema
+except ModuleNotFoundError:  # pragma: no cover - optional dependency
+    fastjsonschema = None  # type: ignore[assignment, unused-ignore]
+
 
 @dataclass(frozen=True, slots=True)
 class CapabilitySpec:
-    """Capability schema contract shared across providers."""
+    """Capability schema contract shared across providers.
+
+    When the optional ``fastjsonschema`` package is installed,
+    ``input_validator`` holds a validator compiled once from
+    ``input_schema``; it raises ``ValueError`` for a non-conforming payload.
+    ``input_trivially_empty`` is True when the schema accepts an empty object,
+    letting callers skip validation for ``{}`` payloads.
+    """
 
     name: str
     description: str
     input_schema: dict[str, Any]
     output_schema: dict[str, Any]
     parity_required: bool = True
+    input_validator: Callable[[Any], Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    input_trivially_empty: bool = field(
+        default=False, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "input_trivially_empty",
+            not self.input_schema.get("required")
+            and not self.input_schema.get("minProperties"),
+        )
+        if fastjsonschema is not None:
+            object.__setattr__(
+                self, "input_validator", fastjsonschema.compile(self.input_schema)
+            )
 
 
 @dataclass(slots=True)
 class ToolExecutionError:
-    """Structured tool execution failure payload."""
+    """Structured tool execution failure payload.
+
+    ``details`` is None rather than an empty dict when there is nothing to add.
+    """
 
     code: str
     message: str
     retryable: bool = False
-    details: dict[str, Any] = field(default_factory=dict)
+    details: dict[str, Any] | None = None
 
 
 @dataclass(slots=True)
 class ToolExecutionResult:
-    """Result envelope for capability execution."""
+    """Result envelope for capability execution.
+
+    ``data`` is None for results without a payload (typically failures).
+    """
 
     capability: str
     ok: bool
-    data: dict[str, Any] = field(default_factory=dict)
+    data: dict[str, Any] | None = None
     error: ToolExecutionError | None = None
 
 
@@ -43,8 +82,41 @@ class ToolRuntime(ABC):
     def execute(self, capability: str, payload: dict[str, Any]) -> ToolExecutionResult:
         """Execute capability call and return structured result."""
 
+    async def aexecute(
+        self, capability: str, payload: dict[str, Any]
+    ) -> ToolExecutionResult:
+        """Execute capability call without blocking the event loop.
+
+        Runtimes with native async transports override this; the default runs
+        :meth:`execute` in a worker thread.
+        """
+        return await asyncio.to_thread(self.execute, capability, payload)
+
+    def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """Release pooled transport resources (no-op by default)."""
+
+    async def aclose(self) -> None:
+        """Release pooled sync and async resources (defaults to :meth:`close`)."""
+        self.close()
+
+
+# Schema fragments shared by every capability that uses them. They are plain
+# dicts so the tool definitions stay JSON-serializable; never mutate them.
+_STRING: dict[str, Any] = {"type": "string"}
+_INTEGER: dict[str, Any] = {"type": "integer"}
+_BOOLEAN: dict[str, Any] = {"type": "boolean"}
+
+
+def build_capability_registry() -> Mapping[str, CapabilitySpec]:
+    """Return the canonical capability contracts for Todoist and Vault.
 
-def build_capability_registry() -> dict[str, CapabilitySpec]:
+    The registry is built once at import and shared read-only; copy it with
+    ``dict(...)`` to extend it.
+    """
+    return _CAPABILITY_REGISTRY
+
+
+def _build_capability_registry() -> dict[str, CapabilitySpec]:
     """Define canonical capability contracts for Todoist and Vault."""
     return {
         "todoist.user_info": CapabilitySpec(
@@ -58,9 +130,9 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
             output_schema={
                 "type": "object",
                 "properties": {
-                    "userId": {"type": "string"},
-                    "email": {"type": "string"},
-                    "name": {"type": "string"},
+                    "userId": _STRING,
+                    "email": _STRING,
+                    "name": _STRING,
                 },
                 "required": ["userId", "name"],
             },
@@ -76,11 +148,11 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
                         "items": {
                             "type": "object",
                             "properties": {
-                                "content": {"type": "string"},
-                                "description": {"type": "string"},
-                                "dueString": {"type": "string"},
-                                "priority": {"type": "integer"},
-                                "projectId": {"type": "string"},
+                                "content": _STRING,
+                                "description": _STRING,
+                                "dueString": _STRING,
+                                "priority": _INTEGER,
+                                "projectId": _STRING,
                             },
                             "required": ["content"],
                         },
@@ -96,12 +168,23 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
                         "items": {
                             "type": "object",
                             "properties": {
-                                "id": {"type": "string"},
-                                "content": {"type": "string"},
+                                "id": _STRING,
+                                "content": _STRING,
                             },
                             "required": ["id", "content"],
                         },
-                    }
+                    },
+                    "failed": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "content": _STRING,
+                                "error": {"type": "object"},
+                            },
+                            "required": ["content", "error"],
+                        },
+                    },
                 },
                 "required": ["created"],
             },
@@ -112,9 +195,9 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
             input_schema={
                 "type": "object",
                 "properties": {
-                    "since": {"type": "string"},
-                    "until": {"type": "string"},
-                    "limit": {"type": "integer"},
+                    "since": _STRING,
+                    "until": _STRING,
+                    "limit": _INTEGER,
                 },
             },
             output_schema={
@@ -125,9 +208,9 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
                         "items": {
                             "type": "object",
                             "properties": {
-                                "id": {"type": "string"},
-                                "content": {"type": "string"},
-                                "completedAt": {"type": "string"},
+                                "id": _STRING,
+                                "content": _STRING,
+                                "completedAt": _STRING,
                             },
                             "required": ["id", "content"],
                         },
@@ -141,15 +224,15 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
             description="Read text file from vault path.",
             input_schema={
                 "type": "object",
-                "properties": {"path": {"type": "string"}},
+                "properties": {"path": _STRING},
                 "required": ["path"],
             },
             output_schema={
                 "type": "object",
                 "properties": {
-                    "path": {"type": "string"},
-                    "exists": {"type": "boolean"},
-                    "content": {"type": "string"},
+                    "path": _STRING,
+                    "exists": _BOOLEAN,
+                    "content": _STRING,
                 },
                 "required": ["path", "exists", "content"],
             },
@@ -160,8 +243,8 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
             input_schema={
                 "type": "object",
                 "properties": {
-                    "path": {"type": "string"},
-                    "content": {"type": "string"},
+                    "path": _STRING,
+                    "content": _STRING,
                     "mode": {"type": "string", "enum": ["overwrite", "append"]},
                 },
                 "required": ["path", "content"],
@@ -169,8 +252,8 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
             output_schema={
                 "type": "object",
                 "properties": {
-                    "path": {"type": "string"},
-                    "writtenBytes": {"type": "integer"},
+                    "path": _STRING,
+                    "writtenBytes": _INTEGER,
                 },
                 "required": ["path", "writtenBytes"],
             },
@@ -181,17 +264,22 @@ def build_capability_registry() -> dict[str, CapabilitySpec]:
             input_schema={
                 "type": "object",
                 "properties": {
-                    "dir": {"type": "string"},
-                    "pattern": {"type": "string"},
-                    "limit": {"type": "integer"},
+                    "dir": _STRING,
+                    "pattern": _STRING,
+                    "limit": _INTEGER,
                 },
             },
             output_schema={
                 "type": "object",
                 "properties": {
-                    "files": {"type": "array", "items": {"type": "string"}},
+                    "files": {"type": "array", "items": _STRING},
                 },
                 "required": ["files"],
             },
         ),
     }
+
+
+_CAPABILITY_REGISTRY: Mapping[str, CapabilitySpec] = MappingProxyType(
+    _build_capability_registry()
+)
@@ -1,99 +1,131 @@
 """High-level use cases built on top of low-level LLM providers."""
 
+import asyncio
 import logging
+import re
 import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
-
-from d_brain.llm.base import LLMProvider, LLMProviderError, LLMResponseEnvelope
+from typing import Any
+
+from d_brain.llm.base import (
+    LLMExecutionResult,
+    LLMProvider,
+    LLMProviderError,
+    LLMResponseEnvelope,
+)
 from d_brain.services.session import SessionStore
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT = 1200  # 20 minutes
 
-
-def _daily_tool_instructions(provider_name: str, task_backend: str) -> str:
+# Shared workers for loading independent prompt context files concurrently
+_CONTEXT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prompt-context")
+
+# Telegram HTML tags converted by the weekly summary, matched in one pass
+_HTML_TAG_RE = re.compile(
+    r'<(b|i|code|s)>(.*?)</\1>|</?u>|<a href="([^"]+)">(.*?)</a>', re.DOTALL
+)
+_MARKDOWN_MARKERS = {"b": "**", "i": "*", "code": "`", "s": "~~"}
+
+# Summary links in MOC-weekly.md, capturing the linked stem
+_MOC_LINK_RE = re.compile(r"\[\[summaries/[^|\]]+\|([^\]]+)\]\]")
+
+
+def _timings(started_at: int) -> dict[str, float]:
+    """Envelope timings for a run started at *started_at* (perf_counter_ns)."""
+    # Integer millisecond truncation; no float rounding on the happy path
+    return {"total_seconds": (time.perf_counter_ns() - started_at) // 1_000_000 / 1000}
+
+
+@lru_cache(maxsize=4)
+def _iso_week_label(day: date) -> str:
+    """ISO week of *day* as ``YYYY-Www``; repeated runs in a week reuse it."""
+    year, week, _ = day.isocalendar()
+    return f"{year}-W{week:02d}"
+
+
+def _html_tag_to_markdown(match: re.Match[str]) -> str:
+    tag, inner, href, label = match.groups()
+    if tag is not None:
+        marker = _MARKDOWN_MARKERS[tag]
+        return f"{marker}{_HTML_TAG_RE.sub(_html_tag_to_markdown, inner)}{marker}"
+    if href is not None:
+        return f"[{_HTML_TAG_RE.sub(_html_tag_to_markdown, label)}]({href})"
+    return ""
+
+
+# Tool-use instructions, composed from a per-backend header, a per-use-case
+# extra rule and a shared tail. "mcp" covers the CLI providers, which reach
+# Todoist through MCP servers.
+_TOOL_HEADERS: Mapping[str, str] = {
+    "singularity": (
+        "ПЕРВЫМ ДЕЛОМ: используй MCP tools сервера Singularity из MCP_CONFIG_PATH.\n"
+        "\n"
+        "CRITICAL MCP RULE:\n"
+        "- Работай ТОЛЬКО с Singularity-интеграцией.\n"
+        "- НЕ используй Todoist tools.\n"
+    ),
+    "openai-api": (
+        "ПЕРВЫМ ДЕЛОМ: вызови todoist_user_info чтобы проверить доступ"
+        " к инструментам.\n"
+        "\n"
+        "CRITICAL TOOL RULE:\n"
+        "- Ты имеешь доступ к tools: todoist_user_info, todoist_add_tasks,"
+        " todoist_find_completed_tasks, vault_read_file, vault_write_file,"
+        " vault_list_files.\n"
+        "- ВЫЗЫВАЙ tools напрямую.\n"
+        '- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".\n'
+    ),
+    "mcp": (
+        "ПЕРВЫМ ДЕЛОМ: вызови mcp__todoist__user-info чтобы убедиться"
+        " что MCP работает.\n"
+        "\n"
+        "CRITICAL MCP RULE:\n"
+        "- ТЫ ИМЕЕШЬ ДОСТУП к mcp__todoist__* tools — ВЫЗЫВАЙ ИХ НАПРЯМУЮ.\n"
+        '- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".\n'
+    ),
+}
+
+_TOOL_EXTRAS: Mapping[str, Mapping[str, str]] = {
+    "daily": {
+        "openai-api": "- Для задач: вызови todoist_add_tasks.\n",
+        "mcp": "- Для задач: вызови mcp__todoist__add-tasks tool.\n",
+    },
+    "prompt": {},
+    "weekly": {
+        "singularity": (
+            "- Для выполненных задач используй соответствующий Singularity tool.\n"
+        ),
+        "openai-api": "- Для выполненных задач: вызови todoist_find_completed_tasks.\n",
+        "mcp": (
+            "- Для выполненных задач: вызови mcp__todoist__find-completed-tasks tool.\n"
+        ),
+    },
+}
+
+_TOOL_TAIL = "- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."
+
+
+# Every (use case, backend family) combination, assembled once at import
+_TOOL_INSTRUCTIONS: Mapping[tuple[str, str], str] = {
+    (kind, family): header + extras.get(family, "") + _TOOL_TAIL
+    for kind, extras in _TOOL_EXTRAS.items()
+    for family, header in _TOOL_HEADERS.items()
+}
+
+
+def _tool_instructions(kind: str, provider_name: str, task_backend: str) -> str:
+    """Tool-use instructions for the ``daily``, ``prompt`` or ``weekly`` use case."""
     if task_backend == "singularity":
-        return """ПЕРВЫМ ДЕЛОМ: используй MCP tools сервера Singularity из MCP_CONFIG_PATH.
-
-CRITICAL MCP RULE:
-- Работай ТОЛЬКО с Singularity-интеграцией.
-- НЕ используй Todoist tools.
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-    if provider_name == "openai-api":
-        return """ПЕРВЫМ ДЕЛОМ: вызови todoist_user_info чтобы проверить доступ к инструментам.
-
-CRITICAL TOOL RULE:
-- Ты имеешь доступ к tools: todoist_user_info, todoist_add_tasks, todoist_find_completed_tasks, vault_read_file, vault_write_file, vault_list_files.
-- ВЫЗЫВАЙ tools напрямую.
-- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".
-- Для задач: вызови todoist_add_tasks.
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-    return """ПЕРВЫМ ДЕЛОМ: вызови mcp__todoist__user-info чтобы убедиться что MCP работает.
-
-CRITICAL MCP RULE:
-- ТЫ ИМЕЕШЬ ДОСТУП к mcp__todoist__* tools — ВЫЗЫВАЙ ИХ НАПРЯМУЮ.
-- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".
-- Для задач: вызови mcp__todoist__add-tasks tool.
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-
-def _prompt_tool_instructions(provider_name: str, task_backend: str) -> str:
-    if task_backend == "singularity":
-        return """ПЕРВЫМ ДЕЛОМ: используй MCP tools сервера Singularity из MCP_CONFIG_PATH.
-
-CRITICAL MCP RULE:
-- Работай ТОЛЬКО с Singularity-интеграцией.
-- НЕ используй Todoist tools.
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-    if provider_name == "openai-api":
-        return """ПЕРВЫМ ДЕЛОМ: вызови todoist_user_info чтобы проверить доступ к инструментам.
-
-CRITICAL TOOL RULE:
-- Ты имеешь доступ к tools: todoist_user_info, todoist_add_tasks, todoist_find_completed_tasks, vault_read_file, vault_write_file, vault_list_files.
-- ВЫЗЫВАЙ tools напрямую.
-- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-    return """ПЕРВЫМ ДЕЛОМ: вызови mcp__todoist__user-info чтобы убедиться что MCP работает.
-
-CRITICAL MCP RULE:
-- ТЫ ИМЕЕШЬ ДОСТУП к mcp__todoist__* tools — ВЫЗЫВАЙ ИХ НАПРЯМУЮ.
-- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-
-def _weekly_tool_instructions(provider_name: str, task_backend: str) -> str:
-    if task_backend == "singularity":
-        return """ПЕРВЫМ ДЕЛОМ: используй MCP tools сервера Singularity из MCP_CONFIG_PATH.
-
-CRITICAL MCP RULE:
-- Работай ТОЛЬКО с Singularity-интеграцией.
-- НЕ используй Todoist tools.
-- Для выполненных задач используй соответствующий Singularity tool.
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-    if provider_name == "openai-api":
-        return """ПЕРВЫМ ДЕЛОМ: вызови todoist_user_info чтобы проверить доступ к инструментам.
-
-CRITICAL TOOL RULE:
-- Ты имеешь доступ к tools: todoist_user_info, todoist_add_tasks, todoist_find_completed_tasks, vault_read_file, vault_write_file, vault_list_files.
-- ВЫЗЫВАЙ tools напрямую.
-- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".
-- Для выполненных задач: вызови todoist_find_completed_tasks.
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
-
-    return """ПЕРВЫМ ДЕЛОМ: вызови mcp__todoist__user-info чтобы убедиться что MCP работает.
-
-CRITICAL MCP RULE:
-- ТЫ ИМЕЕШЬ ДОСТУП к mcp__todoist__* tools — ВЫЗЫВАЙ ИХ НАПРЯМУЮ.
-- НИКОГДА не пиши "MCP недоступен" или "добавь вручную".
-- Для выполненных задач: вызови mcp__todoist__find-completed-tasks tool.
-- Если tool вернул ошибку — покажи ТОЧНУЮ ошибку в отчёте."""
+        family = "singularity"
+    else:
+        family = "openai-api" if provider_name == "openai-api" else "mcp"
+    return _TOOL_INSTRUCTIONS[kind, family]
 
 
 class PromptContextLoader:
@@ -101,38 +133,70 @@ class PromptContextLoader:
 
     def __init__(self, vault_path: Path) -> None:
         self.vault_path = Path(vault_path)
+        skill_dir = self.vault_path / ".claude/skills/dbrain-processor"
+        self._skill_path = skill_dir / "SKILL.md"
+        self._todoist_reference_path = skill_dir / "references/todoist.md"
+        # path -> ((mtime_ns, size), text); files are re-read only when they change
+        self._file_cache: dict[Path, tuple[tuple[int, int], str]] = {}
+        self._session: SessionStore | None = None
+        # user_id -> ((day, mtime_ns, size), formatted session context)
+        self._session_cache: dict[int, tuple[tuple[date, int, int], str]] = {}
+
+    def _read_cached(self, path: Path) -> str:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._file_cache.pop(path, None)
+            return ""
+        version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._file_cache.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        text = path.read_text(encoding="utf-8")
+        self._file_cache[path] = (version, text)
+        return text
 
     def load_skill_content(self) -> str:
         """Load dbrain-processor skill content if present."""
-        skill_path = self.vault_path / ".claude/skills/dbrain-processor/SKILL.md"
-        if skill_path.exists():
-            return skill_path.read_text(encoding="utf-8")
-        return ""
+        return self._read_cached(self._skill_path)
 
     def load_todoist_reference(self) -> str:
         """Load Todoist reference file if present."""
-        ref_path = self.vault_path / ".claude/skills/dbrain-processor/references/todoist.md"
-        if ref_path.exists():
-            return ref_path.read_text(encoding="utf-8")
-        return ""
+        return self._read_cached(self._todoist_reference_path)
 
-    def get_session_context(self, user_id: int) -> str:
+    def get_session_context(self, user_id: int, day: date | None = None) -> str:
         """Get today's session context for prompt enrichment."""
         if user_id == 0:
             return ""
 
-        session = SessionStore(self.vault_path)
-        today_entries = session.get_today(user_id)
+        if self._session is None:
+            self._session = SessionStore(self.vault_path)
+        day = day or date.today()
+        try:
+            stat = self._session.session_file(user_id).stat()
+        except FileNotFoundError:
+            return ""
+        version = (day, stat.st_mtime_ns, stat.st_size)
+        cached = self._session_cache.get(user_id)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        context = self._format_session_context(self._session.get_today(user_id, day))
+        self._session_cache[user_id] = (version, context)
+        return context
+
+    @staticmethod
+    def _format_session_context(today_entries: list[dict[str, Any]]) -> str:
         if not today_entries:
             return ""
 
         lines = ["=== TODAY'S SESSION ==="]
         for entry in today_entries[-10:]:
+            text = entry.get("text")
+            if not text:
+                continue
             ts = entry.get("ts", "")[11:16]
-            entry_type = entry.get("type", "unknown")
-            text = entry.get("text", "")[:80]
-            if text:
-                lines.append(f"{ts} [{entry_type}] {text}")
+            lines.append(f"{ts} [{entry.get('type', 'unknown')}] {text[:80]}")
         lines.append("=== END SESSION ===\n")
         return "\n".join(lines)
 
@@ -149,32 +213,30 @@ class DailyProcessingUseCase:
         task_backend: str = "singularity",
     ) -> None:
         self.vault_path = Path(vault_path)
+        self.daily_dir = self.vault_path / "daily"
         self.provider = provider
         self.context_loader = context_loader
         self.task_backend = task_backend
 
-    def run(self, day: date | None = None) -> LLMResponseEnvelope:
-        started_at = time.monotonic()
-        if day is None:
-            day = date.today()
-
-        daily_file = self.vault_path / "daily" / f"{day.isoformat()}.md"
+    def _prepare(self, day: date, started_at: int) -> str | LLMResponseEnvelope:
+        """Build the daily prompt, or an error envelope if there is nothing to do."""
+        daily_file = self.daily_dir / f"{day.isoformat()}.md"
         if not daily_file.exists():
             logger.warning("No daily file for %s", day)
             return LLMResponseEnvelope(
                 error=f"No daily file for {day}",
                 processed_entries=0,
                 provider=self.provider.name,
-                timings={"total_seconds": round(time.monotonic() - started_at, 3)},
+                timings=_timings(started_at),
             )
 
-        prompt = f"""Сегодня {day}. Выполни ежедневную обработку.
+        return f"""Сегодня {day}. Выполни ежедневную обработку.
 
 === SKILL INSTRUCTIONS ===
 {self.context_loader.load_skill_content()}
 === END SKILL ===
 
-{_daily_tool_instructions(self.provider.name, self.task_backend)}
+{_tool_instructions("daily", self.provider.name, self.task_backend)}
 
 CRITICAL OUTPUT FORMAT:
 - Return ONLY raw HTML for Telegram (parse_mode=HTML)
@@ -183,17 +245,20 @@ CRITICAL OUTPUT FORMAT:
 - Allowed tags: <b>, <i>, <code>, <s>, <u>
 - If entries already processed, return status report in same HTML format"""
 
-        try:
-            result = self.provider.execute(prompt, timeout=DEFAULT_TIMEOUT)
-        except LLMProviderError as exc:
-            logger.error("Daily processing execution error: %s", exc)
-            return LLMResponseEnvelope(
-                error=str(exc),
-                processed_entries=0,
-                provider=self.provider.name,
-                timings={"total_seconds": round(time.monotonic() - started_at, 3)},
-            )
+    def _execution_error(
+        self, exc: LLMProviderError, started_at: int
+    ) -> LLMResponseEnvelope:
+        logger.error("Daily processing execution error: %s", exc)
+        return LLMResponseEnvelope(
+            error=str(exc),
+            processed_entries=0,
+            provider=self.provider.name,
+            timings=_timings(started_at),
+        )
 
+    def _finish(
+        self, result: LLMExecutionResult, started_at: int
+    ) -> LLMResponseEnvelope:
         if result.returncode != 0:
             logger.error("Daily processing failed: %s", result.stderr)
             return LLMResponseEnvelope(
@@ -204,7 +269,7 @@ CRITICAL OUTPUT FORMAT:
                     "returncode": result.returncode,
                     **result.meta,
                 },
-                timings={"total_seconds": round(time.monotonic() - started_at, 3)},
+                timings=_timings(started_at),
             )
 
         return LLMResponseEnvelope(
@@ -216,9 +281,37 @@ CRITICAL OUTPUT FORMAT:
                 "returncode": result.returncode,
                 **result.meta,
             },
-            timings={"total_seconds": round(time.monotonic() - started_at, 3)},
+            timings=_timings(started_at),
         )
 
+    def run(self, day: date | None = None) -> LLMResponseEnvelope:
+        started_at = time.perf_counter_ns()
+        prompt = self._prepare(day or date.today(), started_at)
+        if isinstance(prompt, LLMResponseEnvelope):
+            return prompt
+
+        try:
+            result = self.provider.execute(prompt, timeout=DEFAULT_TIMEOUT)
+        except LLMProviderError as exc:
+            return self._execution_error(exc, started_at)
+        return self._finish(result, started_at)
+
+    async def arun(self, day: date | None = None) -> LLMResponseEnvelope:
+        """Async variant of :meth:`run` using the provider's native async path.
+
+        Reading the daily note and skill file happens in a worker thread.
+        """
+        started_at = time.perf_counter_ns()
+        prompt = await asyncio.to_thread(self._prepare, day or date.today(), started_at)
+        if isinstance(prompt, LLMResponseEnvelope):
+            return prompt
+
+        try:
+            result = await self.provider.aexecute(prompt, timeout=DEFAULT_TIMEOUT)
+        except LLMProviderError as exc:
+            return self._execution_error(exc, started_at)
+        return self._finish(result, started_at)
+
 
 class ExecutePromptUseCase:
     """Arbitrary user prompt execution orchestration."""
@@ -236,13 +329,16 @@ class ExecutePromptUseCase:
         self.context_loader = context_loader
         self.task_backend = task_backend
 
-    def run(self, user_prompt: str, user_id: int = 0) -> LLMResponseEnvelope:
-        started_at = time.monotonic()
+    def _prepare(self, user_prompt: str, user_id: int) -> str:
         today = date.today()
-        session_context = self.context_loader.get_session_context(user_id)
+        # Independent reads: overlap the session log with the reference file
+        session_future = _CONTEXT_POOL.submit(
+            self.context_loader.get_session_context, user_id, today
+        )
         todoist_reference = self.context_loader.load_todoist_reference()
+        session_context = session_future.result()
 
-        prompt = f"""Ты - персональный ассистент d-brain.
+        return f"""Ты - персональный ассистент d-brain.
 
 CONTEXT:
 - Текущая дата: {today}
@@ -252,7 +348,7 @@ CONTEXT:
 {todoist_reference}
 === END REFERENCE ===
 
-{_prompt_tool_instructions(self.provider.name, self.task_backend)}
+{_tool_instructions("prompt", self.provider.name, self.task_backend)}
 
 USER REQUEST:
 {user_prompt}
@@ -269,17 +365,20 @@ EXECUTION:
 2. Call available Todoist/Vault tools directly
 3. Return HTML status report with results"""
 
-        try:
-            result = self.provider.execute(prompt, timeout=DEFAULT_TIMEOUT)
-        except LLMProviderError as exc:
-            logger.error("Prompt execution error: %s", exc)
-            return LLMResponseEnvelope(
-                error=str(exc),
-                processed_entries=0,
-                provider=self.provider.name,
-                timings={"total_seconds": round(time.monotonic() - started_at, 3)},
-            )
+    def _execution_error(
+        self, exc: LLMProviderError, started_at: int
+    ) -> LLMResponseEnvelope:
+        logger.error("Prompt execution error: %s", exc)
+        return LLMResponseEnvelope(
+            error=str(exc),
+            processed_entries=0,
+            provider=self.provider.name,
+            timings=_timings(started_at),
+        )
 
+    def _finish(
+        self, result: LLMExecutionResult, started_at: int
+    ) -> LLMResponseEnvelope:
         if result.returncode != 0:
             logger.error("Prompt execution failed: %s", result.stderr)
             return LLMResponseEnvelope(
@@ -290,7 +389,7 @@ EXECUTION:
                     "returncode": result.returncode,
                     **result.meta,
                 },
-                timings={"total_seconds": round(time.monotonic() - started_at, 3)},
+                timings=_timings(started_at),
             )
 
         return LLMResponseEnvelope(
@@ -302,9 +401,33 @@ EXECUTION:
                 "returncode": result.returncode,
                 **result.meta,
             },
-            timings={"total_seconds": round(time.monotonic() - started_at, 3)},
+            timings=_timings(started_at),
         )
 
+    def run(self, user_prompt: str, user_id: int = 0) -> LLMResponseEnvelope:
+        started_at = time.perf_counter_ns()
+        prompt = self._prepare(user_prompt, user_id)
+
+        try:
+            result = self.provider.execute(prompt, timeout=DEFAULT_TIMEOUT)
+        except LLMProviderError as exc:
+            return self._execution_error(exc, started_at)
+        return self._finish(result, started_at)
+
+    async def arun(self, user_prompt: str, user_id: int = 0) -> LLMResponseEnvelope:
+        """Async variant of :meth:`run` using the provider's native async path.
+
+        Session and reference files are read in a worker thread.
+        """
+        started_at = time.perf_counter_ns()
+        prompt = await asyncio.to_thread(self._prepare, user_prompt, user_id)
+
+        try:
+            result = await self.provider.aexecute(prompt, timeout=DEFAULT_TIMEOUT)
+        except LLMProviderError as exc:
+            return self._execution_error(exc, started_at)
+        return self._finish(result, started_at)
+
 
 class WeeklyDigestUseCase:
     """Weekly digest orchestration."""
@@ -317,34 +440,26 @@ class WeeklyDigestUseCase:
         task_backend: str = "singularity",
     ) -> None:
         self.vault_path = Path(vault_path)
+        self.summaries_dir = self.vault_path / "summaries"
+        self.moc_path = self.vault_path / "MOC" / "MOC-weekly.md"
         self.provider = provider
         self.task_backend = task_backend
 
     def _html_to_markdown(self, value: str) -> str:
         """Convert Telegram HTML to Obsidian markdown."""
-        import re
-
-        flags = re.DOTALL
-        text = value
-        text = re.sub(r"<b>(.*?)</b>", r"**\1**", text, flags=flags)
-        text = re.sub(r"<i>(.*?)</i>", r"*\1*", text, flags=flags)
-        text = re.sub(r"<code>(.*?)</code>", r"`\1`", text, flags=flags)
-        text = re.sub(r"<s>(.*?)</s>", r"~~\1~~", text, flags=flags)
-        text = re.sub(r"</?u>", "", text)
-        text = re.sub(r'<a href="([^"]+)">([^<]+)</a>', r"[\2](\1)", text)
-        return text
+        return _HTML_TAG_RE.sub(_html_tag_to_markdown, value)
 
     def _save_weekly_summary(self, report_html: str, week_date: date) -> Path:
         """Save weekly summary to vault/summaries/YYYY-WXX-summary.md."""
-        year, week, _ = week_date.isocalendar()
-        filename = f"{year}-W{week:02d}-summary.md"
-        summary_path = self.vault_path / "summaries" / filename
+        week_label = _iso_week_label(week_date)
+        filename = f"{week_label}-summary.md"
+        summary_path = self.summaries_dir / filename
 
         content = self._html_to_markdown(report_html)
         frontmatter = f"""---
 date: {week_date.isoformat()}
 type: weekly-summary
-week: {year}-W{week:02d}
+week: {week_label}
 ---
 
 """
@@ -354,30 +469,33 @@ week: {year}-W{week:02d}
         return summary_path
 
     def _update_weekly_moc(self, summary_path: Path) -> None:
-        """Append summary link to MOC-weekly.md."""
-        moc_path = self.vault_path / "MOC" / "MOC-weekly.md"
+        """Insert summary link under the ``## Previous Weeks`` anchor of MOC-weekly.md.
+
+        The MOC is read once and its existing summary links are matched
+        exactly, so a stem that merely appears in other text is not skipped.
+        """
+        moc_path = self.moc_path
         if not moc_path.exists():
             return
 
         content = moc_path.read_text(encoding="utf-8")
-        link = f"- [[summaries/{summary_path.name}|{summary_path.stem}]]"
-        if summary_path.stem in content:
+        stem = summary_path.stem
+        if stem in _MOC_LINK_RE.findall(content):
             return
 
+        link = f"- [[summaries/{summary_path.name}|{stem}]]"
         marker = "## Previous Weeks\n"
         if marker in content:
-            content = content.replace(marker, f"{marker}\n{link}\n")
+            content = content.replace(marker, f"{marker}\n{link}\n", 1)
         else:
             content = content.rstrip() + f"\n\n{link}\n"
         moc_path.write_text(content, encoding="utf-8")
-        logger.info("Updated MOC-weekly.md with link to %s", summary_path.stem)
+        logger.info("Updated MOC-weekly.md with link to %s", stem)
 
-    def run(self) -> LLMResponseEnvelope:
-        started_at = time.monotonic()
-        today = date.today()
-        prompt = f"""Сегодня {today}. Сгенерируй недельный дайджест.
+    def _prepare(self, today: date) -> str:
+        return f"""Сегодня {today}. Сгенерируй недельный дайджест.
 
-{_weekly_tool_instructions(self.provider.name, self.task_backend)}
+{_tool_instructions("weekly", self.provider.name, self.task_backend)}
 
 WORKFLOW:
 1. Собери данные за неделю (daily файлы в vault/daily/, completed tasks через доступные tools)
@@ -392,17 +510,20 @@ CRITICAL OUTPUT FORMAT:
 - Allowed tags: <b>, <i>, <code>, <s>, <u>
 - Be concise - Telegram has 4096 char limit"""
 
-        try:
-            result = self.provider.execute(prompt, timeout=DEFAULT_TIMEOUT)
-        except LLMProviderError as exc:
-            logger.error("Weekly digest execution error: %s", exc)
-            return LLMResponseEnvelope(
-                error=str(exc),
-                processed_entries=0,
-                provider=self.provider.name,
-                timings={"total_seconds": round(time.monotonic() - started_at, 3)},
-            )
+    def _execution_error(
+        self, exc: LLMProviderError, started_at: int
+    ) -> LLMResponseEnvelope:
+        logger.error("Weekly digest execution error: %s", exc)
+        return LLMResponseEnvelope(
+            error=str(exc),
+            processed_entries=0,
+            provider=self.provider.name,
+            timings=_timings(started_at),
+        )
 
+    def _finish(
+        self, result: LLMExecutionResult, today: date, started_at: int
+    ) -> LLMResponseEnvelope:
         if result.returncode != 0:
             logger.error("Weekly digest failed: %s", result.stderr)
             return LLMResponseEnvelope(
@@ -413,7 +534,7 @@ CRITICAL OUTPUT FORMAT:
                     "returncode": result.returncode,
                     **result.meta,
                 },
-                timings={"total_seconds": round(time.monotonic() - started_at, 3)},
+                timings=_timings(started_at),
             )
 
         output = result.stdout.strip()
@@ -432,5 +553,29 @@ CRITICAL OUTPUT FORMAT:
                 "returncode": result.returncode,
                 **result.meta,
             },
-            timings={"total_seconds": round(time.monotonic() - started_at, 3)},
+            timings=_timings(started_at),
         )
+
+    def run(self) -> LLMResponseEnvelope:
+        started_at = time.perf_counter_ns()
+        today = date.today()
+        prompt = self._prepare(today)
+
+        try:
+            result = self.provider.execute(prompt, timeout=DEFAULT_TIMEOUT)
+        except LLMProviderError as exc:
+            return self._execution_error(exc, started_at)
+        return self._finish(result, today, started_at)
+
+    async def arun(self) -> LLMResponseEnvelope:
+        """Async variant of :meth:`run` using the provider's native async path."""
+        started_at = time.perf_counter_ns()
+        today = date.today()
+        prompt = self._prepare(today)
+
+        try:
+            result = await self.provider.aexecute(prompt, timeout=DEFAULT_TIMEOUT)
+        except LLMProviderError as exc:
+            return self._execution_error(exc, started_at)
+        # Saving the summary and updating the MOC touch the vault
+        return await asyncio.to_thread(self._finish, result, today, started_at)
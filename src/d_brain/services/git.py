@@ -4,13 +4,30 @@ import fcntl
 import logging
 import os
 import subprocess
+import threading
 import time
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator, Literal
+from typing import TYPE_CHECKING, Iterator, Literal
+
+try:
+    import pygit2
+except ModuleNotFoundError:  # pragma: no cover - optional dependency ("git" extra)
+    pygit2 = None  # type: ignore[assignment, unused-ignore]
+
+if TYPE_CHECKING:
+    from pygit2 import Repository
 
 logger = logging.getLogger(__name__)
 
+# Quiet period after the last request_commit_and_push before the batch is committed
+COMMIT_DEBOUNCE_SECONDS = 2.0
+
+# flock polling backs off from MIN to MAX, so a released lock is noticed within MAX
+LOCK_POLL_MIN_SECONDS = 0.005
+LOCK_POLL_MAX_SECONDS = 0.05
+
 
 class VaultGit:
     """Service for git operations on vault."""
@@ -20,10 +37,15 @@ class VaultGit:
         self.git_env = {**os.environ, "GIT_DISCOVERY_ACROSS_FILESYSTEM": "1"}
         self.repo_root = self._detect_repo_root()
         self.lock_timeout_seconds = 30.0
+        self._pending_messages: list[str] = []
+        self._pending_lock = threading.Lock()
+        self._flush_timer: threading.Timer | None = None
 
+        self._repo: Repository | None = None
         if self.repo_root is not None:
             self.scope_path = self._resolve_scope_path()
             self.lock_path = self.repo_root / ".git" / "vault-git-ops.lock"
+            self._repo = self._open_repository()
             logger.info(
                 "VaultGit initialized with repo root '%s' and scope '%s'",
                 self.repo_root,
@@ -38,7 +60,18 @@ class VaultGit:
             )
 
     def _detect_repo_root(self) -> Path | None:
-        """Detect git repository root from the vault path."""
+        """Detect git repository root from the vault path.
+
+        The common case is answered by walking up to the nearest ``.git``
+        entry (a directory, or a file for worktrees and submodules) without
+        forking; ``git rev-parse`` is only consulted when that finds nothing
+        or ``GIT_DIR`` overrides discovery.
+        """
+        if "GIT_DIR" not in self.git_env:
+            for candidate in (self.vault_path, *self.vault_path.parents):
+                if (candidate / ".git").exists():
+                    return candidate
+
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "--show-toplevel"],
@@ -70,6 +103,18 @@ class VaultGit:
 
         return root
 
+    def _open_repository(self) -> "Repository | None":
+        """Open an in-process libgit2 handle when pygit2 is available."""
+        if pygit2 is None or self.repo_root is None:
+            return None
+        try:
+            return pygit2.Repository(str(self.repo_root))
+        except pygit2.GitError:
+            logger.warning(
+                "pygit2 could not open '%s'; using git subprocesses", self.repo_root
+            )
+            return None
+
     def _resolve_scope_path(self) -> str:
         """Resolve vault path relative to repository root for scoped git ops."""
         if self.repo_root is None:
@@ -94,16 +139,19 @@ class VaultGit:
         self.lock_path.parent.mkdir(parents=True, exist_ok=True)
         with self.lock_path.open("a+", encoding="utf-8") as lock_file:
             deadline = time.monotonic() + self.lock_timeout_seconds
+            delay = LOCK_POLL_MIN_SECONDS
             while True:
                 try:
                     fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
                     break
                 except BlockingIOError:
-                    if time.monotonic() >= deadline:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
                         raise TimeoutError(
                             f"Timed out acquiring git lock: {self.lock_path}"
                         )
-                    time.sleep(0.2)
+                    time.sleep(min(delay, remaining))
+                    delay = min(delay * 2, LOCK_POLL_MAX_SECONDS)
             try:
                 yield
             finally:
@@ -128,7 +176,20 @@ class VaultGit:
         )
 
     def get_status(self) -> str | None:
-        """Get git status."""
+        """Get git status in porcelain v1 format.
+
+        Uses the libgit2 handle when available; untracked files are then
+        listed individually rather than collapsed per directory.
+        """
+        if self._repo is not None:
+            changes = self._scoped_status_libgit2()
+            if changes is None:
+                return None
+            return "".join(
+                f"{_porcelain_code(flags)} {path}\n"
+                for path, flags in sorted(changes.items())
+            )
+
         status_args: list[str] = ["status", "--porcelain"]
         if self.scope_path != ".":
             status_args.extend(["--", self.scope_path])
@@ -139,16 +200,108 @@ class VaultGit:
         return result.stdout
 
     def has_changes(self) -> bool | None:
-        """Check if there are uncommitted changes."""
-        status = self.get_status()
-        if status is None:
+        """Check if there are uncommitted changes.
+
+        Only the first byte of ``git status`` output is read; the process is
+        stopped as soon as anything is reported. With pygit2 no process is
+        spawned at all.
+        """
+        if self._repo is not None:
+            changes = self._scoped_status_libgit2()
+            return None if changes is None else bool(changes)
+        if self.repo_root is None:
+            logger.error(
+                "Git status failed: no git repository for '%s'", self.vault_path
+            )
+            return None
+
+        status_args = ["git", "status", "--porcelain=v1", "-z", "--no-renames"]
+        if self.scope_path != ".":
+            status_args.extend(["--", self.scope_path])
+        process = subprocess.Popen(
+            status_args,
+            cwd=self.repo_root,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=self.git_env,
+        )
+        assert process.stdout is not None
+        if process.stdout.read(1):
+            process.kill()
+            process.communicate()
+            return True
+
+        _, stderr = process.communicate()
+        if process.returncode != 0:
+            error = stderr.decode("utf-8", errors="replace").strip()
+            logger.error("Git status failed: %s", error or "unknown error")
+            return None
+        return False
+
+    def _in_scope(self, path: str) -> bool:
+        return self.scope_path == "." or path == self.scope_path or path.startswith(
+            f"{self.scope_path}/"
+        )
+
+    def _scoped_status_libgit2(self) -> dict[str, int] | None:
+        """Status flags of changed paths inside the vault scope, or None on error."""
+        repo = self._repo
+        if repo is None:
+            return None
+        try:
+            repo.index.read()
+            return {
+                path: flags
+                for path, flags in repo.status(
+                    untracked_files="all", ignored=False
+                ).items()
+                if self._in_scope(path) and not flags & pygit2.GIT_STATUS_IGNORED
+            }
+        except pygit2.GitError as exc:
+            logger.error("Git status failed: %s", exc or "unknown error")
             return None
-        return bool(status.strip())
+
+    def _commit_changes_libgit2(
+        self, message: str
+    ) -> Literal["committed", "no_changes", "error"]:
+        """Stage scoped changes and commit through the persistent libgit2 handle."""
+        repo = self._repo
+        changes = self._scoped_status_libgit2()
+        if repo is None or changes is None:
+            return "error"
+        if not changes:
+            logger.info("No changes to commit")
+            return "no_changes"
+        try:
+            signature = repo.default_signature
+            index = repo.index
+            # Mirror `git add -A -- <scope>`: stage worktree changes; changes
+            # that exist only in the index are already staged
+            for path, flags in changes.items():
+                if flags & pygit2.GIT_STATUS_WT_DELETED:
+                    index.remove(path)
+                elif flags & _WORKTREE_STAGE_FLAGS:
+                    index.add(path)
+            index.write()
+            tree = index.write_tree()
+            parents = [] if repo.head_is_unborn else [repo.head.target]
+            repo.create_commit(
+                "HEAD", signature, signature, f"{message}\n", tree, parents
+            )
+        except (pygit2.GitError, KeyError) as exc:
+            logger.error("Git commit failed: %s", exc or "unknown error")
+            return "error"
+
+        logger.info("Committed: %s", message)
+        return "committed"
 
     def _commit_changes_detailed(
         self, message: str
     ) -> Literal["committed", "no_changes", "error"]:
         """Stage scoped changes and commit with explicit outcome."""
+        if self._repo is not None:
+            return self._commit_changes_libgit2(message)
+
         has_changes = self.has_changes()
         if has_changes is None:
             return "error"
@@ -165,7 +318,11 @@ class VaultGit:
             logger.error("Git add failed: %s", add_result.stderr.strip() or "unknown error")
             return "error"
 
-        commit_result = self._run_git("commit", "-m", message)
+        # Same commit the libgit2 path makes: no hooks, no signing, and -q
+        # skips the post-commit diffstat summary
+        commit_result = self._run_git(
+            "commit", "-q", "--no-verify", "--no-gpg-sign", "-m", message
+        )
         if commit_result.returncode != 0:
             logger.error(
                 "Git commit failed: %s", commit_result.stderr.strip() or "unknown error"
@@ -220,3 +377,82 @@ class VaultGit:
         except TimeoutError as exc:
             logger.error("Git operation lock timeout: %s", exc)
             return False
+
+    def request_commit_and_push(
+        self, message: str, *, delay: float = COMMIT_DEBOUNCE_SECONDS
+    ) -> None:
+        """Schedule a commit and push, coalescing requests made within *delay*.
+
+        Every request restarts the timer; when it fires, all queued messages
+        go into one commit and one push. Failures are logged. Changes still
+        pending at process exit stay in the working tree for the next commit.
+        """
+        with self._pending_lock:
+            self._pending_messages.append(message)
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(delay, self.flush_pending)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush_pending(self) -> bool:
+        """Commit and push queued requests now.
+
+        Returns:
+            True if successful or nothing was queued
+        """
+        with self._pending_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            messages = list(dict.fromkeys(self._pending_messages))
+            self._pending_messages.clear()
+        if not messages:
+            return True
+
+        message = messages[0]
+        if len(messages) > 1:
+            rest = "\n".join(messages[1:])
+            message = f"{message} (+{len(messages) - 1} more)\n\n{rest}"
+        pushed = self.commit_and_push(message)
+        if not pushed:
+            logger.warning("Batched git commit/push failed: %s", messages)
+        return pushed
+
+
+def _porcelain_code(flags: int) -> str:
+    """Two-letter ``git status --porcelain`` code for libgit2 status flags."""
+    if flags & pygit2.GIT_STATUS_WT_NEW and not flags & _INDEX_FLAGS:
+        return "??"
+    index = next((code for flag, code in _INDEX_CODES if flags & flag), " ")
+    worktree = next((code for flag, code in _WORKTREE_CODES if flags & flag), " ")
+    return index + worktree
+
+
+if pygit2 is not None:
+    _INDEX_CODES = (
+        (pygit2.GIT_STATUS_INDEX_NEW, "A"),
+        (pygit2.GIT_STATUS_INDEX_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_INDEX_DELETED, "D"),
+        (pygit2.GIT_STATUS_INDEX_RENAMED, "R"),
+        (pygit2.GIT_STATUS_INDEX_TYPECHANGE, "T"),
+    )
+    _WORKTREE_CODES = (
+        (pygit2.GIT_STATUS_WT_MODIFIED, "M"),
+        (pygit2.GIT_STATUS_WT_DELETED, "D"),
+        (pygit2.GIT_STATUS_WT_RENAMED, "R"),
+        (pygit2.GIT_STATUS_WT_TYPECHANGE, "T"),
+    )
+    _INDEX_FLAGS = sum(flag for flag, _ in _INDEX_CODES)
+    _WORKTREE_STAGE_FLAGS = (
+        pygit2.GIT_STATUS_WT_NEW
+        | pygit2.GIT_STATUS_WT_MODIFIED
+        | pygit2.GIT_STATUS_WT_RENAMED
+        | pygit2.GIT_STATUS_WT_TYPECHANGE
+    )
+
+
+@lru_cache(maxsize=4)
+def get_vault_git(vault_path: Path) -> VaultGit:
+    """Get cached VaultGit instance, detecting the repository only once."""
+    return VaultGit(vault_path)
@@ -1,34 +1,55 @@
 """Runtime model-provider state service (in-process singleton)."""
 
+import sys
 from typing import Final
 
+# Keys are interned so the stored active provider matches them by identity
 PROVIDER_LABELS: Final[dict[str, str]] = {
-    "openai-cli": "🤖 GPT (CLI)",
-    "claude-cli": "🧠 Claude (CLI)",
-    "openai-api": "🤖 GPT (API)",
+    sys.intern(key): label
+    for key, label in {
+        "openai-cli": "🤖 GPT (CLI)",
+        "claude-cli": "🧠 Claude (CLI)",
+        "openai-api": "🤖 GPT (API)",
+    }.items()
 }
 
 VALID_PROVIDERS: Final[frozenset[str]] = frozenset(PROVIDER_LABELS)
+_VALID_LIST_STR: Final[str] = ", ".join(sorted(VALID_PROVIDERS))
 
+
+class _LabelMap(dict[str, str]):
+    """Label table whose unknown keys map to themselves."""
+
+    __slots__ = ()
+
+    def __missing__(self, key: str) -> str:
+        return key
+
+
+_LABELS: Final[_LabelMap] = _LabelMap(PROVIDER_LABELS)
+
+# A plain module global on purpose: the selection made in one update handler
+# must be visible to every later update, which run as separate asyncio tasks
+# with copied contexts (a ContextVar would not propagate). Reads and the single
+# rebinding in set_active_provider are atomic, so no lock is needed.
 _active_provider: str | None = None
 
 
 def get_active_provider(settings_default: str) -> str:
     """Return the runtime-selected provider, falling back to *settings_default*."""
-    if _active_provider is not None:
-        return _active_provider
-    return settings_default
+    return _active_provider or settings_default
 
 
 def set_active_provider(provider: str) -> str:
     """Set *provider* as the active one.  Returns the human-readable label."""
     global _active_provider  # noqa: PLW0603
     if provider not in VALID_PROVIDERS:
-        raise ValueError(f"Invalid provider: {provider!r}. Valid: {', '.join(sorted(VALID_PROVIDERS))}")
+        raise ValueError(f"Invalid provider: {provider!r}. Valid: {_VALID_LIST_STR}")
+    provider = sys.intern(provider)
     _active_provider = provider
     return PROVIDER_LABELS[provider]
 
 
 def get_provider_label(provider: str) -> str:
     """Human-readable label for *provider*."""
-    return PROVIDER_LABELS.get(provider, provider)
+    return _LABELS[provider]
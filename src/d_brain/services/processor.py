@@ -1,6 +1,9 @@
 """High-level processor facade built on provider/use-case architecture."""
 
+import logging
+import weakref
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -11,9 +14,25 @@ from d_brain.llm import (
     LLMResponseEnvelope,
     PromptContextLoader,
     WeeklyDigestUseCase,
-    create_provider,
+    get_provider,
 )
 
+logger = logging.getLogger(__name__)
+
+# Context loaders shared by processors for the same vault, so their file and
+# session caches stay warm; dropped once no processor references them
+_loader_cache: weakref.WeakValueDictionary[Path, PromptContextLoader] = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _shared_context_loader(vault_path: Path) -> PromptContextLoader:
+    loader = _loader_cache.get(vault_path)
+    if loader is None:
+        loader = PromptContextLoader(vault_path)
+        _loader_cache[vault_path] = loader
+    return loader
+
 
 class LLMProcessor:
     """Facade for daily/weekly/arbitrary processing use cases."""
@@ -28,20 +47,26 @@ class LLMProcessor:
         openai_api_key: str = "",
         openai_model: str = "",
         openai_base_url: str = "https://api.openai.com/v1",
+        response_cache_ttl: int = 0,
+        openai_stream: bool = False,
         provider: LLMProvider | None = None,
     ) -> None:
-        self.vault_path = Path(vault_path)
-        self.provider = provider or create_provider(
-            self.vault_path,
+        self.vault_path = (
+            vault_path if isinstance(vault_path, Path) else Path(vault_path)
+        )
+        self.provider = provider or get_provider(
+            self.vault_path.absolute(),
             provider_name=provider_name,
             todoist_api_key=todoist_api_key,
             singularity_api_key=singularity_api_key,
             openai_api_key=openai_api_key,
             openai_model=openai_model,
             openai_base_url=openai_base_url,
+            response_cache_ttl=response_cache_ttl,
+            openai_stream=openai_stream,
         )
 
-        context_loader = PromptContextLoader(self.vault_path)
+        context_loader = _shared_context_loader(self.vault_path.absolute())
         self._daily_use_case = DailyProcessingUseCase(
             vault_path=self.vault_path,
             provider=self.provider,
@@ -68,6 +93,16 @@ class LLMProcessor:
         """Process daily notes (legacy dict format)."""
         return self.process_daily_result(day).to_legacy_dict()
 
+    async def aprocess_daily_result(
+        self, day: date | None = None
+    ) -> LLMResponseEnvelope:
+        """Async variant of :meth:`process_daily_result`."""
+        return await self._daily_use_case.arun(day)
+
+    async def aprocess_daily(self, day: date | None = None) -> dict[str, Any]:
+        """Async variant of :meth:`process_daily`."""
+        return (await self.aprocess_daily_result(day)).to_legacy_dict()
+
     def execute_prompt_result(self, user_prompt: str, user_id: int = 0) -> LLMResponseEnvelope:
         """Execute arbitrary user request and return typed envelope."""
         return self._prompt_use_case.run(user_prompt, user_id=user_id)
@@ -84,6 +119,93 @@ class LLMProcessor:
         """Generate weekly digest (legacy dict format)."""
         return self.generate_weekly_result().to_legacy_dict()
 
+    async def agenerate_weekly_result(self) -> LLMResponseEnvelope:
+        """Async variant of :meth:`generate_weekly_result`."""
+        return await self._weekly_use_case.arun()
+
+    async def agenerate_weekly(self) -> dict[str, Any]:
+        """Async variant of :meth:`generate_weekly`."""
+        return (await self.agenerate_weekly_result()).to_legacy_dict()
+
 
 class ClaudeProcessor(LLMProcessor):
     """Backward-compatible name for existing imports."""
+
+
+def get_processor(
+    vault_path: Path | str,
+    provider_name: str,
+    *,
+    todoist_api_key: str = "",
+    singularity_api_key: str = "",
+    task_backend: str = "singularity",
+    openai_api_key: str = "",
+    openai_model: str = "",
+    openai_base_url: str = "https://api.openai.com/v1",
+    response_cache_ttl: int = 0,
+    openai_stream: bool = False,
+) -> LLMProcessor:
+    """Get cached processor for the given provider configuration.
+
+    Handlers call this on every command; caching keeps provider objects
+    (and their HTTP clients) alive between invocations. The vault path is
+    normalized first so ``str``/``Path`` and relative spellings of the same
+    vault share one processor.
+    """
+    return _cached_processor(
+        Path(vault_path).absolute(),
+        provider_name,
+        todoist_api_key=todoist_api_key,
+        singularity_api_key=singularity_api_key,
+        task_backend=task_backend,
+        openai_api_key=openai_api_key,
+        openai_model=openai_model,
+        openai_base_url=openai_base_url,
+        response_cache_ttl=response_cache_ttl,
+        openai_stream=openai_stream,
+    )
+
+
+@lru_cache(maxsize=32)
+def _cached_processor(
+    vault_path: Path,
+    provider_name: str,
+    *,
+    todoist_api_key: str,
+    singularity_api_key: str,
+    task_backend: str,
+    openai_api_key: str,
+    openai_model: str,
+    openai_base_url: str,
+    response_cache_ttl: int,
+    openai_stream: bool,
+) -> LLMProcessor:
+    return LLMProcessor(
+        vault_path,
+        todoist_api_key,
+        singularity_api_key=singularity_api_key,
+        task_backend=task_backend,
+        provider_name=provider_name,
+        openai_api_key=openai_api_key,
+        openai_model=openai_model,
+        openai_base_url=openai_base_url,
+        response_cache_ttl=response_cache_ttl,
+        openai_stream=openai_stream,
+    )
+
+
+def warmup(
+    vault_path: Path | str, provider_name: str, **kwargs: Any
+) -> LLMProcessor | None:
+    """Build the processor for this configuration ahead of the first command.
+
+    Takes the same arguments as :func:`get_processor` and fills its cache, so
+    binary lookup, provider and HTTP client setup happen at startup. Returns
+    None, after logging a warning, when the provider is misconfigured; the
+    error then surfaces again on the first command as before.
+    """
+    try:
+        return get_processor(vault_path, provider_name, **kwargs)
+    except ValueError as exc:
+        logger.warning("Processor warm-up skipped: %s", exc)
+        return None
@@ -5,10 +5,15 @@ Inspired by Clawdbot's session persistence pattern.
 """
 
 import json
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Any
 
+try:
+    from orjson import loads as _loads
+except ModuleNotFoundError:  # pragma: no cover - depends on the environment
+    _loads = json.loads  # type: ignore[assignment, unused-ignore]
+
 
 class SessionStore:
     """Persistent session storage in JSONL format.
@@ -21,7 +26,8 @@ class SessionStore:
         self.sessions_dir = Path(vault_path) / ".sessions"
         self.sessions_dir.mkdir(exist_ok=True)
 
-    def _get_session_file(self, user_id: int) -> Path:
+    def session_file(self, user_id: int) -> Path:
+        """Path of the user's session log (may not exist yet)."""
         return self.sessions_dir / f"{user_id}.jsonl"
 
     def append(self, user_id: int, entry_type: str, **data: Any) -> None:
@@ -37,7 +43,7 @@ class SessionStore:
             "type": entry_type,
             **data,
         }
-        path = self._get_session_file(user_id)
+        path = self.session_file(user_id)
         with path.open("a", encoding="utf-8") as f:
             f.write(json.dumps(entry, ensure_ascii=False) + "\n")
 
@@ -51,31 +57,35 @@ class SessionStore:
         Returns:
             List of session entries, most recent last
         """
-        path = self._get_session_file(user_id)
+        path = self.session_file(user_id)
         if not path.exists():
             return []
 
-        entries = []
-        with path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if line.strip():
-                    try:
-                        entries.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        continue  # Skip malformed lines
-
-        return entries[-limit:]
-
-    def get_today(self, user_id: int) -> list[dict]:
+        # Parse from the end and stop once *limit* entries are collected
+        entries: list[dict[str, Any]] = []
+        for line in reversed(path.read_bytes().split(b"\n")):
+            if len(entries) >= limit:
+                break
+            if line.strip():
+                try:
+                    entries.append(_loads(line))
+                except json.JSONDecodeError:
+                    continue  # Skip malformed lines
+
+        entries.reverse()
+        return entries
+
+    def get_today(self, user_id: int, day: date | None = None) -> list[dict]:
         """Get today's session entries.
 
         Args:
             user_id: Telegram user ID
+            day: Day to select, defaults to today
 
         Returns:
             List of today's entries
         """
-        today = datetime.now().date().isoformat()
+        today = (day or datetime.now().date()).isoformat()
         return [
             e
             for e in self.get_recent(user_id, limit=200)
@@ -0,0 +1,49 @@
+"""Tests for the single-worker LLM job queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+from d_brain.bot.jobqueue import JobQueue
+
+
+async def test_job_queue_runs_jobs_one_at_a_time_in_order() -> None:
+    queue = JobQueue()
+    events: list[str] = []
+    release = asyncio.Event()
+
+    async def first() -> None:
+        events.append("first:start")
+        await release.wait()
+        events.append("first:end")
+
+    async def second() -> None:
+        events.append("second")
+
+    assert queue.submit(first) == 1
+    await asyncio.sleep(0)
+    assert queue.submit(second) == 2
+    await asyncio.sleep(0)
+    assert events == ["first:start"]
+
+    release.set()
+    await asyncio.wait_for(queue._queue.join(), timeout=1)  # noqa: SLF001
+    assert events == ["first:start", "first:end", "second"]
+    await queue.stop()
+
+
+async def test_job_queue_survives_failing_job() -> None:
+    queue = JobQueue()
+    ran: list[str] = []
+
+    async def broken() -> None:
+        raise RuntimeError("boom")
+
+    async def healthy() -> None:
+        ran.append("ok")
+
+    queue.submit(broken)
+    queue.submit(healthy)
+    await asyncio.wait_for(queue._queue.join(), timeout=1)  # noqa: SLF001
+    assert ran == ["ok"]
+    await queue.stop()
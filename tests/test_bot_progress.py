@@ -0,0 +1,48 @@
+"""Tests for handler progress heartbeat helper."""
+
+from __future__ import annotations
+
+import asyncio
+
+from d_brain.bot.progress import wait_with_progress
+
+
+class RecordingMessage:
+    """Status message double recording edit_text calls."""
+
+    def __init__(self) -> None:
+        self.edits: list[str] = []
+
+    async def edit_text(self, text: str, **kwargs: object) -> None:
+        del kwargs
+        self.edits.append(text)
+
+
+async def _sleep_then(value: str, delay: float) -> str:
+    await asyncio.sleep(delay)
+    return value
+
+
+async def test_wait_with_progress_returns_without_waiting_for_heartbeat() -> None:
+    status = RecordingMessage()
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    result = await wait_with_progress(
+        _sleep_then("done", 0.01), status, "⏳ Working...", timeout=5, interval=30
+    )
+
+    assert result == "done"
+    assert loop.time() - started < 1
+    assert status.edits == []
+
+
+async def test_wait_with_progress_edits_status_and_times_out() -> None:
+    status = RecordingMessage()
+
+    result = await wait_with_progress(
+        _sleep_then("late", 10), status, "⏳ Working...", timeout=2.5, interval=1
+    )
+
+    assert result is None
+    assert status.edits[:2] == ["⏳ Working... (0m 1s)", "⏳ Working... (0m 2s)"]
@@ -0,0 +1,85 @@
+"""Tests for outgoing Telegram request throttling."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+)
+from aiogram.methods import SendMessage
+
+from d_brain.bot.ratelimit import ChatLimiter, RateLimitMiddleware
+
+
+async def test_chat_limiter_spaces_same_chat_but_not_other_chats() -> None:
+    limiter = ChatLimiter(per_chat_rate=5, global_rate=1000, period=1.0)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+
+    for _ in range(3):
+        async with limiter(1):
+            pass
+    same_chat = loop.time() - started
+
+    started = loop.time()
+    async with limiter(2):
+        pass
+    other_chat = loop.time() - started
+
+    assert same_chat >= 0.35
+    assert other_chat < 0.1
+
+
+async def test_middleware_retries_after_flood_control() -> None:
+    method = SendMessage(chat_id=1, text="hi")
+    calls: list[int] = []
+
+    async def make_request(bot: object, request: SendMessage) -> str:
+        calls.append(1)
+        if len(calls) == 1:
+            raise TelegramRetryAfter(method=request, message="slow down", retry_after=0)
+        return "sent"
+
+    middleware = RateLimitMiddleware(ChatLimiter(global_rate=1000), max_attempts=2)
+    assert await middleware(make_request, None, method) == "sent"  # type: ignore[arg-type]
+    assert len(calls) == 2
+
+
+async def test_middleware_gives_up_after_max_attempts() -> None:
+    method = SendMessage(chat_id=1, text="hi")
+
+    async def make_request(bot: object, request: SendMessage) -> str:
+        raise TelegramRetryAfter(method=request, message="slow down", retry_after=0)
+
+    middleware = RateLimitMiddleware(ChatLimiter(global_rate=1000), max_attempts=2)
+    with pytest.raises(TelegramRetryAfter):
+        await middleware(make_request, None, method)  # type: ignore[arg-type]
+
+
+async def test_middleware_backs_off_on_network_errors_but_not_bad_requests() -> None:
+    method = SendMessage(chat_id=1, text="<b>hi")
+    calls: list[str] = []
+
+    async def flaky(bot: object, request: SendMessage) -> str:
+        calls.append("flaky")
+        if len(calls) < 3:
+            raise TelegramNetworkError(method=request, message="reset")
+        return "sent"
+
+    middleware = RateLimitMiddleware(
+        ChatLimiter(global_rate=1000), max_attempts=3, backoff_seconds=0
+    )
+    assert await middleware(flaky, None, method) == "sent"  # type: ignore[arg-type]
+    assert len(calls) == 3
+
+    async def bad_html(bot: object, request: SendMessage) -> str:
+        calls.append("bad")
+        raise TelegramBadRequest(method=request, message="can't parse entities")
+
+    with pytest.raises(TelegramBadRequest):
+        await middleware(bad_html, None, method)  # type: ignore[arg-type]
+    assert calls.count("bad") == 1
@@ -0,0 +1,92 @@
+"""Tests for report delivery helpers."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.methods import SendMessage
+
+from d_brain.bot.delivery import safe_send, send_report
+from d_brain.bot.formatters import split_html, validate_telegram_html
+
+
+class RecordingBot:
+    """Bot double that rejects HTML markup the first ``failures`` times."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.calls: list[dict[str, Any]] = []
+
+    async def send_message(self, **kwargs: Any) -> None:
+        self.calls.append(kwargs)
+        if self.failures:
+            self.failures -= 1
+            raise TelegramBadRequest(
+                method=SendMessage(chat_id=kwargs["chat_id"], text=kwargs["text"]),
+                message="can't parse entities",
+            )
+
+
+async def test_safe_send_uses_single_request_for_valid_html() -> None:
+    bot = RecordingBot()
+
+    await safe_send(bot, 1, "<b>ok</b>")  # type: ignore[arg-type]
+
+    assert len(bot.calls) == 1
+    assert "parse_mode" not in bot.calls[0]
+    assert bot.calls[0]["link_preview_options"].is_disabled
+
+
+async def test_safe_send_falls_back_to_plain_text_on_bad_markup() -> None:
+    bot = RecordingBot(failures=1)
+
+    await safe_send(bot, 1, "<b>broken")  # type: ignore[arg-type]
+
+    assert len(bot.calls) == 2
+    assert bot.calls[1]["parse_mode"] is None
+
+
+def test_split_html_cuts_on_paragraphs_and_rebalances_tags() -> None:
+    paragraphs = [f"line {n} " + "x" * 80 for n in range(60)]
+    text = (
+        '<b>Report</b>\n\n<a href="https://example.com">'
+        + "\n\n".join(paragraphs)
+        + "</a>"
+    )
+
+    parts = split_html(text, limit=1000)
+
+    assert len(parts) > 1
+    for part in parts:
+        assert len(part) <= 1000
+        assert validate_telegram_html(part)
+    assert all(part.startswith('<a href="https://example.com">') for part in parts[1:])
+    assert "".join(parts).count("line ") == 60
+
+
+def test_split_html_never_cuts_inside_a_long_opening_tag() -> None:
+    href = "https://example.com/" + "p" * 150
+    text = f'<a href="{href}">' + "word " * 80 + "</a>"
+
+    parts = split_html(text, limit=120)
+
+    assert len(parts) > 1
+    for part in parts:
+        assert part
+        assert validate_telegram_html(part)
+        assert part.startswith(f'<a href="{href}">')
+    assert "".join(parts).count("<a ") == len(parts)
+
+
+def test_split_html_keeps_short_text_intact() -> None:
+    assert split_html("<b>ok</b>") == ["<b>ok</b>"]
+
+
+async def test_send_report_sends_every_part() -> None:
+    bot = RecordingBot()
+    text = "\n\n".join("y" * 500 for _ in range(20))
+
+    await send_report(bot, 1, text)  # type: ignore[arg-type]
+
+    assert len(bot.calls) == len(split_html(text)) > 1
@@ -0,0 +1,18 @@
+"""Tests for the asyncio entrypoint helper."""
+
+from __future__ import annotations
+
+import asyncio
+
+from d_brain import eventloop
+
+
+async def _answer() -> int:
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_falls_back_to_default_loop_without_uvloop(monkeypatch) -> None:
+    monkeypatch.setattr(eventloop, "uvloop", None)
+
+    assert eventloop.run(_answer()) == 42
@@ -0,0 +1,86 @@
+"""Tests for the in-process provider response cache."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+from d_brain.llm.base import LLMExecutionResult, LLMProvider
+from d_brain.llm.cache import CachingLLMProvider
+from d_brain.llm.router import create_provider
+
+
+class CountingProvider(LLMProvider):
+    """Provider double counting calls and reporting a fixed tool usage."""
+
+    def __init__(self, *, tool_calls: int = 0, returncode: int = 0) -> None:
+        self.calls = 0
+        self.tool_calls = tool_calls
+        self.returncode = returncode
+
+    @property
+    def name(self) -> str:
+        return "counting"
+
+    def execute(self, prompt: str, *, timeout: int) -> LLMExecutionResult:
+        del timeout
+        self.calls += 1
+        return LLMExecutionResult(
+            stdout=f"answer to {prompt}",
+            stderr="",
+            returncode=self.returncode,
+            provider=self.name,
+            meta={"tool_calls": self.tool_calls},
+        )
+
+
+async def test_cache_replays_identical_tool_free_prompts() -> None:
+    inner = CountingProvider()
+    provider = CachingLLMProvider(inner)
+
+    first = provider.execute("q", timeout=5)
+    second = await provider.aexecute("q", timeout=5)
+    provider.execute("other", timeout=5)
+
+    assert inner.calls == 2
+    assert second.stdout == first.stdout
+    assert second.meta["cached"] is True
+    assert "cached" not in first.meta
+
+
+def test_cache_skips_tool_using_and_failed_results() -> None:
+    tool_user = CountingProvider(tool_calls=2)
+    failing = CountingProvider(returncode=1)
+
+    for inner in (tool_user, failing):
+        provider = CachingLLMProvider(inner)
+        provider.execute("q", timeout=5)
+        provider.execute("q", timeout=5)
+        assert inner.calls == 2
+
+
+def test_cache_evicts_least_recently_used_and_expired_entries() -> None:
+    inner = CountingProvider()
+    provider = CachingLLMProvider(inner, max_entries=1)
+    provider.execute("a", timeout=5)
+    provider.execute("b", timeout=5)
+    provider.execute("a", timeout=5)
+    assert inner.calls == 3
+
+    expired = CachingLLMProvider(inner, ttl_seconds=-1)
+    expired.execute("c", timeout=5)
+    expired.execute("c", timeout=5)
+    assert inner.calls == 5
+
+
+def test_openai_provider_is_cached_only_when_enabled(tmp_path: Path) -> None:
+    options: dict[str, Any] = {
+        "provider_name": "openai-api",
+        "openai_api_key": "key",
+        "openai_model": "m",
+    }
+
+    assert not isinstance(create_provider(tmp_path, **options), CachingLLMProvider)
+    cached = create_provider(tmp_path, response_cache_ttl=60, **options)
+    assert isinstance(cached, CachingLLMProvider)
+    assert cached.ttl_seconds == 60
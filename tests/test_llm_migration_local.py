@@ -2,23 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
 from datetime import date
 from pathlib import Path
+from typing import Any
 
+import httpx
 import pytest
 
 from d_brain.bot.formatters import format_process_report
 from d_brain.llm.base import LLMExecutionResult, LLMProvider, LLMProviderError
 from d_brain.llm.claude_cli import ClaudeCLIProvider
+from d_brain.llm.cli import CLIProvider
+from d_brain.llm.openai_api import OpenAIProvider
 from d_brain.llm.router import create_provider
+from d_brain.llm.runtime import MAX_PARALLEL_TODOIST_REQUESTS, DefaultToolRuntime
+from d_brain.llm.tools import (
+    CapabilitySpec,
+    ToolExecutionError,
+    ToolExecutionResult,
+    ToolRuntime,
+    build_capability_registry,
+)
 from d_brain.llm.use_cases import (
     DailyProcessingUseCase,
     ExecutePromptUseCase,
     PromptContextLoader,
     WeeklyDigestUseCase,
-    _daily_tool_instructions,
-    _prompt_tool_instructions,
-    _weekly_tool_instructions,
+    _tool_instructions,
 )
 from d_brain.services.session import SessionStore
 
@@ -26,6 +42,8 @@ from d_brain.services.session import SessionStore
 class StaticProvider(LLMProvider):
     """Provider test double returning deterministic results."""
 
+    __slots__ = ("_name", "_stdout", "_stderr", "_returncode", "_meta", "_exc")
+
     def __init__(
         self,
         *,
@@ -63,9 +81,9 @@ class StaticProvider(LLMProvider):
 
 def _prepare_vault(tmp_path: Path) -> Path:
     vault = tmp_path / "vault"
-    (vault / "daily").mkdir(parents=True)
-    (vault / "MOC").mkdir(parents=True)
-    (vault / "summaries").mkdir(parents=True)
+    vault.mkdir()
+    for name in ("daily", "MOC", "summaries"):
+        (vault / name).mkdir()
     return vault
 
 
@@ -137,6 +155,170 @@ def test_weekly_use_case_saves_summary_and_updates_moc(tmp_path: Path) -> None:
     assert summary_name in moc_text
 
 
+def test_context_loader_rereads_skill_only_when_changed(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    loader = PromptContextLoader(vault)
+    skill = vault / ".claude/skills/dbrain-processor/SKILL.md"
+    skill.parent.mkdir(parents=True, exist_ok=True)
+
+    assert loader.load_skill_content() == ""
+    skill.write_text("v1", encoding="utf-8")
+    assert loader.load_skill_content() == "v1"
+
+    cached_at = skill.stat().st_mtime_ns
+    skill.write_text("v2", encoding="utf-8")
+    os.utime(skill, ns=(cached_at, cached_at))
+    assert loader.load_skill_content() == "v1"
+
+    os.utime(skill, ns=(cached_at + 10**9, cached_at + 10**9))
+    assert loader.load_skill_content() == "v2"
+    skill.unlink()
+    assert loader.load_skill_content() == ""
+
+
+def test_context_loader_caches_session_context_until_log_changes(
+    monkeypatch, tmp_path: Path
+) -> None:
+    vault = _prepare_vault(tmp_path)
+    loader = PromptContextLoader(vault)
+    today = date.today()
+    store = SessionStore(vault)
+    store.append(7, "text", text="first")
+
+    reads: list[int] = []
+    original = SessionStore.get_today
+
+    def counting_get_today(self, user_id: int, day: date | None = None) -> list[dict]:
+        reads.append(user_id)
+        return original(self, user_id, day)
+
+    monkeypatch.setattr(SessionStore, "get_today", counting_get_today)
+
+    first = loader.get_session_context(7, today)
+    assert "first" in first
+    assert loader.get_session_context(7, today) == first
+    assert reads == [7]
+
+    store.append(7, "text", text="second")
+    assert "second" in loader.get_session_context(7, today)
+    assert reads == [7, 7]
+    assert loader.get_session_context(8, today) == ""
+
+
+def test_weekly_html_to_markdown_converts_nested_tags(tmp_path: Path) -> None:
+    use_case = WeeklyDigestUseCase(
+        vault_path=tmp_path, provider=StaticProvider(name="openai")
+    )
+
+    html = (
+        '<b>Week <i>12</i></b> <u>done</u> <s>old</s> <code>x</code>\n'
+        '<a href="https://e.test/a">link <b>bold</b></a> <b>multi\nline</b>'
+    )
+
+    assert use_case._html_to_markdown(html) == (
+        "**Week *12*** done ~~old~~ `x`\n"
+        "[link **bold**](https://e.test/a) **multi\nline**"
+    )
+
+
+async def test_daily_use_case_arun_matches_sync_envelope(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    today = date.today()
+    (vault / "daily" / f"{today.isoformat()}.md").write_text("entry")
+
+    use_case = DailyProcessingUseCase(
+        vault_path=vault,
+        provider=StaticProvider(stdout="<b>ok</b>"),
+        context_loader=PromptContextLoader(vault),
+    )
+
+    result = await use_case.arun(today)
+    assert result.error is None
+    assert result.report == "<b>ok</b>"
+    assert result.processed_entries == 1
+
+
+class SleepCLIProvider(CLIProvider):
+    """CLI provider double running the local interpreter instead of an LLM CLI."""
+
+    @property
+    def name(self) -> str:
+        return "sleep-cli"
+
+    def build_command(self, prompt: str) -> list[str]:
+        return [
+            sys.executable,
+            "-c",
+            f"import time; print('started'); time.sleep({prompt})",
+        ]
+
+
+async def test_cli_provider_aexecute_kills_process_on_timeout(tmp_path: Path) -> None:
+    provider = SleepCLIProvider(workdir=tmp_path)
+
+    done = await provider.aexecute("0", timeout=10)
+    assert done.returncode == 0
+    assert done.stdout.strip() == "started"
+    env = provider._spawn_env()
+    assert provider.execute("0", timeout=10).returncode == 0
+    assert provider._spawn_env() is env
+
+    with pytest.raises(LLMProviderError, match="timed out"):
+        await provider.aexecute("30", timeout=1)
+
+
+async def test_cli_provider_aexecute_reaps_process_on_cancellation(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    provider = SleepCLIProvider(workdir=tmp_path)
+    spawned: list[asyncio.subprocess.Process] = []
+    create = asyncio.create_subprocess_exec
+
+    async def recording_create(*args: Any, **kwargs: Any) -> asyncio.subprocess.Process:
+        process = await create(*args, **kwargs)
+        spawned.append(process)
+        return process
+
+    monkeypatch.setattr(asyncio, "create_subprocess_exec", recording_create)
+    task = asyncio.create_task(provider.aexecute("30", timeout=10))
+    while not spawned:
+        await asyncio.sleep(0.01)
+    task.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert spawned[0].returncode is not None
+
+
+async def test_cli_provider_aexecute_batch_runs_processes_concurrently(
+    tmp_path: Path,
+) -> None:
+    provider = SleepCLIProvider(workdir=tmp_path)
+
+    started = time.monotonic()
+    results = await provider.aexecute_batch(["0.5", "0.5", "0.5"], timeout=10)
+
+    assert time.monotonic() - started < 1.4
+    assert [result.stdout.strip() for result in results] == ["started"] * 3
+
+    with pytest.raises(LLMProviderError, match="timed out"):
+        await provider.aexecute_batch(["0", "30"], timeout=1)
+
+
+def test_cli_provider_execute_streams_chunks_and_times_out(tmp_path: Path) -> None:
+    provider = SleepCLIProvider(workdir=tmp_path)
+    chunks: list[str] = []
+
+    result = provider.execute("0", timeout=10, on_chunk=chunks.append)
+    assert chunks == ["started\n"]
+    assert result.stdout == "started\n"
+
+    started = time.monotonic()
+    with pytest.raises(LLMProviderError, match="timed out"):
+        provider.execute("30", timeout=1)
+    assert time.monotonic() - started < 5
+
+
 def test_invalid_html_report_falls_back_to_plain_text_escape() -> None:
     formatted = format_process_report({"report": "<b>broken<i>"})
     assert formatted == "&lt;b&gt;broken&lt;i&gt;"
@@ -146,7 +328,7 @@ def test_session_store_skips_corrupt_jsonl_lines(tmp_path: Path) -> None:
     vault = tmp_path / "vault"
     vault.mkdir(parents=True)
     store = SessionStore(vault)
-    path = store._get_session_file(1)  # noqa: SLF001 - explicit corruption test
+    path = store.session_file(1)
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(
         '{"ts":"2026-02-17T12:00:00+00:00","type":"text"}\n'
@@ -179,17 +361,17 @@ def test_router_validation_errors(monkeypatch, tmp_path: Path) -> None:
 
 
 def test_provider_specific_tool_instructions_switch() -> None:
-    openai_daily = _daily_tool_instructions("openai-api", "todoist")
+    openai_daily = _tool_instructions("daily", "openai-api", "todoist")
     assert "todoist_user_info" in openai_daily
     assert "mcp__todoist__" not in openai_daily
 
-    claude_prompt = _prompt_tool_instructions("claude-cli", "todoist")
+    claude_prompt = _tool_instructions("prompt", "claude-cli", "todoist")
     assert "mcp__todoist__user-info" in claude_prompt
 
-    openai_weekly = _weekly_tool_instructions("openai-api", "todoist")
+    openai_weekly = _tool_instructions("weekly", "openai-api", "todoist")
     assert "todoist_find_completed_tasks" in openai_weekly
 
-    singularity_prompt = _prompt_tool_instructions("claude-cli", "singularity")
+    singularity_prompt = _tool_instructions("prompt", "claude-cli", "singularity")
     assert "Singularity" in singularity_prompt
     assert "НЕ используй Todoist" in singularity_prompt
 
@@ -219,3 +401,713 @@ def test_handlers_keep_to_thread_for_non_blocking_policy() -> None:
         assert file_path.exists(), f"Handler file not found: {file_path}"
         content = file_path.read_text(encoding="utf-8")
         assert "asyncio.to_thread" in content
+
+
+def test_get_processor_reuses_instance_per_configuration(tmp_path: Path) -> None:
+    from d_brain.services.processor import get_processor
+
+    vault = _prepare_vault(tmp_path)
+    kwargs = {
+        "todoist_api_key": "todoist",
+        "task_backend": "todoist",
+        "openai_api_key": "sk-test",
+        "openai_model": "gpt-4o-mini",
+    }
+
+    first = get_processor(vault, "openai-api", **kwargs)
+    assert get_processor(vault, "openai-api", **kwargs) is first
+    assert get_processor(str(vault), "openai-api", **kwargs) is first
+    assert (
+        get_processor(vault, "openai-api", **{**kwargs, "openai_model": "other"})
+        is not first
+    )
+    other_backend = get_processor(
+        vault, "openai-api", **{**kwargs, "task_backend": "singularity"}
+    )
+    assert other_backend is not first
+    assert other_backend.provider is first.provider
+    assert (
+        other_backend._prompt_use_case.context_loader
+        is first._daily_use_case.context_loader
+    )
+
+
+def test_openai_provider_reuses_pooled_client_across_calls() -> None:
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(f"{request.url} {request.headers['Authorization']}")
+        return httpx.Response(
+            200, json={"id": "r", "choices": [{"message": {"content": "ok"}}]}
+        )
+
+    with OpenAIProvider(
+        api_key="key", model="m", base_url="https://llm.test/v1/"
+    ) as provider:
+        client = provider._get_client()
+        client._transport = httpx.MockTransport(handler)
+
+        assert provider.execute("one", timeout=5).stdout == "ok"
+        assert provider.execute("two", timeout=5).stdout == "ok"
+        assert provider._get_client() is client
+
+    assert seen == ["https://llm.test/v1/chat/completions Bearer key"] * 2
+    assert provider._client is None
+
+
+class SlowEchoRuntime(ToolRuntime):
+    """Tool runtime double that takes a fixed time per call."""
+
+    def execute(self, capability: str, payload: dict) -> ToolExecutionResult:
+        time.sleep(0.2)
+        if payload.get("fail"):
+            return ToolExecutionResult(
+                capability=capability,
+                ok=False,
+                error=ToolExecutionError(code="boom", message="failed"),
+            )
+        return ToolExecutionResult(capability=capability, ok=True, data=payload)
+
+
+def test_openai_provider_runs_turn_tool_calls_concurrently_in_order() -> None:
+    sent: list[list[dict]] = []
+    tool_calls = [
+        {
+            "id": f"c{n}",
+            "function": {
+                "name": "vault_read_file",
+                "arguments": json.dumps({"path": f"{n}.md", "n": n, "fail": n == 1}),
+            },
+        }
+        for n in range(4)
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        messages = json.loads(request.content)["messages"]
+        sent.append(messages)
+        if len(sent) == 1:
+            message = {"content": None, "tool_calls": tool_calls}
+        else:
+            message = {"content": "done"}
+        return httpx.Response(200, json={"choices": [{"message": message}]})
+
+    provider = OpenAIProvider(
+        api_key="key",
+        model="m",
+        tool_runtime=SlowEchoRuntime(),
+        capability_registry=build_capability_registry(),
+    )
+    provider._get_client()._transport = httpx.MockTransport(handler)
+
+    started = time.monotonic()
+    result = provider.execute("go", timeout=5)
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.6
+    tool_messages = [m for m in sent[1] if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["c0", "c1", "c2", "c3"]
+    assert json.loads(tool_messages[2]["content"])["data"]["n"] == 2
+    assert result.meta["tool_failures"] == [
+        {
+            "capability": "vault.read_file",
+            "error": {
+                "code": "boom",
+                "message": "failed",
+                "retryable": False,
+                "details": {},
+            },
+        }
+    ]
+
+
+async def test_openai_provider_aexecute_awaits_tool_calls_concurrently() -> None:
+    calls = iter(
+        [
+            {
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": f"c{n}",
+                        "function": {
+                            "name": "vault_read_file",
+                            "arguments": '{"path": "a.md"}',
+                        },
+                    }
+                    for n in range(3)
+                ],
+            },
+            {"content": "async done"},
+        ]
+    )
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        del request
+        return httpx.Response(200, json={"choices": [{"message": next(calls)}]})
+
+    provider = OpenAIProvider(
+        api_key="key",
+        model="m",
+        tool_runtime=SlowEchoRuntime(),
+        capability_registry=build_capability_registry(),
+    )
+    provider._get_async_client()._transport = httpx.MockTransport(handler)
+
+    started = time.monotonic()
+    result = await provider.aexecute("go", timeout=5)
+    await provider.aclose()
+
+    assert result.stdout == "async done"
+    assert time.monotonic() - started < 0.5
+
+
+class FlagRuntime(ToolRuntime):
+    """Tool runtime double that records calls and signals the first one."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+        self.first_call = threading.Event()
+        self.first_acall = asyncio.Event()
+
+    def execute(self, capability: str, payload: dict) -> ToolExecutionResult:
+        self.calls.append(payload)
+        self.first_call.set()
+        return ToolExecutionResult(capability=capability, ok=True, data=payload)
+
+    async def aexecute(self, capability: str, payload: dict) -> ToolExecutionResult:
+        self.first_acall.set()
+        return self.execute(capability, payload)
+
+
+def _sse(delta: dict[str, Any], finish: str | None = None) -> bytes:
+    chunk = {"id": "s", "choices": [{"delta": delta, "finish_reason": finish}]}
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+def _tool_delta(index: int, path: str) -> dict[str, Any]:
+    function = {"name": "vault_read_file", "arguments": json.dumps({"path": path})}
+    return {"tool_calls": [{"index": index, "id": f"c{index}", "function": function}]}
+
+
+_FINAL_TURN = _sse({"content": "str"}) + _sse({"content": "eamed"}, "stop")
+
+
+def _streaming_provider(tmp_path: Path, runtime: ToolRuntime) -> OpenAIProvider:
+    provider = create_provider(
+        _prepare_vault(tmp_path),
+        provider_name="openai-api",
+        openai_api_key="key",
+        openai_model="m",
+        openai_stream=True,
+    )
+    assert isinstance(provider, OpenAIProvider)
+    provider.tool_runtime = runtime
+    return provider
+
+
+def test_openai_provider_streams_and_starts_tool_calls_early(tmp_path: Path) -> None:
+    runtime = FlagRuntime()
+    started_early: list[bool] = []
+    bodies: list[dict[str, Any]] = []
+
+    def first_turn():
+        yield _sse(_tool_delta(0, "a.md"))
+        yield _sse(_tool_delta(1, "b.md"))
+        # Call 0 is complete once call 1 begins, so it runs before the turn ends
+        started_early.append(runtime.first_call.wait(2))
+        yield _sse({}, "tool_calls")
+        yield b"data: [DONE]\n\n"
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        content = first_turn() if len(bodies) == 1 else iter([_FINAL_TURN])
+        return httpx.Response(200, content=content)
+
+    provider = _streaming_provider(tmp_path, runtime)
+    provider._get_client()._transport = httpx.MockTransport(handler)
+
+    result = provider.execute("go", timeout=5)
+
+    assert result.stdout == "streamed"
+    assert started_early == [True]
+    assert runtime.calls == [{"path": "a.md"}, {"path": "b.md"}]
+    assert all(body["stream"] for body in bodies)
+    tool_messages = [m for m in bodies[1]["messages"] if m["role"] == "tool"]
+    assert [m["tool_call_id"] for m in tool_messages] == ["c0", "c1"]
+
+
+async def test_openai_provider_astreams_and_starts_tool_calls_early(
+    tmp_path: Path,
+) -> None:
+    runtime = FlagRuntime()
+    started_early: list[bool] = []
+    requests_seen = 0
+
+    async def first_turn():
+        yield _sse(_tool_delta(0, "a.md"))
+        yield _sse(_tool_delta(1, "b.md"))
+        try:
+            await asyncio.wait_for(runtime.first_acall.wait(), 2)
+            started_early.append(True)
+        except TimeoutError:
+            started_early.append(False)
+        yield _sse({}, "tool_calls")
+
+    async def final_turn():
+        yield _FINAL_TURN
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal requests_seen
+        requests_seen += 1
+        assert json.loads(request.content)["stream"] is True
+        content = first_turn() if requests_seen == 1 else final_turn()
+        return httpx.Response(200, content=content)
+
+    provider = _streaming_provider(tmp_path, runtime)
+    provider._get_async_client()._transport = httpx.MockTransport(handler)
+
+    result = await provider.aexecute("go", timeout=5)
+    await provider.aclose()
+
+    assert result.stdout == "streamed"
+    assert started_early == [True]
+    assert runtime.calls == [{"path": "a.md"}, {"path": "b.md"}]
+
+
+def test_openai_provider_stream_reports_http_errors(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        del request
+        return httpx.Response(429, content=iter([b"rate limited"]))
+
+    provider = _streaming_provider(tmp_path, FlagRuntime())
+    provider._get_client()._transport = httpx.MockTransport(handler)
+
+    with pytest.raises(LLMProviderError, match="429: rate limited"):
+        provider.execute("go", timeout=5)
+
+
+async def test_runtime_aexecute_creates_tasks_concurrently(tmp_path: Path) -> None:
+    bodies: list[dict] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        return httpx.Response(200, json={"id": len(bodies), "content": body["content"]})
+
+    runtime = DefaultToolRuntime(vault_path=tmp_path, todoist_api_key="token")
+    runtime._todoist_async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    result = await runtime.aexecute(
+        "todoist.add_tasks",
+        {"tasks": [{"content": "a"}, {"content": "b", "priority": 2}]},
+    )
+    await runtime.aclose()
+
+    assert result.ok
+    assert [task["content"] for task in result.data["created"]] == ["a", "b"]
+    assert {"content": "b", "priority": 2} in bodies
+
+
+async def test_runtime_aexecute_bounds_concurrency_and_reports_failed_tasks(
+    tmp_path: Path,
+) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        body = json.loads(request.content)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if body["content"] == "t3":
+            return httpx.Response(500, text="boom")
+        return httpx.Response(
+            200, json={"id": body["content"], "content": body["content"]}
+        )
+
+    runtime = DefaultToolRuntime(vault_path=tmp_path, todoist_api_key="token")
+    runtime._todoist_async_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+    tasks = [{"content": f"t{n}"} for n in range(MAX_PARALLEL_TODOIST_REQUESTS * 2)]
+    result = await runtime.aexecute("todoist.add_tasks", {"tasks": tasks})
+    await runtime.aclose()
+
+    assert result.ok
+    assert peak <= MAX_PARALLEL_TODOIST_REQUESTS
+    assert len(result.data["created"]) == len(tasks) - 1
+    assert result.data["failed"] == [
+        {
+            "content": "t3",
+            "error": {
+                "code": "todoist_api_error",
+                "message": "Todoist API error 500",
+                "retryable": True,
+            },
+        }
+    ]
+
+
+def test_runtime_add_tasks_fails_when_no_task_is_created(tmp_path: Path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        del request
+        return httpx.Response(403, text="forbidden")
+
+    runtime = DefaultToolRuntime(vault_path=tmp_path, todoist_api_key="token")
+    runtime._todoist_client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    result = runtime.execute(
+        "todoist.add_tasks", {"tasks": [{"content": "a"}, {"content": "b"}]}
+    )
+    runtime.close()
+
+    assert not result.ok
+    assert result.error is not None
+    assert result.error.code == "todoist_api_error"
+
+
+def test_openai_provider_sends_precomputed_tool_schemas() -> None:
+    bodies: list[dict] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"choices": [{"message": {"content": "ok"}}]})
+
+    with OpenAIProvider(
+        api_key="key", model="m", capability_registry=build_capability_registry()
+    ) as provider:
+        provider._get_client()._transport = httpx.MockTransport(handler)
+        provider.execute("привет", timeout=5)
+
+    assert bodies[0]["messages"] == [{"role": "user", "content": "привет"}]
+    assert bodies[0]["tool_choice"] == "auto"
+    assert [tool["function"]["name"] for tool in bodies[0]["tools"]] == [
+        name.replace(".", "_") for name in build_capability_registry()
+    ]
+
+
+def test_runtime_list_files_returns_first_sorted_matches(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    for name in ("2026-01-03", "2026-01-01", "2026-01-02"):
+        (vault / "daily" / f"{name}.md").write_text("x")
+    (vault / "daily" / "notes.txt").write_text("x")
+    (vault / ".git").mkdir()
+    (vault / ".git" / "HEAD.md").write_text("x")
+
+    runtime = DefaultToolRuntime(vault_path=vault)
+    listed = runtime.execute("vault.list_files", {"pattern": "*.md", "limit": 2})
+    nested = runtime.execute("vault.list_files", {"dir": ".", "pattern": "daily/*.md"})
+
+    assert listed.data == {"files": ["daily/2026-01-01.md", "daily/2026-01-02.md"]}
+    assert nested.data["files"] == [
+        "daily/2026-01-01.md",
+        "daily/2026-01-02.md",
+        "daily/2026-01-03.md",
+    ]
+
+
+def _rglob_files(root: Path, pattern: str) -> list[str]:
+    return sorted(
+        str(path.relative_to(root)) for path in root.rglob(pattern) if path.is_file()
+    )
+
+
+@pytest.mark.parametrize("pattern", ["**/*.md", "daily/*.md", "*.md", "daily/**/*.md"])
+def test_runtime_list_files_matches_rglob_segments(
+    tmp_path: Path, pattern: str
+) -> None:
+    vault = _prepare_vault(tmp_path)
+    (vault / "top.md").write_text("x")
+    (vault / "daily" / "2026-01-01.md").write_text("x")
+    (vault / "daily" / "sub").mkdir()
+    (vault / "daily" / "sub" / "deep.md").write_text("x")
+    (vault / "archive" / "daily").mkdir(parents=True)
+    (vault / "archive" / "daily" / "old.md").write_text("x")
+
+    runtime = DefaultToolRuntime(vault_path=vault)
+    listed = runtime.execute("vault.list_files", {"pattern": pattern})
+
+    assert listed.data["files"] == _rglob_files(vault, pattern)
+
+
+def test_runtime_list_files_pattern_segments_do_not_cross_directories(
+    tmp_path: Path,
+) -> None:
+    vault = _prepare_vault(tmp_path)
+    (vault / "top.md").write_text("x")
+    (vault / "daily" / "a.md").write_text("x")
+    (vault / "daily" / "sub").mkdir()
+    (vault / "daily" / "sub" / "b.md").write_text("x")
+
+    runtime = DefaultToolRuntime(vault_path=vault)
+    recursive = runtime.execute("vault.list_files", {"pattern": "**/*.md"})
+    direct = runtime.execute("vault.list_files", {"pattern": "daily/*.md"})
+
+    assert "top.md" in recursive.data["files"]
+    assert direct.data["files"] == ["daily/a.md"]
+
+
+def test_runtime_list_files_lists_symlinked_files_but_skips_symlinked_dirs(
+    tmp_path: Path,
+) -> None:
+    vault = _prepare_vault(tmp_path)
+    (vault / "real.md").write_text("x")
+    (vault / "alias.md").symlink_to(vault / "real.md")
+    (vault / "linked").symlink_to(vault / "daily", target_is_directory=True)
+    (vault / "daily" / "a.md").write_text("x")
+
+    runtime = DefaultToolRuntime(vault_path=vault)
+    listed = runtime.execute("vault.list_files", {"pattern": "*.md"})
+
+    assert listed.data["files"] == ["alias.md", "daily/a.md", "real.md"]
+
+
+def test_runtime_write_file_reports_encoded_size(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    runtime = DefaultToolRuntime(vault_path=vault)
+
+    first = runtime.execute(
+        "vault.write_file", {"path": "notes/a.md", "content": "привет\n"}
+    )
+    second = runtime.execute(
+        "vault.write_file", {"path": "notes/a.md", "content": "ok", "mode": "append"}
+    )
+
+    assert first.data == {"path": "notes/a.md", "writtenBytes": 13}
+    assert second.data == {"path": "notes/a.md", "writtenBytes": 2}
+    assert (vault / "notes" / "a.md").read_text(encoding="utf-8") == "привет\nok"
+
+
+def test_runtime_append_reopens_replaced_file(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    note = vault / "log.md"
+
+    runtime = DefaultToolRuntime(vault_path=vault)
+    append = {"path": "log.md", "content": "a", "mode": "append"}
+    runtime.execute("vault.write_file", append)
+    runtime.execute("vault.write_file", append)
+    assert note.read_text(encoding="utf-8") == "aa"
+
+    replacement = vault / "log.tmp"
+    replacement.write_text("saved;", encoding="utf-8")
+    replacement.replace(note)
+    runtime.execute("vault.write_file", append)
+
+    assert note.read_text(encoding="utf-8") == "saved;a"
+    assert len(runtime._append_fds) == 1
+    runtime.close()
+    assert runtime._append_fds == {}
+
+
+def test_runtime_rejects_paths_outside_vault(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    runtime = DefaultToolRuntime(vault_path=vault)
+
+    for _ in range(2):
+        result = runtime.execute("vault.read_file", {"path": "../secret.md"})
+        assert result.ok is False
+        assert result.error is not None and result.error.code == "path_outside_vault"
+
+    unknown = runtime.execute("vault.delete_file", {"path": "a.md"})
+    assert unknown.error is not None and unknown.error.code == "unsupported_capability"
+
+
+def test_runtime_strict_symlinks_controls_symlink_escape(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "note.md").write_text("external", encoding="utf-8")
+    (vault / "linked").symlink_to(outside, target_is_directory=True)
+
+    strict = DefaultToolRuntime(vault_path=vault)
+    lexical = DefaultToolRuntime(vault_path=vault, strict_symlinks=False)
+
+    blocked = strict.execute("vault.read_file", {"path": "linked/note.md"})
+    assert blocked.error is not None and blocked.error.code == "path_outside_vault"
+    assert (
+        lexical.execute("vault.read_file", {"path": "linked/note.md"}).data["content"]
+        == "external"
+    )
+    escaped = lexical.execute("vault.read_file", {"path": "daily/../../secret.md"})
+    assert escaped.error is not None and escaped.error.code == "path_outside_vault"
+
+
+def test_runtime_rechecks_symlinks_swapped_in_after_a_write(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    runtime = DefaultToolRuntime(vault_path=vault)
+
+    first = runtime.execute(
+        "vault.write_file", {"path": "notes/x.md", "content": "one"}
+    )
+    assert first.ok
+    (vault / "notes" / "x.md").unlink()
+    (vault / "notes").rmdir()
+    (vault / "notes").symlink_to(outside, target_is_directory=True)
+
+    second = runtime.execute(
+        "vault.write_file", {"path": "notes/x.md", "content": "two"}
+    )
+    assert second.error is not None and second.error.code == "path_outside_vault"
+    assert not (outside / "x.md").exists()
+
+
+def test_capability_registry_is_shared_and_read_only() -> None:
+    registry = build_capability_registry()
+
+    assert build_capability_registry() is registry
+    with pytest.raises(TypeError):
+        registry["custom.tool"] = registry["vault.read_file"]  # type: ignore[index]
+    assert "custom.tool" not in build_capability_registry()
+
+
+def test_openai_provider_rejects_arguments_failing_compiled_validator() -> None:
+    def reject_all(payload: dict) -> dict:
+        raise ValueError(f"data must be valid, got {sorted(payload)}")
+
+    spec = build_capability_registry()["vault.read_file"]
+    strict_spec = CapabilitySpec(
+        name=spec.name,
+        description=spec.description,
+        input_schema=spec.input_schema,
+        output_schema=spec.output_schema,
+    )
+    object.__setattr__(strict_spec, "input_validator", reject_all)
+    provider = OpenAIProvider(
+        api_key="key",
+        model="m",
+        tool_runtime=SlowEchoRuntime(),
+        capability_registry={"vault.read_file": strict_spec},
+    )
+
+    turn = provider._prepare_tool_calls(
+        [
+            {
+                "id": "c0",
+                "function": {"name": "vault_read_file", "arguments": '{"nope": 1}'},
+            }
+        ]
+    )
+
+    assert turn.pending == []
+    assert turn.outputs[0]["error"]["code"] == "invalid_tool_arguments"
+    assert "got ['nope']" in turn.outputs[0]["error"]["message"]
+
+
+def test_weekly_moc_inserts_new_weeks_under_anchor_once(tmp_path: Path) -> None:
+    vault = _prepare_vault(tmp_path)
+    moc = vault / "MOC" / "MOC-weekly.md"
+    old_link = "- [[summaries/2024-W01-summary.md|2024-W01-summary]]"
+    footer = "---\n*Updated automatically by the processor*\n"
+    moc.write_text(
+        "# Weekly\n\nSee 2024-W03-summary notes.\n\n"
+        f"## Previous Weeks\n\n{old_link}\n\n{footer}"
+    )
+    use_case = WeeklyDigestUseCase(
+        vault_path=vault, provider=StaticProvider(name="openai")
+    )
+
+    for week in ("2024-W02", "2024-W03", "2024-W03"):
+        use_case._update_weekly_moc(vault / "summaries" / f"{week}-summary.md")
+
+    text = moc.read_text()
+    new_link = "- [[summaries/2024-W03-summary.md|2024-W03-summary]]"
+    assert text.count(new_link) == 1
+    assert text.index("## Previous Weeks") < text.index(new_link)
+    order = (new_link, "2024-W02-summary.md", old_link)
+    positions = [text.index(part) for part in order]
+    assert positions == sorted(positions)
+    assert text.endswith(footer)
+    assert list((vault / "MOC").iterdir()) == [moc]
+
+
+def test_empty_arguments_skip_validation_for_optional_only_capabilities() -> None:
+    registry = build_capability_registry()
+    assert registry["todoist.user_info"].input_trivially_empty
+    assert registry["vault.list_files"].input_trivially_empty
+    assert not registry["vault.read_file"].input_trivially_empty
+
+    def reject_all(payload: dict) -> dict:
+        raise ValueError("validator should not run")
+
+    spec = registry["todoist.user_info"]
+    optional_spec = CapabilitySpec(
+        name=spec.name,
+        description=spec.description,
+        input_schema=spec.input_schema,
+        output_schema=spec.output_schema,
+    )
+    object.__setattr__(optional_spec, "input_validator", reject_all)
+    provider = OpenAIProvider(
+        api_key="key",
+        model="m",
+        tool_runtime=SlowEchoRuntime(),
+        capability_registry={"todoist.user_info": optional_spec},
+    )
+
+    turn = provider._prepare_tool_calls(
+        [{"id": "c0", "function": {"name": "todoist_user_info", "arguments": ""}}]
+    )
+
+    assert "error" not in turn.outputs[0]
+    assert len(turn.pending) == 1
+
+
+def test_compiled_validator_rejects_bad_args_and_skips_empty_optional_calls() -> None:
+    pytest.importorskip("fastjsonschema")
+    registry = build_capability_registry()
+    assert all(spec.input_validator is not None for spec in registry.values())
+    provider = OpenAIProvider(
+        api_key="key",
+        model="m",
+        tool_runtime=SlowEchoRuntime(),
+        capability_registry=registry,
+    )
+
+    turn = provider._prepare_tool_calls(
+        [
+            {
+                "id": "c0",
+                "function": {"name": "vault_read_file", "arguments": '{"path": 1}'},
+            },
+            {"id": "c1", "function": {"name": "vault_read_file", "arguments": "{}"}},
+            {
+                "id": "c2",
+                "function": {
+                    "name": "vault_read_file",
+                    "arguments": '{"path": "a.md"}',
+                },
+            },
+            {"id": "c3", "function": {"name": "todoist_user_info", "arguments": ""}},
+        ]
+    )
+
+    assert [output.get("error", {}).get("code") for output in turn.outputs] == [
+        "invalid_tool_arguments",
+        "invalid_tool_arguments",
+        None,
+        None,
+    ]
+    assert [capability for _, capability, _ in turn.pending] == [
+        "vault.read_file",
+        "todoist.user_info",
+    ]
+
+
+def test_warmup_fills_processor_cache_and_tolerates_misconfiguration(
+    tmp_path: Path,
+) -> None:
+    from d_brain.services.processor import get_processor, warmup
+
+    vault = _prepare_vault(tmp_path)
+    kwargs = {"openai_api_key": "sk-test", "openai_model": "warm-model"}
+
+    warm = warmup(vault, "openai-api", **kwargs)
+    assert warm is not None
+    assert get_processor(vault, "openai-api", **kwargs) is warm
+    assert warmup(vault, "openai-api", openai_model="warm-model") is None
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import subprocess
 from pathlib import Path
 
+import pytest
+
 from d_brain.services.git import VaultGit
 
 
@@ -12,19 +16,19 @@ _GIT_ISOLATED_ENV = {
     "GIT_CONFIG_GLOBAL": "/dev/null",
     "GIT_CONFIG_SYSTEM": "/dev/null",
 }
+# Built once: no test in this module changes the environment git runs with
+_GIT_ENV = {**os.environ, **_GIT_ISOLATED_ENV}
+_GIT_BIN = shutil.which("git") or "git"
 
 
 def _git(cwd: Path, *args: str) -> subprocess.CompletedProcess[str]:
-    import os
-
-    env = {**os.environ, **_GIT_ISOLATED_ENV}
     return subprocess.run(
-        ["git", *args],
+        [_GIT_BIN, *args],
         cwd=cwd,
         capture_output=True,
         text=True,
         check=False,
-        env=env,
+        env=_GIT_ENV,
     )
 
 
@@ -37,8 +41,9 @@ def _init_repo(tmp_path: Path, *, with_identity: bool = True) -> tuple[Path, Pat
     assert init.returncode == 0, init.stderr
 
     if with_identity:
-        assert _git(repo, "config", "user.email", "bot@example.com").returncode == 0
-        assert _git(repo, "config", "user.name", "Bot").returncode == 0
+        # Written directly instead of two `git config` processes
+        with (repo / ".git" / "config").open("a", encoding="utf-8") as config:
+            config.write("[user]\n\temail = bot@example.com\n\tname = Bot\n")
 
     (repo / "README.md").write_text("init\n", encoding="utf-8")
     (vault / "daily.md").write_text("start\n", encoding="utf-8")
@@ -97,3 +102,174 @@ def test_commit_and_push_returns_true_when_no_changes(tmp_path: Path) -> None:
 
     git = VaultGit(vault)
     assert git.commit_and_push("chore: no changes") is True
+
+
+def test_commit_changes_uses_subprocess_fallback_without_pygit2(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr("d_brain.services.git.pygit2", None)
+    repo, vault = _init_repo(tmp_path)
+
+    (vault / "daily.md").unlink()
+    (vault / "new.md").write_text("new\n", encoding="utf-8")
+    (repo / "outside.txt").write_text("should stay uncommitted\n", encoding="utf-8")
+
+    git = VaultGit(vault)
+    assert git.commit_changes("chore: fallback commit") is True
+
+    changed = _git(repo, "show", "--name-status", "--pretty=format:", "HEAD")
+    assert "D\tvault/daily.md" in changed.stdout
+    assert "A\tvault/new.md" in changed.stdout
+    assert "outside.txt" not in changed.stdout
+
+
+def test_commit_changes_libgit2_stages_scope_like_git_add(tmp_path: Path) -> None:
+    pytest.importorskip("pygit2")
+    repo, vault = _init_repo(tmp_path)
+    (vault / "keep.md").write_text("keep\n", encoding="utf-8")
+    assert _git(repo, "add", "-A").returncode == 0
+    assert _git(repo, "commit", "-m", "keep").returncode == 0
+
+    (vault / "daily.md").write_text("updated\n", encoding="utf-8")
+    (vault / "keep.md").unlink()
+    (vault / "sub").mkdir()
+    (vault / "sub" / "new.md").write_text("new\n", encoding="utf-8")
+    (repo / "outside.txt").write_text("should stay uncommitted\n", encoding="utf-8")
+
+    git = VaultGit(vault)
+    assert git._repo is not None
+    assert git.commit_changes("chore: libgit2 commit") is True
+    assert git.commit_changes("chore: nothing left") is False
+
+    changed = _git(repo, "show", "--name-status", "--pretty=format:", "HEAD")
+    assert set(changed.stdout.split("\n")) - {""} == {
+        "M\tvault/daily.md",
+        "D\tvault/keep.md",
+        "A\tvault/sub/new.md",
+    }
+    assert (
+        _git(repo, "log", "-1", "--format=%s").stdout.strip() == "chore: libgit2 commit"
+    )
+    status = _git(repo, "status", "--porcelain")
+    assert status.stdout == "?? outside.txt\n"
+
+
+def test_get_status_libgit2_matches_git_porcelain(tmp_path: Path) -> None:
+    pytest.importorskip("pygit2")
+    repo, vault = _init_repo(tmp_path)
+    (vault / "gone.md").write_text("to be deleted\n", encoding="utf-8")
+    (vault / "both.md").write_text("base\n", encoding="utf-8")
+    assert _git(repo, "add", "-A").returncode == 0
+    assert _git(repo, "commit", "-m", "more").returncode == 0
+
+    (vault / "daily.md").write_text("modified\n", encoding="utf-8")
+    (vault / "gone.md").unlink()
+    (vault / "both.md").write_text("staged\n", encoding="utf-8")
+    (vault / "staged.md").write_text("brand new\n", encoding="utf-8")
+    assert _git(repo, "add", "vault/both.md", "vault/staged.md").returncode == 0
+    (vault / "both.md").write_text("staged, then edited\n", encoding="utf-8")
+    (vault / "sub").mkdir()
+    (vault / "sub" / "untracked.md").write_text("untracked\n", encoding="utf-8")
+    (repo / "outside.txt").write_text("out of scope\n", encoding="utf-8")
+
+    git = VaultGit(vault)
+    assert git._repo is not None
+
+    expected = _git(
+        repo, "status", "--porcelain", "--untracked-files=all", "--", "vault"
+    )
+    assert git.get_status() == expected.stdout
+    assert "MM vault/both.md" in expected.stdout
+
+
+def test_request_commit_and_push_coalesces_into_one_commit(tmp_path: Path) -> None:
+    repo, vault = _init_repo(tmp_path)
+    git = VaultGit(vault)
+    git.push = lambda: True  # no remote in the test repository
+
+    (vault / "daily.md").write_text("one\n", encoding="utf-8")
+    git.request_commit_and_push("chore: first", delay=60)
+    (vault / "weekly.md").write_text("two\n", encoding="utf-8")
+    git.request_commit_and_push("chore: second", delay=60)
+
+    assert git.flush_pending() is True
+    assert git.flush_pending() is True
+
+    assert _git(repo, "rev-list", "--count", "HEAD").stdout.strip() == "2"
+    log = _git(repo, "log", "--format=%B", "-n", "1")
+    subject, *body = log.stdout.strip().splitlines()
+    assert subject == "chore: first (+1 more)"
+    assert body == ["", "chore: second"]
+    assert _git(repo, "status", "--porcelain").stdout == ""
+
+
+def test_has_changes_reports_scoped_dirty_state(tmp_path: Path) -> None:
+    repo, vault = _init_repo(tmp_path)
+    git = VaultGit(vault)
+
+    (repo / "outside.txt").write_text("ignored by scope\n", encoding="utf-8")
+    assert git.has_changes() is False
+
+    (vault / "new.md").write_text("note\n", encoding="utf-8")
+    assert git.has_changes() is True
+
+
+def test_lock_is_acquired_soon_after_release(tmp_path: Path) -> None:
+    import fcntl
+    import threading
+    import time
+
+    _, vault = _init_repo(tmp_path)
+    git = VaultGit(vault)
+    git.lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    released_at: list[float] = []
+
+    def release(fd: int) -> None:
+        released_at.append(time.monotonic())
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+    with git.lock_path.open("a+") as holder:
+        fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+        releaser = threading.Timer(0.3, release, args=(holder.fileno(),))
+        releaser.start()
+        started = time.monotonic()
+        with git._acquire_lock():
+            acquired_at = time.monotonic()
+        releaser.join()
+
+    # Only blocked until the release, with generous slack for slow CI machines
+    assert released_at and acquired_at >= released_at[0]
+    assert acquired_at - started < 0.3 + 1.0
+
+    git.lock_timeout_seconds = 0.1
+    with git.lock_path.open("a+") as holder:
+        fcntl.flock(holder.fileno(), fcntl.LOCK_EX)
+        with pytest.raises(TimeoutError), git._acquire_lock():
+            pass
+
+
+async def test_bot_shutdown_hook_flushes_queued_commit(tmp_path: Path) -> None:
+    from d_brain.bot.main import create_git_flush_hook
+    from d_brain.config import Settings
+    from d_brain.services.git import get_vault_git
+
+    repo, vault = _init_repo(tmp_path)
+    settings = Settings(
+        telegram_bot_token="token", deepgram_api_key="key", vault_path=vault
+    )
+    git = get_vault_git(vault)
+    git.push = lambda: True  # no remote in the test repository
+    try:
+        (vault / "daily.md").write_text("queued\n", encoding="utf-8")
+        git.request_commit_and_push("chore: queued at shutdown", delay=60)
+
+        await create_git_flush_hook(settings)()
+    finally:
+        get_vault_git.cache_clear()
+
+    assert (
+        _git(repo, "log", "-1", "--format=%s").stdout.strip()
+        == "chore: queued at shutdown"
+    )
+    assert _git(repo, "status", "--porcelain").stdout == ""